@@ -1,17 +1,17 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+from apps.charts import Chart, backend_selector, show_cached
+from models.fiscal import FiscalParams, debt_paths, output_after_shock
 
 
 def app():
     st.subheader("Fiscal Sandbox: Multipliers & Debt Dynamics")
     st.caption("When does stimulus help, and what happens to debt?")
+    backend_selector()
 
     mult = st.slider("Fiscal multiplier", 0.0, 3.0, 1.2, 0.1)
     shock_g = st.slider("ΔG (as % of Y)", -5.0, 5.0, 2.0, 0.1)
 
-    Y0 = 100.0
-    Y1 = Y0 * (1 + (mult * shock_g) / 100)
+    Y1 = output_after_shock(mult, shock_g)
     st.metric("Output after shock (index)", f"{Y1:.2f}")
 
     st.subheader("Debt dynamics (stylized)")
@@ -21,15 +21,12 @@ def app():
     primary = st.slider("Primary balance (% of GDP; +surplus / -deficit)", -10.0, 10.0, -3.0, 0.5)
     T = st.slider("Years", 1, 50, 20)
 
-    D = np.zeros(T)
-    D[0] = d0
-    for t in range(1, T):
-        D[t] = ((1 + i / 100) / (1 + g / 100)) * D[t - 1] - primary
+    params = FiscalParams(d0=d0, i=i, g=g, primary=primary)
 
-    fig, ax = plt.subplots(figsize=(6, 3))
-    ax.plot(D)
-    ax.set_xlabel("Years")
-    ax.set_ylabel("Debt/GDP (%)")
-    st.pyplot(fig)
+    def debt_chart():
+        D = debt_paths(T, params)[0]
+        return Chart(xlabel="Years", ylabel="Debt/GDP (%)", size=(6, 3)).line(D)
+
+    show_cached("fiscal/debt", (params, T), debt_chart)
 
     st.caption("Basic arithmetic of debt dynamics. Explore r−g gap and primary balances.")
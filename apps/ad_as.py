@@ -1,7 +1,6 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-from models.ad_as import ADASParams, ad_curve, sras_curve, lras_value
+from models.ad_as import ADASParams, ad_curve, sras_curve, lras_value, equilibrium, adjustment_path, price_grid
+from apps.charts import Chart, backend_selector, show_cached
 
 
 def app():
@@ -9,6 +8,7 @@ def app():
     st.caption("Demand and supply shocks with expectations")
 
     col = st.sidebar
+    backend_selector()
     col.markdown("### AD Settings")
     a = col.slider("AD intercept (a)", 50.0, 200.0, 120.0)
     b = col.slider("AD slope (b)", 0.2, 2.0, 1.0, 0.05)
@@ -17,29 +17,53 @@ def app():
     sras_slope = col.slider("SRAS slope", 0.1, 2.0, 0.5, 0.05)
     pe = col.slider("Expected price level (Pe)", 50.0, 150.0, 100.0)
 
-    P = np.linspace(50, 150, 400)
     params = ADASParams(a=a, b=b, y_star=y_star, sras_slope=sras_slope, p_expected=pe)
-    Y_ad = ad_curve(P, params)
-    Y_sras = sras_curve(P, params)
     Y_lras = lras_value(params)
+    P_eq, Y_eq = equilibrium(params)
 
-    # Intersection (approx)
-    idx = np.argmin(np.abs(Y_ad - Y_sras))
-    P_eq, Y_eq = P[idx], Y_ad[idx]
-
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(Y_ad, P, label="AD")
-    ax.plot(Y_sras, P, label="SRAS")
-    ax.axhline(P_eq, ls=":", lw=1)
-    ax.axvline(Y_eq, ls=":", lw=1)
-    ax.axvline(Y_lras, color="gray", lw=1, label="LRAS")
-    ax.scatter([Y_eq], [P_eq])
-    ax.set_xlabel("Output (Y)")
-    ax.set_ylabel("Price level (P)")
-    ax.legend()
-    st.pyplot(fig)
+    def curves_chart():
+        P = price_grid(params)
+        chart = Chart(xlabel="Output (Y)", ylabel="Price level (P)", size=(6, 4))
+        chart.line(ad_curve(P, params), P, "AD")
+        chart.line(sras_curve(P, params), P, "SRAS")
+        chart.hline(P_eq, color=None)
+        chart.vline(Y_eq, color=None)
+        chart.vline(Y_lras, "LRAS", ls="-")
+        chart.scatter(Y_eq, P_eq)
+        return chart
+
+    show_cached("ad_as/curves", params, curves_chart)
 
     st.metric("Equilibrium Y", f"{Y_eq:.1f}")
     st.metric("Equilibrium P", f"{P_eq:.1f}")
 
     st.caption("Shift AD via a,b (demand); SRAS via Pe and slope; LRAS via y*.")
+
+    st.subheader("Adjustment back to potential")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        da = st.slider("AD shock (Δa)", -40.0, 40.0, -20.0, 1.0)
+        du = st.slider("Cost-push shock (SRAS ↑ by Δ, one-time)", -20.0, 20.0, 10.0, 1.0)
+    with c2:
+        rule = st.radio("Expectations", ["Adaptive", "Rational"], horizontal=True)
+        lam = st.slider("Adjustment speed (λ)", 0.05, 1.0, 0.4, 0.05, disabled=rule != "Adaptive")
+    with c3:
+        rho = st.slider("AD shock persistence (ρ)", 0.0, 1.0, 1.0, 0.05)
+        T = st.slider("Periods", 5, 60, 25)
+
+    def path_charts():
+        # Three scenarios in one call: demand only, supply only, both
+        path = adjustment_path(params, T, da=[da, 0.0, da], du=[0.0, du, du],
+                               rho=rho, expectations=rule.lower(), lam=lam)
+        chartY = Chart("Output Y (→ y*)", "t", size=(5, 3.4)).hline(Y_lras)
+        chartP = Chart("Price level P", "t", size=(5, 3.4))
+        for j, name in enumerate(["AD shock", "SRAS shock", "Both"]):
+            chartY.line(path.Y[j], label=name)
+            chartP.line(path.P[j], label=name)
+        return [chartY, chartP]
+
+    lam_key = lam if rule == "Adaptive" else None
+    show_cached("ad_as/paths", (params, da, du, rule, lam_key, rho, T), path_charts,
+                containers=st.columns(2))
+    st.caption("Adaptive: Pe moves a fraction λ toward the realized P each period, so SRAS drifts until Y = y*. "
+               "Rational: only the surprise period deviates; afterwards Pe equals the anticipated price.")
@@ -1,15 +1,95 @@
-# pages/_coming_soon.py
+import numpy as np
 import streamlit as st
+import plotly.graph_objects as go
+from apps.common import apply_grid
+from models.ppc import BoxParams, contract_curve, outputs
 
-def app(page_title="Coming Soon"):
-    st.title(page_title)
-    st.markdown("---")
+LAYOUT = dict(height=460, margin=dict(l=40, r=20, t=20, b=40))
 
-    st.markdown("""
-    ## 🚧 Coming Soon 🚧  
-    This interactive model is not available yet.  
+def isoquant(A, a, b, level, L, K, n=200):
+    """Capital needed with each amount of labor to make `level` of output: A·l^a·k^b = level."""
+    l = np.linspace(L / n, L, n)
+    k = (level / (A * l ** a)) ** (1.0 / b)
+    return l, np.where(k <= K, k, np.nan)
 
-    Please check back later as we continue to build out this section.  
-    """)
+def app():
+    st.subheader("Interdependent Factors — The PPC from Labor and Capital")
 
-    st.info("Tip: Use the sidebar to explore completed models.")
\ No newline at end of file
+    with st.sidebar.expander("Endowments", True):
+        L = st.number_input("Labor (L)", 10.0, 1_000.0, 100.0, 5.0, key="af_L")
+        K = st.number_input("Capital (K)", 10.0, 1_000.0, 100.0, 5.0, key="af_K")
+
+    with st.sidebar.expander("Technology", False):
+        st.caption("X = Aₓ·Lₓ^aₓ·Kₓ^bₓ  and  Y = Aᵧ·Lᵧ^aᵧ·Kᵧ^bᵧ")
+        ax = st.slider("X: labor exponent aₓ", 0.05, 0.95, 0.7, 0.05, key="af_ax")
+        bx = st.slider("X: capital exponent bₓ", 0.05, 0.95, 0.3, 0.05, key="af_bx")
+        ay = st.slider("Y: labor exponent aᵧ", 0.05, 0.95, 0.3, 0.05, key="af_ay")
+        by = st.slider("Y: capital exponent bᵧ", 0.05, 0.95, 0.7, 0.05, key="af_by")
+        Ax = st.slider("X: productivity Aₓ", 0.5, 3.0, 1.0, 0.1, key="af_Ax")
+        Ay = st.slider("Y: productivity Aᵧ", 0.5, 3.0, 1.0, 0.1, key="af_Ay")
+
+    p = BoxParams(L=L, K=K, ax=ax, bx=bx, ay=ay, by=by, Ax=Ax, Ay=Ay)
+    cc = contract_curve(p)     # cached per parameter set
+
+    # ---- Allocation ----
+    st.markdown("### Allocation of Factors")
+    col1, col2 = st.columns(2)
+    with col1:
+        lx_pct = st.slider("Labor in X (%)", 0, 100, 40, 1, key="af_lx")
+        efficient = st.toggle("Keep the allocation efficient (on the contract curve)", True, key="af_eff")
+    Lx = L * lx_pct / 100
+    Kx_eff = float(np.interp(Lx, cc.Lx, cc.Kx))
+    with col2:
+        if efficient:
+            Kx = Kx_eff
+            st.caption(f"Capital in X follows the contract curve: {Kx:.1f} of {K:.0f}.")
+        else:
+            Kx = K * st.slider("Capital in X (%)", 0, 100, 50, 1, key="af_kx") / 100
+    X0, Y0 = (float(v) for v in outputs(p, Lx, Kx))
+
+    left, right = st.columns(2)
+    with left:
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=cc.Lx, y=cc.Kx, mode="lines", name="Contract curve"))
+        if X0 > 0:
+            l, k = isoquant(Ax, ax, bx, X0, L, K)
+            fig.add_trace(go.Scatter(x=l, y=k, mode="lines", name=f"X = {X0:.1f}", line=dict(dash="dot")))
+        if Y0 > 0:
+            l, k = isoquant(Ay, ay, by, Y0, L, K)
+            fig.add_trace(go.Scatter(x=L - l, y=K - k, mode="lines", name=f"Y = {Y0:.1f}", line=dict(dash="dot")))
+        fig.add_trace(go.Scatter(x=[Lx], y=[Kx], mode="markers", name="Allocation", marker=dict(size=10)))
+        fig.update_layout(
+            xaxis_title="Labor in X →  (← labor in Y)", yaxis_title="Capital in X →  (← capital in Y)",
+            xaxis=dict(range=[0, L], zeroline=False), yaxis=dict(range=[0, K], zeroline=False), **LAYOUT
+        )
+        apply_grid(fig)
+        st.plotly_chart(fig, width="stretch", key="af_box")
+
+    with right:
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=cc.X, y=cc.Y, mode="lines", name="PPC (derived)"))
+        fig.add_trace(go.Scatter(x=[X0], y=[Y0], mode="markers", name="Output", marker=dict(size=10)))
+        fig.update_layout(
+            xaxis_title="Good X", yaxis_title="Good Y",
+            xaxis=dict(range=[0, cc.X[-1] * 1.05], zeroline=False),
+            yaxis=dict(range=[0, cc.Y[0] * 1.05], zeroline=False), **LAYOUT
+        )
+        apply_grid(fig)
+        st.plotly_chart(fig, width="stretch", key="af_ppc")
+
+    Y_best = float(np.interp(X0, cc.X, cc.Y))
+    if efficient or Y_best - Y0 < 1e-6 * max(Y_best, 1.0):
+        oc = float(np.interp(Lx, cc.Lx, cc.oc)) if 0 < Lx < L else (0.0 if Lx == 0 else np.inf)
+        oc_text = f"{oc:.3f} Y" if np.isfinite(oc) else "unbounded"
+        st.markdown(f"**On the frontier:** X = {X0:.2f}, Y = {Y0:.2f}. Opportunity cost of 1 more X = {oc_text}.")
+    else:
+        st.markdown(f"**Inside the frontier:** X = {X0:.2f}, Y = {Y0:.2f}. Moving onto the contract "
+                    f"curve could make the same X with Y = {Y_best:.2f} (+{Y_best - Y0:.2f}).")
+    st.caption("When both goods use factors in the same proportions (aₓ/bₓ = aᵧ/bᵧ) with constant returns, "
+               "the contract curve is the diagonal and the PPC is a straight line; different factor "
+               "intensities bow it out.")
+
+    show_adv = st.toggle("Advanced (show equations)", key="af_adv")
+    if show_adv:
+        st.latex(r" \text{MRTS}_X = \frac{a_x}{b_x}\frac{K_x}{L_x} \;=\; \frac{a_y}{b_y}\frac{K - K_x}{L - L_x} = \text{MRTS}_Y ")
+        st.latex(r" \text{OC}_X = -\frac{dY}{dX} = \frac{MPL_Y}{MPL_X} = \frac{a_y\,Y/(L-L_x)}{a_x\,X/L_x} ")
@@ -2,6 +2,10 @@ import copy
 import streamlit as st
 import plotly.graph_objects as go
 from apps.common import apply_grid
+from models.utility import Preferences, decompose, demand, indifference_curve, indifference_map, utility
+
+PREFERENCES = {"Cobb–Douglas": "cobb_douglas", "CES": "ces", "Perfect substitutes": "substitutes",
+               "Perfect complements (Leontief)": "leontief"}
 
 # ---------- helpers ----------
 def intercepts(M, px, py):
@@ -70,6 +74,16 @@ def app():
         xmax = st.number_input("Max X-axis", min_value=10.0, value=40.0, step=5.0, format="%.0f")
         ymax = st.number_input("Max Y-axis", min_value=10.0, value=40.0, step=5.0, format="%.0f")
 
+    # ---- Sidebar: 4) Preferences ----
+    with st.sidebar.expander("4) Preferences & Choice", expanded=False):
+        show_choice = st.checkbox("Show utility-maximizing choice", value=False, key="bl_show_choice")
+        pref_label = st.selectbox("Preferences", list(PREFERENCES), index=0, key="bl_pref_kind")
+        alpha = st.slider("Weight on X (α)", 0.05, 0.95, 0.5, 0.05, key="bl_alpha")
+        rho = 0.5
+        if PREFERENCES[pref_label] == "ces":
+            rho = st.slider("Substitution parameter ρ (σ = 1/(1−ρ))", -3.0, 0.9, 0.5, 0.1, key="bl_rho")
+        show_map = st.checkbox("Show indifference map", value=False, key="bl_show_map")
+
     # ---- Session state bootstrapping ----
     if "bl_current" not in st.session_state:
         st.session_state.bl_current = {"M": base_M, "px": base_px, "py": base_py}
@@ -137,6 +151,50 @@ def app():
     x_max_auto = max(xmax, cur_xi, bl_xi or 0)
     y_max_auto = max(ymax, cur_yi, bl_yi or 0)
 
+    # ---- Utility maximization ----
+    dec = None
+    if show_choice:
+        kind = PREFERENCES[pref_label]
+        if kind == "ces" and abs(rho) < 1e-9:
+            kind = "cobb_douglas"   # the ρ → 0 limit of CES
+        pref = Preferences(kind=kind, alpha=alpha, rho=rho)
+        x_opt, y_opt = (float(v) for v in demand(pref, cur["M"], cur["px"], cur["py"]))
+        u_opt = float(utility(pref, x_opt, y_opt))
+
+        if show_map and u_opt > 0:
+            # One cached grid per preference spec on the unit square, scaled to this view
+            imap = indifference_map(pref)
+            s = max(x_max_auto, y_max_auto)
+            fig.add_trace(go.Contour(
+                x=s * imap.grid, y=s * imap.grid, z=imap.U, showscale=False, hoverinfo="skip",
+                contours=dict(coloring="lines", start=0.25 * u_opt / s, end=2.0 * u_opt / s, size=0.25 * u_opt / s),
+                line=dict(width=1), colorscale=[[0, "lightgray"], [1, "lightgray"]], name="Indifference map",
+            ))
+
+        if st.session_state.bl_baseline is not None:
+            bl = st.session_state.bl_baseline
+            dec = decompose(pref, bl, cur)
+            u_old = float(utility(pref, *dec.start))
+            xs, ys = indifference_curve(pref, u_old, x_max_auto)
+            fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", name="Indifference (before)",
+                                     line=dict(width=1, dash="dot"), hoverinfo="skip"))
+            comp_xi, comp_yi = intercepts(dec.M_hicks, cur["px"], cur["py"])
+            fig.add_trace(go.Scatter(x=[0, comp_xi], y=[comp_yi, 0], mode="lines", name="Compensated (Hicks)",
+                                     line=dict(width=1, dash="dashdot")))
+            fig.add_trace(go.Scatter(
+                x=[dec.start[0], dec.hicks[0]], y=[dec.start[1], dec.hicks[1]], mode="markers+text",
+                text=["A (before)", "B (substitution)"], textposition="top right", name="Decomposition",
+                hovertemplate="x: %{x:.2f}<br>y: %{y:.2f}<extra></extra>",
+            ))
+
+        xs, ys = indifference_curve(pref, u_opt, x_max_auto)
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", name="Indifference curve",
+                                 line=dict(width=2, dash="dot"), hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=[x_opt], y=[y_opt], mode="markers+text",
+                                 text=["C (choice)" if dec is not None else "Optimum"], textposition="top right",
+                                 name="Optimal bundle", marker=dict(size=10),
+                                 hovertemplate="x: %{x:.2f}<br>y: %{y:.2f}<extra>Optimum</extra>"))
+
     fig.update_xaxes(range=[0, x_max_auto], title="Good X (units)")
     fig.update_yaxes(range=[0, y_max_auto], title="Good Y (units)")
     fig.update_layout(
@@ -166,6 +224,21 @@ Slope → dy/dx = {bl_slope:.3f}
 """
             )
         st.latex(r"\text{Budget line: } M = p_x x + p_y y \quad \Rightarrow \quad y = \frac{M}{p_y} - \frac{p_x}{p_y} x")
+        if show_choice:
+            st.markdown(f"**Optimal bundle** ({pref_label}): x = {x_opt:.2f}, y = {y_opt:.2f}, U = {u_opt:.2f}")
+        if dec is not None:
+            # Round to the shown precision first so tiny negatives print as 0.00, not -0.00
+            sub, inc = ([round(float(v), 2) + 0.0 for v in e] for e in (dec.substitution, dec.income))
+            st.markdown(
+                f"""
+**Decomposition (Hicks)** — A → B holds utility at its old level at the new prices
+(income {dec.M_hicks:.2f}); B → C is the income effect.  
+Substitution effect → Δx = {sub[0]:+.2f},  Δy = {sub[1]:+.2f}  
+Income effect → Δx = {inc[0]:+.2f},  Δy = {inc[1]:+.2f}  
+Slutsky compensation (old bundle still affordable): income {dec.M_slutsky:.2f},
+bundle x = {dec.slutsky[0]:.2f}, y = {dec.slutsky[1]:.2f}
+"""
+            )
 
 if __name__ == "__main__":
     app()
@@ -0,0 +1,270 @@
+# apps/charts.py — backend-neutral line charts for the macro pages
+#
+# Pages describe a chart once (lines, reference lines, points, bars, text) and
+# `show` draws it with the backend picked in the sidebar:
+#   matplotlib: an object-oriented Figure on an Agg canvas (no pyplot global
+#               state), rendered to PNG and released before returning;
+#   plotly:     an interactive figure, for sessions that opt in.
+# Output is charged against a per-session ceiling; once a page's charts would
+# exceed it, further PNGs are drawn at a lower resolution. `show_cached` also
+# shares rendered payloads across sessions (see apps.render_cache).
+import json
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import numpy as np
+import streamlit as st
+
+from apps.lazy import lazy_import
+from apps.render_cache import RENDER_CACHE, code_version
+from apps.sampling import use_webgl
+from models.params import canonical
+
+mfigure = lazy_import("matplotlib.figure")
+magg = lazy_import("matplotlib.backends.backend_agg")
+go = lazy_import("plotly.graph_objects")
+
+BACKENDS = {"Static (matplotlib)": "matplotlib", "Interactive (Plotly)": "plotly"}
+DEFAULT_BACKEND = "matplotlib"
+
+DPI = 200                        # same sharpness st.pyplot uses
+MIN_DPI = 60
+SESSION_CEILING = 4 * 2**20      # bytes of chart images held per session
+PX_PER_INCH = 100                # Plotly height for a given figure size
+
+_DASH = {"-": "solid", "--": "dash", ":": "dot", "-.": "dashdot"}
+
+
+@dataclass
+class Chart:
+    title: str = ""
+    xlabel: str = ""
+    ylabel: str = ""
+    size: tuple = (6, 3.6)       # inches, matplotlib convention
+    layers: list = field(default_factory=list)
+    render: str = "auto"         # plotly traces: "auto" (WebGL above WEBGL_THRESHOLD), "svg" or "webgl"
+
+    def line(self, x, y=None, label=None, *, color=None, lw=None, ls="-", alpha=None):
+        if y is None:
+            x, y = np.arange(len(x)), x
+        self.layers.append(("line", np.asarray(x), np.asarray(y),
+                            dict(label=label, color=color, lw=lw, ls=ls, alpha=alpha)))
+        return self
+
+    def scatter(self, x, y, label=None, *, color=None):
+        self.layers.append(("scatter", np.atleast_1d(x), np.atleast_1d(y), dict(label=label, color=color)))
+        return self
+
+    def bar(self, x, y, label=None):
+        self.layers.append(("bar", list(x), np.asarray(y), dict(label=label)))
+        return self
+
+    def hline(self, y, label=None, *, color="gray", lw=1, ls=":"):
+        self.layers.append(("hline", None, float(y), dict(label=label, color=color, lw=lw, ls=ls)))
+        return self
+
+    def vline(self, x, label=None, *, color="gray", lw=1, ls=":"):
+        self.layers.append(("vline", float(x), None, dict(label=label, color=color, lw=lw, ls=ls)))
+        return self
+
+    def text(self, x, y, s, *, axes=False, va="bottom"):
+        """Label at data coordinates, or at axes fractions (0–1) with axes=True."""
+        self.layers.append(("text", float(x), float(y), dict(s=s, axes=axes, va=va)))
+        return self
+
+    @property
+    def n_points(self):
+        return sum(np.size(x) for kind, x, *_ in self.layers if kind in ("line", "scatter"))
+
+    @property
+    def has_legend(self):
+        return any(style.get("label") for *_, style in self.layers)
+
+
+# ---------- matplotlib backend ----------
+
+def to_matplotlib(chart: Chart):
+    """Draw the chart on a new object-oriented Figure (not registered with pyplot)."""
+    fig = mfigure.Figure(figsize=chart.size)
+    magg.FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    for kind, x, y, style in chart.layers:
+        if kind == "line":
+            ax.plot(x, y, label=style["label"], color=style["color"], lw=style["lw"],
+                    ls=style["ls"], alpha=style["alpha"])
+        elif kind == "scatter":
+            ax.scatter(x, y, label=style["label"], color=style["color"], zorder=3)
+        elif kind == "bar":
+            ax.bar(x, y, label=style["label"])
+        elif kind == "hline":
+            ax.axhline(y, label=style["label"], color=style["color"], lw=style["lw"], ls=style["ls"])
+        elif kind == "vline":
+            ax.axvline(x, label=style["label"], color=style["color"], lw=style["lw"], ls=style["ls"])
+        elif kind == "text":
+            kw = {"transform": ax.transAxes} if style["axes"] else {}
+            ax.text(x, y, style["s"], va=style["va"], **kw)
+    ax.set_title(chart.title)
+    ax.set_xlabel(chart.xlabel)
+    ax.set_ylabel(chart.ylabel)
+    if chart.has_legend:
+        ax.legend()
+    return fig
+
+
+def render_png(chart: Chart, dpi=DPI) -> bytes:
+    """PNG bytes of the chart; the Figure is cleared and dropped before returning."""
+    fig = to_matplotlib(chart)
+    try:
+        buf = BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+        return buf.getvalue()
+    finally:
+        fig.clear()
+
+
+# ---------- plotly backend ----------
+
+def to_plotly(chart: Chart):
+    fig = go.Figure()
+    # One mode for the whole chart, from its total point count (a fan of many short paths counts too)
+    Scatter = go.Scattergl if use_webgl(chart.n_points, chart.render) else go.Scatter
+    for kind, x, y, style in chart.layers:
+        label = style.get("label")
+        common = dict(name=label, showlegend=bool(label))
+        if kind == "line":
+            fig.add_trace(Scatter(
+                x=x, y=y, mode="lines", opacity=style["alpha"],
+                line=dict(color=style["color"], width=style["lw"] and style["lw"] * 1.5,
+                          dash=_DASH.get(style["ls"], "solid")), **common))
+        elif kind == "scatter":
+            fig.add_trace(Scatter(x=x, y=y, mode="markers", marker=dict(color=style["color"], size=9), **common))
+        elif kind == "bar":
+            fig.add_trace(go.Bar(x=x, y=y, **common))
+        elif kind in ("hline", "vline"):
+            line = dict(color=style["color"], width=style["lw"], dash=_DASH.get(style["ls"], "solid"))
+            if kind == "hline":
+                fig.add_hline(y=y, line=line)
+            else:
+                fig.add_vline(x=x, line=line)
+            if label:   # shapes have no legend entry; add an empty trace for it
+                fig.add_trace(go.Scatter(x=[None], y=[None], mode="lines", line=line, **common))
+        elif kind == "text":
+            ref = dict(xref="x domain", yref="y domain") if style["axes"] else {}
+            fig.add_annotation(x=x, y=y, text=style["s"], showarrow=False,
+                               yanchor={"bottom": "bottom", "top": "top"}.get(style["va"], "middle"), **ref)
+    fig.update_layout(
+        title=chart.title or None,
+        xaxis_title=chart.xlabel, yaxis_title=chart.ylabel,
+        height=int(chart.size[1] * PX_PER_INCH) + 80,
+        margin=dict(l=10, r=10, t=40 if chart.title else 10, b=10),
+        showlegend=chart.has_legend,
+    )
+    return fig
+
+
+# ---------- session plumbing ----------
+
+def backend_selector():
+    """Sidebar switch between the static and interactive backends (persists across pages)."""
+    labels = list(BACKENDS)
+    current = st.session_state.get("chart_backend", DEFAULT_BACKEND)
+    choice = st.sidebar.radio("Chart style", labels, index=list(BACKENDS.values()).index(current),
+                              key="_chart_backend_choice")
+    st.session_state["chart_backend"] = BACKENDS[choice]
+
+
+def current_backend():
+    return st.session_state.get("chart_backend", DEFAULT_BACKEND)
+
+
+def _charge(key, nbytes):
+    """
+    Record the image size for `key` ("page/chart") and return the bytes already
+    held by the page's other charts. Entries for other pages are dropped: their
+    images were released when the page changed.
+    """
+    page = key.split("/", 1)[0]
+    held = st.session_state.setdefault("_chart_bytes", {})
+    for k in [k for k in held if k.split("/", 1)[0] != page]:
+        del held[k]
+    held[key] = nbytes
+    return sum(v for k, v in held.items() if k != key)
+
+
+def _render(chart: Chart, backend, dpi=DPI):
+    """Display payload for one chart: PNG bytes or Plotly JSON."""
+    if backend == "plotly":
+        return to_plotly(chart).to_json()
+    return render_png(chart, dpi)
+
+
+def _emit(payload, key, backend):
+    if backend == "plotly":
+        # Cached JSON is already valid; skip plotly's per-property validation
+        fig = go.Figure(json.loads(payload), _validate=False)
+        st.plotly_chart(fig, width="stretch", key=key)
+    else:
+        st.image(payload, width="stretch")
+
+
+def _fit_ceiling(key, payloads, backend, charts):
+    """
+    Charge the payloads to the session and return what to display: the payloads
+    themselves, PNGs re-rendered at a lower dpi, or None when nothing fits.
+    """
+    nbytes = sum(len(p) for p in payloads)
+    held = _charge(key, 0)
+    if held + nbytes <= SESSION_CEILING:
+        _charge(key, nbytes)
+        return payloads
+    if backend != "matplotlib":
+        return None
+    # PNG size scales roughly with dpi²; shrink to what is left, once
+    dpi = int(DPI * (max(SESSION_CEILING - held, 0) / nbytes) ** 0.5)
+    if dpi < MIN_DPI:
+        return None
+    payloads = [render_png(c, dpi) for c in charts()]
+    _charge(key, sum(len(p) for p in payloads))
+    return payloads
+
+
+def _as_list(charts):
+    return [charts] if isinstance(charts, Chart) else list(charts)
+
+
+def show_cached(key: str, params, build, containers=None):
+    """
+    Render the chart(s) returned by build() for a view that depends only on
+    `params` (a tuple of scalars and Params objects). Rendered payloads are
+    shared across sessions through RENDER_CACHE, so an identical view skips
+    build() and rendering.
+    build() returns a Chart or a list of them; with `containers`, chart i is
+    drawn inside containers[i].
+    """
+    backend = current_backend()
+    cache_key = (key, canonical(params), backend, code_version())
+    payloads = RENDER_CACHE.get(cache_key)
+    charts = None
+    if payloads is None:
+        charts = _as_list(build())
+        payloads = [_render(c, backend) for c in charts]
+        RENDER_CACHE.put(cache_key, payloads, sum(len(p) for p in payloads))
+
+    payloads = _fit_ceiling(key, payloads, backend, lambda: charts or _as_list(build()))
+    if payloads is None:
+        st.info("Chart skipped: this session's chart memory limit is reached.")
+        return
+    for i, payload in enumerate(payloads):
+        slot = containers[i] if containers else st.container()
+        with slot:
+            _emit(payload, key if len(payloads) == 1 else f"{key}/{i}", backend)
+
+
+def show(chart: Chart, key: str):
+    """Render one chart in the current container with the session's backend (uncached)."""
+    backend = current_backend()
+    payloads = _fit_ceiling(key, [_render(chart, backend)], backend, lambda: [chart])
+    if payloads is None:
+        st.info("Chart skipped: this session's chart memory limit is reached.")
+        return
+    _emit(payloads[0], key, backend)
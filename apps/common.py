@@ -1,7 +1,13 @@
 # apps/common.py
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
+from math import isnan
+import numpy as np
 import plotly.graph_objects as go
 
+from apps.sampling import use_webgl
+
 @dataclass
 class Line:     # P = a + bQ
     a: float
@@ -28,27 +34,287 @@ def intersect(d, s):
     p_star = line_y(d, q_star)
     return float(q_star), float(p_star)
 
-def base_fig(xmax=100, ymax=100, x_title="Quantity (Q)", y_title="Price (P)"):
+# Axis look of the market pages (lighter grid, outside ticks); the grid itself is a toggle
+MARKET_AXIS = dict(gridwidth=1, gridcolor="rgba(0,0,0,0.12)", zeroline=False, ticks="outside", automargin=True)
+
+@lru_cache(maxsize=256)
+def _layout_template(xmax, ymax, x_title, y_title, show_grid, height, uirevision, showlegend):
+    """
+    Validated layout for base_fig, built once per argument tuple and shared by
+    every session in the process. Stored as a plain dict; callers get a copy.
+    """
     fig = go.Figure()
     fig.update_layout(
         margin=dict(l=40, r=20, t=20, b=40),
         xaxis_title=x_title, yaxis_title=y_title,
         xaxis=dict(range=[0, xmax], zeroline=False),
         yaxis=dict(range=[0, ymax], zeroline=False),
-        height=520,
+        height=height,
     )
     apply_grid(fig)
+    if show_grid is not None:
+        fig.update_xaxes(showgrid=show_grid, **MARKET_AXIS)
+        fig.update_yaxes(showgrid=show_grid, **MARKET_AXIS)
+    if uirevision is not None:
+        fig.update_layout(uirevision=uirevision)
+    if showlegend is not None:
+        fig.update_layout(showlegend=showlegend)
+    return fig.layout.to_plotly_json()
+
+def base_fig(xmax=100, ymax=100, x_title="Quantity (Q)", y_title="Price (P)", *,
+             show_grid=None, height=520, uirevision=None, showlegend=None):
+    """
+    Empty figure with the shared axes/grid/margins. show_grid=None keeps the
+    default grid; True/False switches to the market-page axis style with the
+    grid on or off. The layout comes from _layout_template, so a rerun only pays
+    for a dict copy here and then attaches its own traces.
+    """
+    layout = deepcopy(_layout_template(xmax, ymax, x_title, y_title, show_grid, height, uirevision, showlegend))
+    # The template was validated when it was built; skip re-validating the copy,
+    # then switch validation back on for the traces the page adds
+    fig = go.Figure(layout=layout, _validate=False)
+    fig._validate = True
     return fig
 
-def add_line(fig, line: Line, name, q0=0, q1=100, dash=None):
-    fig.add_trace(go.Scatter(
-        x=[q0, q1],
-        y=[line_y(line, q0), line_y(line, q1)],
+def scatter(x, y, *, render="auto", **trace):
+    """
+    go.Scatter, or go.Scattergl when the trace is long enough to need WebGL (see
+    apps.sampling.use_webgl); both take the same styling arguments.
+    """
+    cls = go.Scattergl if use_webgl(np.size(x), render) else go.Scatter
+    return cls(x=x, y=y, **trace)
+
+def add_line(fig, line: Line, name, q0=0, q1=100, dash=None, *, render="auto"):
+    fig.add_trace(scatter(
+        [q0, q1],
+        [line_y(line, q0), line_y(line, q1)],
         mode="lines", name=name,
-        line=dict(dash=dash) if dash else None
+        line=dict(dash=dash) if dash else None,
+        render=render,
     ))
     return fig
 
-def add_point(fig, q, p, label):
-    fig.add_trace(go.Scatter(x=[q], y=[p], mode="markers+text",
-                             text=[label], textposition="top center"))
+def add_point(fig, q, p, label, *, render="auto"):
+    """Labelled marker(s); q, p and label may be sequences to add many points as one trace."""
+    q, p = np.atleast_1d(q), np.atleast_1d(p)
+    fig.add_trace(scatter(q, p, mode="markers+text", text=_per_line(label, q.size),
+                          textposition="top center", render=render))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Line geometry: many lines P = a + bQ at once, as NumPy arrays
+# ──────────────────────────────────────────────────────────────────────────────
+EPS = 1e-12
+
+def clip_lines_to_box(a, b, xmin, xmax, ymin, ymax):
+    """
+    Liang–Barsky clip of the infinite lines P = a + bQ to [xmin,xmax]×[ymin,ymax].
+    a and b broadcast to n lines. Returns arrays (x0, y0, x1, y1), left to right,
+    with nan where a line misses the box or only touches a corner.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    dx = xmax - xmin
+    y_start = a + b * xmin
+    dy = b * dx
+    flat = np.abs(dy) <= EPS
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_a = (ymin - y_start) / dy
+        t_b = (ymax - y_start) / dy
+    t0 = np.where(flat, 0.0, np.maximum(0.0, np.minimum(t_a, t_b)))
+    t1 = np.where(flat, 1.0, np.minimum(1.0, np.maximum(t_a, t_b)))
+    visible = np.where(flat, (y_start >= ymin - EPS) & (y_start <= ymax + EPS), t1 - t0 > EPS)
+    t0 = np.where(visible, t0, np.nan)
+    t1 = np.where(visible, t1, np.nan)
+    return xmin + t0 * dx, y_start + t0 * dy, xmin + t1 * dx, y_start + t1 * dy
+
+def clip_line_to_box(m, b, xmin, xmax, ymin, ymax):
+    """
+    Single-line form of clip_lines_to_box for y = m*x + b.
+    Returns ((x0, y0), (x1, y1)), or None if the line doesn't cross the box.
+    """
+    x0, y0, x1, y1 = (float(v) for v in clip_lines_to_box(b, m, xmin, xmax, ymin, ymax))
+    if isnan(x0):
+        return None
+    return (x0, y0), (x1, y1)
+
+def full_span_segments(a, b, xmin, xmax, ymin, ymax):
+    """Endpoints far outside the box, so lines keep going when students pan/zoom."""
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    span = max(xmax - xmin, ymax - ymin, 10) * 100
+    return np.full(a.shape, -span), a - b * span, np.full(a.shape, span), a + b * span
+
+def intersect_lines(a1, b1, a2, b2):
+    """Vectorized intersect(): (Q*, P*) arrays, nan where the lines are parallel."""
+    a1, b1, a2, b2 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a1, b1, a2, b2)))
+    den = b2 - b1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q = np.where(np.abs(den) < 1e-9, np.nan, (a1 - a2) / den)
+    return q, a1 + b1 * q
+
+def pairwise_intersections(a, b):
+    """(n, n) matrices of Q*, P* for every pair of the lines P = a + bQ (nan on the diagonal)."""
+    a = np.asarray(a, dtype=float).ravel()
+    b = np.asarray(b, dtype=float).ravel()
+    return intersect_lines(a[:, None], b[:, None], a[None, :], b[None, :])
+
+def label_positions(a, b, *, xmax, ymin, ymax, pad=0.96, side="right"):
+    """
+    Where inline labels sit on each line: near the right (or left) edge, with y
+    clamped into the visible frame. pad and side may be per-line arrays.
+    """
+    a, b, pad, right = np.broadcast_arrays(
+        np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+        np.asarray(pad, dtype=float), np.asarray(side) == "right",
+    )
+    x = np.where(right, pad * xmax, (1.0 - pad) * xmax)
+    y = np.clip(a + b * x, ymin + 0.02 * (ymax - ymin), ymax - 0.02 * (ymax - ymin))
+    return x, y, right
+
+def _per_line(value, n):
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return [value] * n
+
+def add_lines(fig, a, b, names, *, xmin, xmax, ymin, ymax, width=3, dash=None, color=None,
+              legendgroup=None, showlegend=None, clip=False, render="auto"):
+    """
+    Add every line P = a + bQ to the figure in one call. Styling arguments are
+    either one value for all lines or a per-line sequence. clip=True trims each
+    line to the box; otherwise it spans far past it (see full_span_segments).
+    render picks SVG or WebGL traces for the whole batch (two points per line).
+    """
+    names = _per_line(names, np.size(a))
+    n = len(names)
+    segs = (clip_lines_to_box if clip else full_span_segments)(
+        np.broadcast_to(np.asarray(a, dtype=float), (n,)), np.broadcast_to(np.asarray(b, dtype=float), (n,)),
+        xmin, xmax, ymin, ymax,
+    )
+    x0, y0, x1, y1 = (v.tolist() for v in segs)
+    gl = use_webgl(2 * n, render)
+    traces = []
+    for i, (w, d, c, g, sl) in enumerate(zip(_per_line(width, n), _per_line(dash, n), _per_line(color, n),
+                                            _per_line(legendgroup, n), _per_line(showlegend, n))):
+        if isnan(x0[i]):
+            continue  # clipped away: the line is outside the visible box
+        style = {k: v for k, v in (("width", w), ("dash", d), ("color", c)) if v is not None}
+        extra = {} if sl is None else {"showlegend": sl}
+        traces.append(scatter([x0[i], x1[i]], [y0[i], y1[i]], mode="lines", name=names[i], line=style,
+                              legendgroup=g, render="webgl" if gl else "svg", **extra))
+    fig.add_traces(traces)
+    return fig
+
+def add_full_span_line(fig, alpha, beta, name, xmin, xmax, ymin, ymax, *, width=3, dash=None, color=None,
+                       legendgroup=None, showlegend=None, clip=False, render="auto"):
+    """Plot P = alpha + beta*Q as a long segment that continues when you pan/zoom (or clipped to the box)."""
+    return add_lines(fig, [alpha], [beta], [name], xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax,
+                     width=width, dash=dash, color=color, legendgroup=legendgroup,
+                     showlegend=showlegend, clip=clip, render=render)
+
+def add_inline_labels(fig, a, b, texts, *, xmax, ymin, ymax, pad=0.96, side="right"):
+    """
+    Label lines directly (so the legend can go): positions for all lines come
+    from one label_positions() call and the annotations are attached together.
+    """
+    texts = _per_line(texts, np.size(a))
+    x, y, right = label_positions(np.broadcast_to(a, len(texts)), np.broadcast_to(b, len(texts)),
+                                  xmax=xmax, ymin=ymin, ymax=ymax, pad=pad, side=side)
+    fig.layout.annotations = tuple(fig.layout.annotations) + tuple(
+        dict(x=float(xi), y=float(yi), text=t, showarrow=False,
+             xanchor="left" if r else "right", yanchor="middle",
+             bgcolor="rgba(255,255,255,0.7)", bordercolor="rgba(0,0,0,0.15)",
+             borderwidth=1, font=dict(size=11))
+        for xi, yi, r, t in zip(x, y, np.broadcast_to(right, len(texts)), texts)
+    )
+    return fig
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Downsampling: at most MAX_POINTS points per trace, whatever the data size
+# ──────────────────────────────────────────────────────────────────────────────
+MAX_POINTS = 2000
+
+def _finite_sorted(x, y):
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    keep = np.isfinite(x) & np.isfinite(y)
+    x, y = x[keep], y[keep]
+    if x.size > 1 and np.any(np.diff(x) < 0):
+        order = np.argsort(x, kind="stable")
+        x, y = x[order], y[order]
+    return x, y
+
+def lttb(x, y, n_out):
+    """
+    Largest-triangle-three-buckets: keeps the first and last point and, from
+    each of n_out - 2 equal-count buckets, the point spanning the largest
+    triangle with the previously kept point and the next bucket's mean.
+    Returns the indices kept, in order. x must be sorted.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)          # n_out - 2 buckets over 1..n-2
+    counts = np.diff(edges)
+    mx = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    my = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    mx = np.append(mx[1:], x[-1])                                   # "next bucket" mean for each bucket
+    my = np.append(my[1:], y[-1])
+    kept = np.empty(n_out, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - mx[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (my[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+def minmax_decimate(x, y, n_out):
+    """
+    Keep the lowest and highest y of each of n_out // 2 equal-count buckets (plus
+    the end points): cheap and exact for envelopes and noisy series. Returns
+    sorted indices.
+    """
+    n = len(y)
+    buckets = max(n_out // 2 - 1, 1)
+    if n_out >= n or n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    buckets = -(-n // size)          # so only the last bucket is padded, never emptied
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    rows = padded.reshape(buckets, size)
+    offset = np.arange(buckets) * size
+    lo = offset + np.nanargmin(rows, axis=1)
+    hi = offset + np.nanargmax(rows, axis=1)
+    return np.unique(np.concatenate(([0, n - 1], lo, hi)))
+
+DOWNSAMPLERS = {"lttb": lttb, "minmax": minmax_decimate}
+
+def downsample(x, y, max_points=MAX_POINTS, *, x_range=None, method="lttb"):
+    """
+    (x, y) with at most max_points points, sorted by x, non-finite points dropped.
+    With x_range=(lo, hi) only that window (plus one neighbour each side, so the
+    trace runs off the edge) is sampled: a zoomed view gets the whole point
+    budget and full resolution once the window holds fewer than max_points.
+    """
+    x, y = _finite_sorted(x, y)
+    if x_range is not None:
+        i0 = max(int(np.searchsorted(x, x_range[0], side="left")) - 1, 0)
+        i1 = min(int(np.searchsorted(x, x_range[1], side="right")) + 1, x.size)
+        x, y = x[i0:i1], y[i0:i1]
+    if x.size <= max_points:
+        return x, y
+    keep = DOWNSAMPLERS[method](x, y, max_points)
+    return x[keep], y[keep]
+
+def add_series(fig, x, y, name, *, max_points=MAX_POINTS, x_range=None, method="lttb",
+               mode="lines", render="auto", **trace):
+    """
+    Add a (possibly huge) data series as one trace of at most max_points points,
+    so figure JSON stays the same size however much data there is. Pass the
+    axis window as x_range to resample at full resolution when zoomed in.
+    """
+    xs, ys = downsample(x, y, max_points, x_range=x_range, method=method)
+    fig.add_trace(scatter(xs, ys, mode=mode, name=name, render=render, **trace))
+    return fig
@@ -1,7 +1,13 @@
+import time
+
 import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-from apps.common import apply_grid
+from apps.common import add_series, apply_grid, scatter
+from apps.lazy import lazy_import
+from models import trade
+
+pd = lazy_import("pandas")
 
 def app():
     st.subheader("Comparative Advantage — Linear PPCs for Two Producers")
@@ -27,12 +33,12 @@ def app():
     xsB = np.linspace(0, Bx, 200)
     ysB = ppc_line(Bx, By, xsB)
 
-    # Opportunity costs (constant on linear PPC)
-    OCx_A = Ay / Ax     # Y per X in A
-    OCx_B = By / Bx     # Y per X in B
+    # Opportunity costs (constant on linear PPC): Y per X
+    cap = np.array([[Ax, Ay], [Bx, By]])
+    OCx_A, OCx_B = trade.opportunity_costs(cap, base=1)[:, 0]
 
     # Who has CA in X? (lower OCx)
-    ca_X = "A" if OCx_A < OCx_B else "B"
+    ca_X = "AB"[trade.comparative_advantage(cap)[0]]
     ca_Y = "B" if ca_X == "A" else "A"
 
     # Specialization sliders (0..1 of the CA good)
@@ -82,11 +88,14 @@ def app():
     apply_grid(fig)
     st.plotly_chart(fig, use_container_width=True,key="ca_chart")
 
+    eq = trade.equilibrium(cap)
     st.markdown(
         f"""
 **Opportunity costs (Y per 1 X):** A = {OCx_A:.2f}, B = {OCx_B:.2f}  
 **Comparative advantage:** {('A in X, B in Y' if ca_X=='A' else 'B in X, A in Y')}  
-**Trade-line slope:** \(-P_x/P_y = -{px_over_py:.2f}\)  (a steeper line means X is relatively pricier).
+**Trade-line slope:** \(-P_x/P_y = -{px_over_py:.2f}\)  (a steeper line means X is relatively pricier).  
+**Free-trade price** (both spend half their income on each good): \(P_x/P_y = {1 / eq.prices[1]:.2f}\);
+gains from trade A = {eq.gains[0]:.1%}, B = {eq.gains[1]:.1%}.
         """
     )
 
@@ -94,3 +103,115 @@ def app():
     if show_adv:
         st.latex(r" \text{PPC}_A: \; y = a_y - \frac{a_y}{a_x} x \quad;\quad \text{PPC}_B: \; y = b_y - \frac{b_y}{b_x} x ")
         st.latex(r" \text{OC}_X^A = \frac{a_y}{a_x}, \quad \text{OC}_X^B = \frac{b_y}{b_x} \;\;\Rightarrow\;\; \text{CA in X} = \arg\min \text{OC}_X ")
+
+    _class_game()
+    _continuum()
+
+
+def _game_capacity(n, m, spread, seed):
+    """Random maximum outputs: log-normal around 100 with the given spread."""
+    rng = np.random.default_rng(seed)
+    return 100.0 * np.exp(spread * rng.standard_normal((n, m)))
+
+
+def _class_game():
+    """N producers × M goods: everyone trades at world prices that clear every market."""
+    with st.expander("Class trade game — N producers × M goods", False):
+        source = st.radio("Producers", ["Random class", "Upload CSV"], horizontal=True, key="ca_game_source")
+        if source == "Upload CSV":
+            upload = st.file_uploader("CSV: one row per producer, one column of maximum output per good",
+                                      type="csv", key="ca_game_file")
+            if upload is None:
+                return
+            try:
+                df = pd.read_csv(upload).select_dtypes("number")
+                goods = [str(c) for c in df.columns]
+                cap = df.to_numpy(float)
+                start = time.perf_counter()
+                eq = trade.equilibrium(cap)
+            except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+                st.error(f"Could not use {upload.name}: {e}")
+                return
+        else:
+            c1, c2, c3, c4 = st.columns(4)
+            n = c1.number_input("Producers", 2, 5000, 200, 10, key="ca_game_n")
+            m = c2.number_input("Goods", 2, 12, 2, 1, key="ca_game_m")
+            spread = c3.slider("Productivity spread", 0.05, 1.5, 0.5, 0.05, key="ca_game_spread")
+            seed = c4.number_input("Seed", 0, 10_000, 0, 1, key="ca_game_seed")
+            goods = [chr(ord("X") + j) if m <= 3 else f"Good {j + 1}" for j in range(int(m))]
+            cap = _game_capacity(int(n), int(m), spread, int(seed))
+            start = time.perf_counter()
+            eq = trade.equilibrium(cap)
+        ms = 1e3 * (time.perf_counter() - start)
+
+        made = eq.production.sum(axis=0)
+        specialized = eq.labor.max(axis=1) > 1 - 1e-6
+        st.caption(f"Solved {eq.labor.shape[0]:,} producers × {len(goods)} goods in {ms:.1f} ms.")
+        st.dataframe(pd.DataFrame({
+            "Price (first good = 1)": eq.prices,
+            "World output": made,
+            "Specialized producers": np.bincount(eq.labor.argmax(axis=1)[specialized], minlength=len(goods)),
+        }, index=goods), width="stretch")
+        g = eq.gains
+        st.markdown(f"**Gains from trade** (utility vs. autarky): median {np.median(g):.1%}, "
+                    f"smallest {g.min():.1%}, largest {g.max():.1%}; "
+                    f"{(~specialized).sum()} producer(s) on the margin make more than one good.")
+
+        if len(goods) == 2:
+            x0, x1, _ = trade.world_ppf(cap)
+            fig = go.Figure()
+            fig.add_trace(scatter(x0, x1, mode="lines", name="World PPF"))
+            fig.add_trace(scatter([made[0]], [made[1]], mode="markers", name="Free trade"))
+            aut = eq.autarky.sum(axis=0)
+            fig.add_trace(scatter([aut[0]], [aut[1]], mode="markers", name="Autarky"))
+            fig.update_layout(xaxis_title=f"Good {goods[0]}", yaxis_title=f"Good {goods[1]}",
+                              height=420, margin=dict(l=40, r=20, t=20, b=40))
+            apply_grid(fig)
+            st.plotly_chart(fig, width="stretch", key="ca_game_ppf")
+
+
+def _continuum():
+    """Dornbusch–Fischer–Samuelson: two countries, thousands of goods ranked by relative productivity."""
+    with st.expander("Continuum of goods — Dornbusch–Fischer–Samuelson", False):
+        c1, c2, c3 = st.columns(3)
+        size = c1.slider("Foreign size L*/L", 0.25, 4.0, 1.0, 0.05, key="ca_dfs_size")
+        tech = c2.slider("Home technology (× A)", 0.5, 2.0, 1.0, 0.05, key="ca_dfs_tech")
+        spread = c3.slider("Productivity spread (log A(0) − log A(1))", 0.2, 5.0, 2.0, 0.1, key="ca_dfs_spread")
+        p = trade.DFSParams(size=size, tech=tech, spread=spread)
+        eq = trade.dfs_equilibrium(p)
+        omega, z_bar = eq.omega[0], eq.z_bar[0]
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Relative wage w/w*", f"{omega:.3f}")
+        m2.metric("Goods made at home", f"{z_bar:.1%}")
+        m3.metric("Home gains", f"{np.expm1(eq.gains_home[0]):.1%}")
+        m4.metric("Foreign gains", f"{np.expm1(eq.gains_foreign[0]):.1%}")
+
+        z = (np.arange(trade.GOODS) + 0.5) / trade.GOODS
+        A = tech * trade.relative_productivity(spread)
+        B = trade.demand_schedule(size)
+        ymax = 3 * max(omega, 1.0)
+        fig = go.Figure()
+        add_series(fig, z, A, "A(z): relative productivity")
+        add_series(fig, z, np.minimum(B, 2 * ymax), "B(z): trade balance")
+        fig.add_trace(scatter([z_bar], [omega], mode="markers+text", text=["z̄"], textposition="top right",
+                              name="Equilibrium"))
+        fig.update_layout(xaxis_title="Goods z (ranked by home's comparative advantage)",
+                          yaxis_title="Relative wage ω = w/w*",
+                          xaxis=dict(range=[0, 1]), yaxis=dict(range=[0, ymax]),
+                          height=420, margin=dict(l=40, r=20, t=20, b=40))
+        apply_grid(fig)
+        st.plotly_chart(fig, width="stretch", key="ca_dfs_chart")
+
+        # One batched solve for the whole range of foreign sizes
+        sizes = np.linspace(0.25, 4.0, 301)
+        sweep = trade.dfs_equilibrium(trade.DFSParams(size=sizes, tech=tech, spread=spread))
+        fig = go.Figure()
+        fig.add_trace(scatter(sizes, sweep.omega, mode="lines", name="w/w*"))
+        fig.add_trace(scatter(sizes, sweep.z_bar, mode="lines", name="z̄ (home's share of goods)"))
+        fig.add_trace(scatter([size, size], [omega, z_bar], mode="markers", name="Now", showlegend=False))
+        fig.update_layout(xaxis_title="Foreign size L*/L", height=320, margin=dict(l=40, r=20, t=20, b=40))
+        apply_grid(fig)
+        st.plotly_chart(fig, width="stretch", key="ca_dfs_sweep")
+        st.caption("A larger foreign labor force raises home's relative wage and shrinks the range of goods "
+                   "home makes; better home technology shifts A(z) up and does the opposite to z̄.")
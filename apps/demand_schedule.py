@@ -1,6 +1,6 @@
 import streamlit as st
-import pandas as pd
-from apps.common import Line, base_fig, add_line
+from apps.common import Line, base_fig, add_line, add_series
+from apps.schedule import schedule_fit
 
 def app():
     st.subheader("Build the Demand Curve")
@@ -8,32 +8,21 @@ def app():
     colA, colB = st.columns([1,2])
 
     with colA:
-        st.caption("Enter Data:")
-        df = st.data_editor(
-            pd.DataFrame({"Q":[10,30,50], "P":[28,20,12]}),
-            num_rows="dynamic",
-            use_container_width=True,
-            key="dem_sched",
-        )
+        D, _, note, observed = schedule_fit("dem_sched", {"Q":[10,30,50], "P":[28,20,12]}, Line(a=30.0, b=-0.2))
         st.caption("Adjust Scale:")
         xmax = st.number_input("Max Q", 10, 1000, 100, 10)
         ymax = st.number_input("Max P", 10, 1000, 50, 5)
 
-    # Fit P = a + bQ from the table
-    if len(df) >= 2:
-        Q = df["Q"].astype(float).values
-        P = df["P"].astype(float).values
-        b = ((Q - Q.mean())*(P - P.mean())).sum() / max(((Q - Q.mean())**2).sum(), 1e-9)
-        a = P.mean() - b*Q.mean()
-        D = Line(a=float(a), b=float(b))
-    else:
-        D = Line(a=30.0, b=-0.2)
-
     with colB:
         fig = base_fig(xmax=xmax, ymax=ymax)
+        if observed is not None:
+            # Uploaded data: a bounded number of points, resampled for the visible Q range
+            add_series(fig, *observed, "Observed", mode="markers", method="minmax", x_range=(0, xmax),
+                       marker=dict(size=3, opacity=0.35))
         add_line(fig, D, "Demand (fit)")
         st.plotly_chart(fig, use_container_width=True, key="dem_chart")
         st.caption(f"Estimated: **P = {D.a:.2f} + ({D.b:.3f})Q**  (β should be negative)")
+        st.caption(note)
 
     # --- Send fitted coefficients to Static Equilibrium ---
     if st.button("Send Demand Curve to Market Model", type="primary", use_container_width=True):
@@ -1,21 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 
-from apps.common import Line, base_fig, add_point, intersect, line_y
-
-
-def add_full_span_line(fig, alpha, beta, *, name, xmin, xmax, ymin, ymax, width=3, dash=None, color=None):
-    """Plot P = alpha + beta*Q as a long segment that spans the viewport."""
-    span = max(xmax - xmin, ymax - ymin, 10) * 100
-    x0, x1 = -span, span
-    y0, y1 = beta * x0 + alpha, beta * x1 + alpha
-    fig.add_scatter(
-        x=[x0, x1],
-        y=[y0, y1],
-        mode="lines",
-        name=name,
-        line=dict(width=width, dash=dash, color=color) if dash or color else dict(width=width),
-    )
+from apps.common import Line, base_fig, add_point, intersect, line_y, add_full_span_line
 
 
 def add_wedge(fig, lower_line, upper_line, x0, x1, *, name, color):
@@ -78,8 +64,6 @@ def app():
 
     # Figure
     fig = base_fig(xmax=xmax, ymax=ymax, x_title="Quantity (Q)", y_title="Price (P)")
-    fig.update_xaxes(range=[xmin, xmax])
-    fig.update_yaxes(range=[ymin, ymax])
 
     # Lines
     add_full_span_line(fig, ad, bd, name="Demand (PMB)", xmin=xmin, xmax=xmax, ymin=ymin, ymax=ymax, color="#1f77b4")
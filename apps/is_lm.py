@@ -1,7 +1,6 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-from models.is_lm import ISLMParams, solve_equilibrium, is_curve, lm_curve
+from models.is_lm import ISLMParams, equilibrium, solve_equilibrium
+from apps.charts import Chart, backend_selector, show_cached
 
 
 def app():
@@ -10,6 +9,7 @@ def app():
 
     # Sidebar controls
     with st.sidebar:
+        backend_selector()
         st.markdown("### IS Parameters (Goods Market)")
         c0 = st.slider("Autonomous consumption (c0)", 0.0, 200.0, 50.0)
         c1 = st.slider("MPC (c1)", 0.0, 0.95, 0.60, 0.01)
@@ -25,23 +25,29 @@ def app():
 
     # Build params & solve
     params = ISLMParams(c0=c0, c1=c1, i0=i0, i1=i1, g=g, t=t, m=m, k=k, h=h)
-    r_star, Y_star, (r_grid, Y_is, Y_lm) = solve_equilibrium(params)
+    eq = equilibrium(params)
+    r_star, Y_star = float(eq.r), float(eq.Y)
+
+    def curves_chart():
+        _, _, (r_grid, Y_is, Y_lm) = solve_equilibrium(params)
+        chart = Chart(xlabel="Interest rate (r)", ylabel="Income / Output (Y)", size=(6.5, 4))
+        chart.line(r_grid, Y_is, "IS")
+        chart.line(r_grid, Y_lm, "LM")
+        chart.scatter(r_star, Y_star)
+        return chart
 
     # Plot curves and equilibrium
     col1, col2 = st.columns([2, 1])
     with col1:
-        fig, ax = plt.subplots(figsize=(6.5, 4))
-        ax.plot(r_grid, Y_is, label="IS")
-        ax.plot(r_grid, Y_lm, label="LM")
-        ax.scatter([r_star], [Y_star])
-        ax.set_xlabel("Interest rate (r)")
-        ax.set_ylabel("Income / Output (Y)")
-        ax.legend()
-        st.pyplot(fig)
+        show_cached("is_lm/curves", params, curves_chart)
 
     with col2:
         st.metric("Equilibrium interest rate r*", f"{r_star:.2f}")
         st.metric("Equilibrium output Y*", f"{Y_star:.1f}")
+        st.metric("Fiscal multiplier dY*/dg", f"{float(eq.fiscal_multiplier):.2f}")
+        st.metric("Money multiplier dY*/d(M/P)", f"{float(eq.money_multiplier):.2f}")
+        if r_star < 0:
+            st.caption("r* < 0: the intersection lies below the zero lower bound.")
         st.markdown("**Shock tips**")
         st.caption(
             "- ↑g or ↓t → IS shifts right\n"
@@ -0,0 +1,31 @@
+# apps/lazy.py — deferred imports for the heavy plotting/data libraries
+import importlib
+import sys
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Stand-in module that imports the real one on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def __getattr__(self, attr):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = self.__dict__["_module"] = importlib.import_module(self.__name__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """
+    Module proxy for `name` that defers the import until an attribute is used,
+    e.g. `plt = lazy_import("matplotlib.pyplot")` at the top of a page. If the
+    module is already imported in this process, the real module is returned.
+    """
+    return sys.modules.get(name) or _LazyModule(name)
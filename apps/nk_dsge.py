@@ -1,11 +1,12 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 from models.nk_blocks import NKParams, simulate_nk
+from apps.charts import Chart, backend_selector, show_cached
 
 
 def app():
     st.subheader("New Keynesian DSGE – Classroom IRFs")
     st.caption("Three-equation model with policy rule")
+    backend_selector()
 
     cols = st.columns(5)
     with cols[0]:
@@ -20,6 +21,7 @@ def app():
         phi_y = st.slider("ϕ_y", 0.0, 1.5, 0.5, 0.1)
 
     rstar = st.slider("r* (natural real rate)", -1.0, 2.0, 0.0, 0.1)
+    rho = st.slider("Shock persistence (ρ)", 0.0, 0.95, 0.5, 0.05)
     T = st.slider("Horizon (T)", 10, 80, 40)
     shock_t = st.slider("Shock timing", 0, 10, 1)
     colA, colB, colC = st.columns(3)
@@ -30,20 +32,21 @@ def app():
     with colC:
         eps_policy = st.slider("Policy shock (u^i)", -2.0, 2.0, 0.0, 0.1)
 
-    params = NKParams(sigma=sigma, beta=beta, kappa=kappa, phi_pi=phi_pi, phi_y=phi_y, r_star=rstar)
-    y, pi, i_nom = simulate_nk(T, shock_t, eps_y, eps_pi, eps_policy, params)
+    params = NKParams(sigma=sigma, beta=beta, kappa=kappa, phi_pi=phi_pi, phi_y=phi_y, r_star=rstar, rho=rho)
 
-    def plot_series(series, title, ylabel):
-        fig, ax = plt.subplots(figsize=(5, 2.8))
-        ax.plot(series)
-        ax.axhline(0, lw=1, ls=":", color="gray")
-        ax.set_title(title)
-        ax.set_ylabel(ylabel)
-        ax.set_xlabel("t")
-        st.pyplot(fig)
+    def irf_charts():
+        y, pi, i_nom = simulate_nk(T, shock_t, eps_y, eps_pi, eps_policy, params)
+        return [Chart(title, "t", ylabel, size=(5, 2.8)).line(series).hline(0)
+                for series, title, ylabel in [
+                    (y, "Output gap (y)", "y"),
+                    (pi, "Inflation (π)", "π"),
+                    (i_nom, "Policy rate (i)", "i"),
+                ]]
 
-    plot_series(y, "Output gap (y)", "y")
-    plot_series(pi, "Inflation (π)", "π")
-    plot_series(i_nom, "Policy rate (i)", "i")
+    try:
+        show_cached("nk_dsge/irfs", (params, T, shock_t, eps_y, eps_pi, eps_policy), irf_charts)
+    except ValueError as e:
+        st.error(f"{e}. Raise ϕ_π (Taylor principle) or ϕ_y to get a unique stable equilibrium.")
+        return
 
-    st.caption("Pedagogical, backward-looking form for intuition. Upgrade later with forward-looking solution if desired.")
+    st.caption("Forward-looking rational-expectations solution (Blanchard–Kahn); shocks follow AR(1) with persistence ρ.")
@@ -1,12 +1,13 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 from models.phillips import NKPCParams, nkpc_next
+from apps.charts import Chart, backend_selector, show_cached
 
 
 def app():
     st.subheader("Phillips Curve (NKPC, teaching form)")
     st.caption("Inflation dynamics from output gaps and shocks")
+    backend_selector()
 
     col1, col2 = st.columns(2)
     with col1:
@@ -31,13 +32,8 @@ def app():
     for t in range(1, T):
         pi[t] = nkpc_next(pi[t - 1], y_gap, shocks[t], params)
 
-    fig, ax = plt.subplots(figsize=(6, 3))
-    ax.plot(pi, label="Inflation (π)")
-    ax.axhline(0, color="gray", lw=1, ls=":")
-    ax.set_xlabel("t")
-    ax.set_ylabel("π")
-    ax.legend()
-    st.pyplot(fig)
+    show_cached("phillips_curve/pi", (beta, kappa, T, shock_t, y_gap, u, decay),
+                lambda: Chart(xlabel="t", ylabel="π", size=(6, 3)).line(pi, label="Inflation (π)").hline(0))
 
     st.metric("Inflation (last period)", f"{pi[-1]:.2f}")
     st.caption("Set y~ > 0 to see inflation drift up; shocks add temporary spikes that decay.")
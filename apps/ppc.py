@@ -2,6 +2,7 @@ import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
 from apps.common import apply_grid
+from models.ppc import PPCParams, frontier_y, opportunity_cost, ppc_curves
 
 def app():
     st.subheader("Production Possibilities Curve (PPC)")
@@ -14,35 +15,21 @@ def app():
         shift_pct = st.slider("Tech/Labor shift (%)", -50, 200, 0, 5)
         show_baseline = st.checkbox("Show baseline frontier", value=True)
 
-    a = x_max
-    b = y_max
-    a_shift = a * (1 + shift_pct/100.0)
-    b_shift = b * (1 + shift_pct/100.0)
-
-    # superellipse frontier:  (x/a)^k + (y/b)^k = 1  ->  y(x) = b * (1 - (x/a)^k)^(1/k)
-    def y_on_ppf(x, A, B, K):
-        x = np.clip(x, 0, A)
-        val = np.maximum(0.0, 1.0 - (x/A)**K)
-        return B * (val ** (1.0/K))
-
-    xs = np.linspace(0, a_shift, 400)
-    ys_shift = y_on_ppf(xs, a_shift, b_shift, k)
-    ys_base = y_on_ppf(np.linspace(0, a, 400), a, b, k)
+    p = PPCParams(a=x_max, b=y_max, k=k, shift=float(shift_pct))
+    curves = ppc_curves(p)     # cached per (a, b, k, shift)
+    a, b = x_max, y_max
+    a_shift, b_shift = a * curves.scale, b * curves.scale
+    base, shifted = curves.baseline, curves.shifted
 
     # pick a point on the shifted PPF to read opportunity cost
     qx = st.slider("Choose a production level of X to analyze", 0.0, float(a_shift), float(a_shift*0.4), step=0.5)
-    # numeric derivative for OC at qx (dy/dx)
-    h = max(1e-6, 0.001 * a_shift)
-    y1 = y_on_ppf(qx, a_shift, b_shift, k)
-    y2 = y_on_ppf(min(a_shift, qx + h), a_shift, b_shift, k)
-    dydx = (y2 - y1) / h  # < 0 on bowed-out frontier
-    oc_x = -dydx  # units of Y per +1 X
+    y1 = float(frontier_y(qx, a_shift, b_shift, k))
+    oc_x = float(opportunity_cost(qx, a_shift, b_shift, k))  # units of Y per +1 X (exact −dy/dx)
 
     fig = go.Figure()
     if show_baseline:
-        xsb = np.linspace(0, a, 400)
-        fig.add_trace(go.Scatter(x=xsb, y=ys_base, mode="lines", name="PPF (baseline)", line=dict(dash="dash")))
-    fig.add_trace(go.Scatter(x=xs, y=ys_shift, mode="lines", name="PPF"))
+        fig.add_trace(go.Scatter(x=base.x, y=base.y, mode="lines", name="PPF (baseline)", line=dict(dash="dash")))
+    fig.add_trace(go.Scatter(x=shifted.x, y=shifted.y, mode="lines", name="PPF"))
     fig.add_trace(go.Scatter(x=[qx], y=[y1], mode="markers+text", text=["•"], textposition="top center", name="Point"))
 
     fig.update_layout(
@@ -53,8 +40,24 @@ def app():
     )
     apply_grid(fig)
     st.plotly_chart(fig, use_container_width=True,key="ppc_chart")
-    st.caption(f"At X = {qx:.2f}, Y = {y1:.2f}.  Opportunity cost of 1 more X ≈ {oc_x:.3f} Y (rising as X increases when k>1).")
+    oc_text = f"{oc_x:.3f} Y" if np.isfinite(oc_x) else "unbounded at the X intercept"
+    gain = ""
+    if shift_pct and qx <= a:
+        gain = f"  The shift changes Y at this X by {y1 - float(frontier_y(qx, a, b, k)):+.2f}."
+    st.caption(f"At X = {qx:.2f}, Y = {y1:.2f}.  Opportunity cost of 1 more X = {oc_text} "
+               f"(rising as X increases when k>1).{gain}")
     show_adv = st.toggle("Advanced (show equations)", key="ppc_adv2")
     if show_adv:
-        st.latex(r" \text{PPC}_A: \; y = a_y - \frac{a_y}{a_x} x \quad;\quad \text{PPC}_B: \; y = b_y - \frac{b_y}{b_x} x ")
-        st.latex(r" \text{OC}_X^A = \frac{a_y}{a_x}, \quad \text{OC}_X^B = \frac{b_y}{b_x} \;\;\Rightarrow\;\; \text{CA in X} = \arg\min \text{OC}_X ")
+        st.latex(r" \left(\frac{x}{a}\right)^k + \left(\frac{y}{b}\right)^k = 1 \quad\Rightarrow\quad y = b\left(1 - \left(\frac{x}{a}\right)^k\right)^{1/k} ")
+        st.latex(r" \text{OC}_X = -\frac{dy}{dx} = \frac{b}{a}\left(\frac{x}{a}\right)^{k-1}\left(1 - \left(\frac{x}{a}\right)^k\right)^{\frac{1}{k}-1} ")
+        oc = np.where(np.isfinite(shifted.oc), shifted.oc, np.nan)
+        top = 3 * b_shift / a_shift if not np.isfinite(oc_x) else max(3 * b_shift / a_shift, 1.5 * oc_x)
+        fig_oc = go.Figure()
+        fig_oc.add_trace(go.Scatter(x=shifted.x, y=oc, mode="lines", name="OC of X"))
+        if np.isfinite(oc_x):
+            fig_oc.add_trace(go.Scatter(x=[qx], y=[oc_x], mode="markers", name="Point"))
+        fig_oc.update_layout(xaxis_title="Good X (quantity)", yaxis_title="Y per extra X",
+                             xaxis=dict(range=[0, a_shift]), yaxis=dict(range=[0, top]),
+                             height=300, margin=dict(l=40, r=20, t=20, b=40))
+        apply_grid(fig_oc)
+        st.plotly_chart(fig_oc, width="stretch", key="ppc_oc_chart")
@@ -0,0 +1,204 @@
+# apps/profiler.py — opt-in per-rerun time breakdown (sidebar panel + JSON-lines log)
+#
+# Turn it on with PROFILE_RERUNS=1 in the environment or ?profile=1 in the URL.
+# One page run is split into
+#   widgets        st.slider / number_input / toggle / ... (main area and sidebar)
+#   figure         building figures: plotly Figure and trace constructors and their
+#                  add_* / update_* methods, apps.charts.to_plotly / to_matplotlib
+#   serialization  handing figures to the browser: st.plotly_chart / st.image /
+#                  st.pyplot, Figure.to_json, savefig, apps.charts._emit
+#   compute        the rest of app(): model calls, numpy, text elements
+# Hooks are installed once and cost one thread-local lookup when the current
+# session is not being profiled. Only the outermost hooked call is timed, so a
+# Figure built inside st.plotly_chart counts as serialization, not twice.
+# Plotly classes first imported during a run are hooked from the next run on.
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from apps.render_cache import RENDER_CACHE
+
+LOG_PATH = os.environ.get("PROFILE_LOG", "rerun_profile.jsonl")
+HISTORY = 50          # runs kept per session for the panel's averages
+
+PHASES = ("widgets", "compute", "figure", "serialization")
+WIDGETS = ("slider", "select_slider", "number_input", "text_input", "text_area", "selectbox",
+           "multiselect", "radio", "checkbox", "toggle", "button", "data_editor", "file_uploader",
+           "color_picker", "date_input", "time_input")
+OUTPUTS = ("plotly_chart", "pyplot", "image", "altair_chart", "vega_lite_chart")
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_log_lock = threading.Lock()
+_installed = False
+
+
+class Profile:
+    """Seconds and call counts per phase and per hook for one page run."""
+
+    def __init__(self, title):
+        self.title = title
+        self.depth = 0
+        self.total = 0.0
+        self.phases = {p: 0.0 for p in PHASES if p != "compute"}
+        self.detail = {}       # hook label -> [seconds, calls]
+        self.cache = {}
+        self.interrupted = False
+
+    def add(self, phase, label, seconds):
+        self.phases[phase] += seconds
+        entry = self.detail.setdefault(label, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+    def record(self):
+        ms = {p: s * 1e3 for p, s in self.phases.items()}
+        ms["compute"] = max(self.total * 1e3 - sum(ms.values()), 0.0)
+        top = sorted(self.detail.items(), key=lambda kv: -kv[1][0])[:10]
+        return {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "page": self.title,
+            "total_ms": self.total * 1e3,
+            **{f"{p}_ms": ms[p] for p in PHASES},
+            "hooks": {label: {"ms": s * 1e3, "calls": n} for label, (s, n) in top},
+            "render_cache": self.cache,
+            "interrupted": self.interrupted,
+        }
+
+
+def _hook(fn, phase, label):
+    @functools.wraps(fn)
+    def hooked(*args, **kwargs):
+        prof = getattr(_local, "profile", None)
+        if prof is None or prof.depth:
+            return fn(*args, **kwargs)
+        prof.depth += 1
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            prof.add(phase, label, time.perf_counter() - t0)
+            prof.depth -= 1
+
+    hooked._profiled = True
+    return hooked
+
+
+def _patch(owner, name, phase, label):
+    fn = getattr(owner, name, None)
+    if fn is None or getattr(fn, "_profiled", False):
+        return
+    setattr(owner, name, _hook(fn, phase, label))
+
+
+def _install_streamlit():
+    from streamlit.delta_generator import DeltaGenerator
+
+    for names, phase in ((WIDGETS, "widgets"), (OUTPUTS, "serialization")):
+        for name in names:
+            _patch(DeltaGenerator, name, phase, f"st.{name}")   # st.sidebar.*, columns, containers
+            _patch(st, name, phase, f"st.{name}")               # st.* is bound to the main container
+
+
+def _install_loaded():
+    """Hook figure libraries and apps.charts if (and only if) they are already imported."""
+    charts = sys.modules.get("apps.charts")
+    if charts is not None:
+        _patch(charts, "to_plotly", "figure", "charts.to_plotly")
+        _patch(charts, "to_matplotlib", "figure", "charts.to_matplotlib")
+        _patch(charts, "_emit", "serialization", "charts._emit")
+    figure_mod = sys.modules.get("plotly.graph_objs._figure")
+    if figure_mod is not None:
+        Figure = figure_mod.Figure
+        for name in dir(Figure):
+            if name == "__init__" or name.startswith(("add_", "update_")):
+                _patch(Figure, name, "figure", f"Figure.{name}")
+        for name in ("to_json", "to_dict", "to_plotly_json"):
+            _patch(Figure, name, "serialization", f"Figure.{name}")
+    base = sys.modules.get("plotly.basedatatypes")
+    if base is not None:
+        for trace in base.BaseTraceType.__subclasses__():
+            _patch(trace, "__init__", "figure", f"go.{trace.__name__}")
+    mfigure = sys.modules.get("matplotlib.figure")
+    if mfigure is not None:
+        _patch(mfigure.Figure, "savefig", "serialization", "savefig")
+
+
+def install():
+    global _installed
+    with _install_lock:
+        if not _installed:
+            _install_streamlit()
+            _installed = True
+        _install_loaded()
+
+
+def requested():
+    """Profiling is opt-in: PROFILE_RERUNS=1 or ?profile=1."""
+    return os.environ.get("PROFILE_RERUNS") == "1" or st.query_params.get("profile") == "1"
+
+
+def _append_log(record):
+    line = json.dumps(record)
+    with _log_lock:
+        try:
+            with open(LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass   # a read-only deploy still gets the panel
+
+
+@contextmanager
+def profile(title):
+    """Profile the page run inside the block; the record is logged even if the run is interrupted."""
+    install()
+    prof = Profile(title)
+    before = RENDER_CACHE.stats()
+    _local.profile = prof
+    t0 = time.perf_counter()
+    try:
+        yield prof
+    except BaseException:   # st.rerun()/st.stop() included
+        prof.interrupted = True
+        raise
+    finally:
+        prof.total = time.perf_counter() - t0
+        _local.profile = None
+        after = RENDER_CACHE.stats()
+        # Process-wide counters: other sessions' lookups in the same window count too
+        prof.cache = {"hits": after["hits"] - before["hits"], "misses": after["misses"] - before["misses"]}
+        record = prof.record()
+        _append_log(record)
+        history = st.session_state.setdefault("_profile_history", [])
+        history.append(record)
+        del history[:-HISTORY]
+
+
+def panel(prof):
+    """Sidebar breakdown of the last run plus the session's average for this page."""
+    record = prof.record()
+    runs = [r for r in st.session_state.get("_profile_history", []) if r["page"] == prof.title]
+    with st.sidebar.expander("Rerun profile", expanded=True):
+        rows = ["| phase | last (ms) | share | mean (ms) |", "|---|---:|---:|---:|"]
+        for p in PHASES:
+            ms = record[f"{p}_ms"]
+            share = ms / record["total_ms"] if record["total_ms"] else 0.0
+            mean = sum(r[f"{p}_ms"] for r in runs) / len(runs)
+            rows.append(f"| {p} | {ms:.1f} | {share:.0%} | {mean:.1f} |")
+        mean_total = sum(r["total_ms"] for r in runs) / len(runs)
+        rows.append(f"| **total** | **{record['total_ms']:.1f}** | | **{mean_total:.1f}** |")
+        st.markdown("\n".join(rows))
+        top = list(record["hooks"].items())[:5]
+        if top:
+            st.caption("Slowest hooks: " + ", ".join(f"{label} {v['ms']:.1f} ms ×{v['calls']}"
+                                                      for label, v in top))
+        cache = record["render_cache"]
+        st.caption(f"Render cache this run: {cache['hits']} hits, {cache['misses']} misses · "
+                   f"{len(runs)} runs averaged · log: {LOG_PATH}")
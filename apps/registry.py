@@ -0,0 +1,117 @@
+# apps/registry.py — declarative page table + lazy loading with timings
+import importlib
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class Page:
+    title: str
+    module: str          # dotted module path under apps/
+    attr: str = "app"    # entry point inside the module
+
+# Sidebar order: module heading → pages
+REGISTRY = {
+    "Module 1 — Modeling Foundations": [
+        Page("Budget Constraint", "apps.budget_line"),
+        Page("PPC", "apps.ppc"),
+        Page("Comparative Advantage", "apps.comparative_advantage"),
+    ],
+    "Module 2 — Supply & Demand": [
+        Page("Demand (schedule → line)", "apps.demand_schedule"),
+        Page("Supply (schedule → line)", "apps.supply_schedule"),
+        Page("Market Model", "apps.static_equilibrium"),
+        Page("Single Shifts", "apps.shifts_single"),
+        Page("Double Shifts", "apps.shifts_double"),
+    ],
+    "Module 3 — Elasticity": [
+        Page("Price Elasticity of Demand", "apps.elasticity_demand"),
+        Page("Elasticity and Total Revenue", "apps.elasticity_tr"),
+        Page("Price Elasticity of Supply", "apps.elasticity_supply"),
+    ],
+    "Module 4 — Welfare Economics": [
+        Page("Surplus", "apps.surplus"),
+        Page("Government Intervention: Price Floor", "apps.gov_int_p_floor"),
+        Page("Government Intervention: Price Ceiling", "apps.gov_int_p_ceiling"),
+        Page("Deadweight Loss", "apps.deadweight_loss"),
+    ],
+    "Module 5 — Factors of Production": [
+        Page("Interdependent Factors", "apps.all_factors"),
+        Page("Land + Rent", "apps.land"),
+        Page("Labor + Wage", "apps.labor"),
+        Page("Capital + Interest", "apps.capital"),
+    ],
+    "Module 6 — Core Macro Models": [
+        Page("IS–LM", "apps.is_lm"),
+        Page("AD–AS", "apps.ad_as"),
+        Page("Solow Model", "apps.solow_model"),
+    ],
+    "Module 7 — Extension Macro Models": [
+        Page("NK DSGE", "apps.nk_dsge"),
+        Page("Mundell–Fleming", "apps.Mundell_Fleming"),
+        Page("Fiscal Multipliers", "apps.Fiscal_Multipliers"),
+        Page("HANK", "apps.hank_teaser"),
+        Page("Phillips Curve", "apps.phillips_curve"),
+    ],
+}
+
+# Older names that subpages still use for st.session_state["nav_default"]
+ALIASES = {
+    "Static Equilibrium": "Market Model",
+}
+
+PAGES = {p.title: p for pages in REGISTRY.values() for p in pages}
+
+# title → {"import_ms", "first_render_ms", "renders"}; one table per worker process
+TIMINGS = {}
+
+
+def resolve(title):
+    """Page for a title or alias, or None."""
+    return PAGES.get(ALIASES.get(title, title))
+
+
+def check_pages():
+    """
+    Verify every registered page points at an importable module, without
+    importing it. Returns a list of (title, problem) for the broken ones.
+    """
+    problems = []
+    for title, page in PAGES.items():
+        try:
+            found = importlib.util.find_spec(page.module) is not None
+        except ModuleNotFoundError:
+            found = False
+        if not found:
+            problems.append((title, f"module {page.module!r} not found"))
+    for alias, target in ALIASES.items():
+        if target not in PAGES:
+            problems.append((alias, f"alias points at unknown page {target!r}"))
+    return problems
+
+
+def load(page: Page):
+    """Import the page module on first use and return its entry point."""
+    stats = TIMINGS.setdefault(page.title, {"import_ms": None, "first_render_ms": None, "renders": 0})
+    t0 = time.perf_counter()
+    module = importlib.import_module(page.module)
+    if stats["import_ms"] is None:
+        stats["import_ms"] = (time.perf_counter() - t0) * 1e3
+        log.info("import %s: %.1f ms", page.module, stats["import_ms"])
+    return getattr(module, page.attr)
+
+
+def render(page: Page):
+    """Run the page, recording its first-render time in this process."""
+    entry = load(page)
+    stats = TIMINGS[page.title]
+    t0 = time.perf_counter()
+    result = entry()   # st.rerun()/st.stop() raise through here and are not timed
+    if stats["first_render_ms"] is None:
+        stats["first_render_ms"] = (time.perf_counter() - t0) * 1e3
+        log.info("first render %s: %.1f ms", page.title, stats["first_render_ms"])
+    stats["renders"] += 1
+    return result
@@ -0,0 +1,91 @@
+# apps/render_cache.py — process-wide LRU of rendered chart payloads
+#
+# One instance is shared by every session served by this worker, so students
+# sitting on the same page with the same slider values get the PNG / Plotly
+# JSON rendered by whoever got there first. Entries are keyed by the caller
+# (page/chart + parameter tuple + backend) and by `code_version()`, so editing
+# a page or model never serves a stale picture.
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SOURCE_DIRS = (_ROOT / "apps", _ROOT / "models")
+
+BUDGET_BYTES = int(os.environ.get("RENDER_CACHE_MB", "64")) * 2**20
+
+
+@lru_cache(maxsize=1)
+def code_version():
+    """
+    Fingerprint of the app and model sources (file names, sizes, mtimes),
+    taken once per import of this module. Streamlit unloads every watched
+    module when a source file changes, so an edit re-imports this one and
+    the next lookup stats the tree again; in between, show_cached pays
+    nothing for the key.
+    """
+    stamp = []
+    for folder in _SOURCE_DIRS:
+        for entry in os.scandir(folder):
+            if entry.name.endswith(".py"):
+                info = entry.stat()
+                stamp.append((entry.name, info.st_size, info.st_mtime_ns))
+    return hash(tuple(sorted(stamp)))
+
+
+class RenderCache:
+    """Thread-safe LRU of rendered payloads, evicted by total size in bytes."""
+
+    def __init__(self, budget_bytes=BUDGET_BYTES):
+        self.budget = budget_bytes
+        self._data = OrderedDict()   # key -> (value, nbytes)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, nbytes):
+        if nbytes > self.budget:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._data[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.budget:
+                _, (_, freed) = self._data.popitem(last=False)
+                self._nbytes -= freed
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._nbytes,
+                "budget": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+RENDER_CACHE = RenderCache()
@@ -0,0 +1,60 @@
+# apps/sampling.py — adaptive sampling of y = f(x) for plotting (NumPy only, so
+# the macro pages can use it without pulling in plotly through apps.common)
+import numpy as np
+
+TOL = 5e-4          # allowed chord error, as a fraction of the plot's width/height
+MAX_POINTS = 400    # never more than the fixed grids this replaces
+INIT_POINTS = 9
+
+
+def adaptive_sample(f, x0, x1, *, tol=TOL, max_points=MAX_POINTS, init=INIT_POINTS, y_scale=None):
+    """
+    Points (x, y) along y = f(x) on [x0, x1], dense where the curve bends and
+    sparse where it is straight. Every pass evaluates f (vectorized) at the
+    midpoint of each segment and splits the segments whose midpoint lies more
+    than tol away from the chord, measured in plot units: x over the sampled
+    span, y over y_scale (default: the curve's own range). A straight line
+    stops at `init` points; kinks and vertical ends are refined until the
+    error is below tol or max_points is reached, worst segments first.
+    """
+    x = np.linspace(x0, x1, init)
+    y = np.asarray(f(x), dtype=float)
+    sx = abs(x1 - x0) or 1.0
+    finite = y[np.isfinite(y)]
+    sy = abs(y_scale or 0.0) or (float(finite.max() - finite.min()) if finite.size else 0.0) or 1.0
+    while x.size < max_points:
+        xm = 0.5 * (x[:-1] + x[1:])
+        ym = np.asarray(f(xm), dtype=float)
+        dx = np.diff(x) / sx
+        dy = np.diff(y) / sy
+        dev = (ym - 0.5 * (y[:-1] + y[1:])) / sy          # vertical offset from the chord midpoint
+        with np.errstate(invalid="ignore", divide="ignore"):
+            err = np.abs(dev) * dx / np.hypot(dx, dy)     # distance from the chord line
+        err = np.where(np.isfinite(err), err, 0.0)         # zero-length chords, gaps in f
+        split = np.flatnonzero(err > tol)
+        if split.size == 0:
+            break
+        room = max_points - x.size
+        if split.size > room:
+            split = np.sort(split[np.argsort(err[split])[::-1][:room]])
+        x = np.insert(x, split + 1, xm[split])
+        y = np.insert(y, split + 1, ym[split])
+    return x, y
+
+
+# ---------- trace mode ----------
+
+WEBGL_THRESHOLD = 1000     # points above which Plotly traces are drawn with WebGL
+RENDER_MODES = ("auto", "svg", "webgl")
+
+
+def use_webgl(n_points, render="auto"):
+    """
+    Whether a trace (or figure) of n_points should be a Scattergl: always with
+    render="webgl", never with "svg", and above WEBGL_THRESHOLD with "auto".
+    SVG redraws every point on each pan or hover, which is what makes long
+    series sluggish on low-end laptops; WebGL draws them on the GPU.
+    """
+    if render not in RENDER_MODES:
+        raise ValueError(f"render must be one of {RENDER_MODES}, not {render!r}")
+    return render == "webgl" or (render == "auto" and n_points > WEBGL_THRESHOLD)
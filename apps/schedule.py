@@ -0,0 +1,113 @@
+# apps/schedule.py — schedule → line fitting shared by the demand and supply pages
+#
+# A typed table refits incrementally: the regression statistics live in the
+# session and only rows whose values changed since the last rerun are taken
+# out and put back. An uploaded CSV is read in chunks, each chunk merged into
+# the statistics, and both stay in the session until another file is chosen.
+import numpy as np
+import streamlit as st
+
+from apps.common import Line
+from apps.lazy import lazy_import
+from models.ols import RegressionStats, huber_fit
+
+pd = lazy_import("pandas")
+
+CHUNK_ROWS = 100_000
+NAMES = {"Q": ("q", "quantity", "qty"), "P": ("p", "price"), "W": ("w", "weight", "weights", "count", "n")}
+
+
+def _table_stats(key, df):
+    """Statistics for the edited table, updated only for the rows that changed."""
+    state = st.session_state.setdefault(f"{key}_fit", {"stats": RegressionStats(), "rows": {}})
+    stats, applied = state["stats"], state["rows"]
+    Q = pd.to_numeric(df["Q"], errors="coerce").to_numpy(float)
+    P = pd.to_numeric(df["P"], errors="coerce").to_numpy(float)
+    current = {i: (q, p) for i, q, p in zip(df.index, Q, P) if np.isfinite(q) and np.isfinite(p)}
+    for i in [i for i, row in applied.items() if current.get(i) != row]:
+        stats.remove(*applied.pop(i))
+    for i, row in current.items():
+        if i not in applied:
+            stats.add(*row)
+            applied[i] = row
+    return stats, Q, P
+
+
+def _column(chunk, role):
+    lookup = {str(c).strip().lower(): c for c in chunk.columns}
+    for name in NAMES[role]:
+        if name in lookup:
+            return lookup[name]
+    return None
+
+
+def _read_upload(key, upload):
+    """Stream the CSV in chunks into regression statistics (cached per file in the session)."""
+    cached = st.session_state.get(f"{key}_upload")
+    if cached and cached["id"] == upload.file_id:
+        return cached
+    stats, parts = RegressionStats(), {"Q": [], "P": [], "W": []}
+    cols = None
+    for chunk in pd.read_csv(upload, chunksize=CHUNK_ROWS):
+        if cols is None:
+            cols = {role: _column(chunk, role) for role in NAMES}
+            if cols["Q"] is None or cols["P"] is None:
+                raise ValueError("the file needs a quantity column (Q) and a price column (P)")
+        q = pd.to_numeric(chunk[cols["Q"]], errors="coerce").to_numpy(float)
+        p = pd.to_numeric(chunk[cols["P"]], errors="coerce").to_numpy(float)
+        w = pd.to_numeric(chunk[cols["W"]], errors="coerce").to_numpy(float) if cols["W"] else np.ones_like(q)
+        stats.merge(RegressionStats.from_arrays(q, p, w))
+        for role, v in zip("QPW", (q, p, w)):
+            parts[role].append(v)
+    if cols is None:
+        raise ValueError("the file is empty")
+    data = {"id": upload.file_id, "stats": stats, "weighted": cols["W"] is not None, "huber": None,
+            **{role: np.concatenate(v) for role, v in parts.items()}}
+    st.session_state[f"{key}_upload"] = data
+    return data
+
+
+def schedule_fit(key, default, fallback: Line):
+    """
+    Table editor or CSV upload plus fit options; returns (line, LineFit or None,
+    note, observed) where observed is the uploaded (Q, P) or None. `default` is
+    the starting table; `fallback` is drawn until at least two distinct
+    quantities are available.
+    """
+    source = st.radio("Data", ["Type a schedule", "Upload CSV"], horizontal=True, key=f"{key}_source")
+    method = st.radio("Fit", ["Least squares", "Robust (Huber)"], horizontal=True, key=f"{key}_method")
+
+    if source == "Upload CSV":
+        upload = st.file_uploader("CSV with Q and P columns (optional weight column W)", type="csv",
+                                  key=f"{key}_file")
+        if upload is None:
+            return fallback, None, "Upload a file to fit it.", None
+        try:
+            with st.spinner("Reading schedule…"):
+                data = _read_upload(key, upload)
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+            st.error(f"Could not read {upload.name}: {e}")
+            return fallback, None, "No usable data.", None
+        if method == "Robust (Huber)":
+            if data["huber"] is None:
+                data["huber"] = huber_fit(data["Q"], data["P"], data["W"])
+            fit = data["huber"]
+        else:
+            fit = data["stats"].fit()
+        note = f"{data['stats'].n:,} observations" + (", weighted by W" if data["weighted"] else "")
+        observed = data["Q"], data["P"]
+    else:
+        st.caption("Enter Data:")
+        df = st.data_editor(pd.DataFrame(default), num_rows="dynamic", width="stretch", key=key)
+        stats, Q, P = _table_stats(key, df)
+        if method == "Robust (Huber)":
+            ok = np.isfinite(Q) & np.isfinite(P)
+            fit = huber_fit(Q[ok], P[ok])   # a handful of rows: refit from scratch
+        else:
+            fit = stats.fit()
+        note = f"{stats.n} rows"
+        observed = None
+
+    if fit is None:
+        return fallback, None, note + " — need two distinct quantities to fit.", observed
+    return Line(a=float(fit.a), b=float(fit.b)), fit, note + f", R² = {fit.r2:.3f}", observed
@@ -2,87 +2,7 @@ import streamlit as st
 from math import isnan
 
 # Shared helpers from your project
-from apps.common import Line, base_fig, add_point, intersect
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Geometry helpers: draw lines that touch the plot edges
-# ──────────────────────────────────────────────────────────────────────────────
-EPS = 1e-12
-
-def clip_line_to_box(m, b, xmin, xmax, ymin, ymax):
-    """
-    Clip the infinite line y = m*x + b to the axis-aligned box [xmin,xmax]×[ymin,ymax].
-    Returns two boundary points (x0,y0), (x1,y1) so the segment spans the visible area.
-    If the line doesn't cross the box, return None.
-    """
-    pts = []
-
-    # Intersections with vertical borders x = xmin, xmax
-    for x in (xmin, xmax):
-        y = m * x + b
-        if ymin - EPS <= y <= ymax + EPS:
-            pts.append((x, y))
-
-    # Intersections with horizontal borders y = ymin, ymax
-    if abs(m) > EPS:
-        for y in (ymin, ymax):
-            x = (y - b) / m
-            if xmin - EPS <= x <= xmax + EPS:
-                pts.append((x, y))
-
-    # Deduplicate within tolerance
-    uniq = []
-    for x, y in pts:
-        key = (round(x, 9), round(y, 9))
-        if key not in [(round(px, 9), round(py, 9)) for px, py in uniq]:
-            uniq.append((x, y))
-
-    if len(uniq) < 2:
-        return None
-
-    # Stable ordering and extremes → full-width segment
-    uniq.sort()
-    return uniq[0], uniq[-1]
-
-
-def add_full_span_line(fig, alpha, beta, *, name, xmin, xmax, ymin, ymax, width=3, dash=None):
-    """
-    Plot P = alpha + beta*Q as a long segment that continues when you pan/zoom.
-    """
-    span = max(xmax - xmin, ymax - ymin, 10) * 100
-    x0 = -span
-    x1 = span
-    y0 = beta * x0 + alpha
-    y1 = beta * x1 + alpha
-    fig.add_scatter(
-        x=[x0, x1], y=[y0, y1],
-        mode="lines",
-        name=name,
-        showlegend=False,
-        line=dict(width=width, dash=dash) if dash else dict(width=width))
-
-
-def add_inline_label(fig, alpha, beta, *, text, xmax, ymin, ymax, pad=0.96, side="right"):
-    """
-    Place a small text label directly on the line (so we can remove the legend).
-    - side="right" puts label near the right edge; "left" near the left edge.
-    - pad is the fraction of xmax to use (e.g., 0.96 -> close to the right edge).
-    We clamp the y position into [ymin, ymax] so labels never render off-screen.
-    """
-    x = pad * xmax if side == "right" else (1.0 - pad) * xmax
-    y = alpha + beta * x
-    # Clamp to be safely inside the frame
-    y = min(max(y, ymin + 0.02 * (ymax - ymin)), ymax - 0.02 * (ymax - ymin))
-
-    fig.add_annotation(
-        x=x, y=y, text=text, showarrow=False,
-        xanchor="left" if side == "right" else "right",
-        yanchor="middle",
-        bgcolor="rgba(255,255,255,0.7)",
-        bordercolor="rgba(0,0,0,0.15)",
-        borderwidth=1,
-        font=dict(size=11)
-    )
+from apps.common import Line, base_fig, add_point, intersect, add_lines, add_inline_labels
 
 # ──────────────────────────────────────────────────────────────────────────────
 # One pane (either Demand-shift or Supply-shift)
@@ -107,7 +27,6 @@ def make_pane(title, D0, S0, xmax, ymax, which, *, hide_d, hide_s, show_baseline
 
     # Figure and axes
     xmin, ymin = 0.0, 0.0
-    fig = base_fig(xmax=xmax, ymax=ymax)
 
     # y_needed ensures intercepts and both P* values are visible
     y_needed = max(
@@ -116,56 +35,31 @@ def make_pane(title, D0, S0, xmax, ymax, which, *, hide_d, hide_s, show_baseline
         (p1 if not isnan(p1) else 0.0)
     )
 
-    # Axes styling + grid; automargins to avoid label clipping
-    fig.update_xaxes(
-        range=[xmin, xmax], title="Quantity (Q)",
-        showgrid=show_grid, gridwidth=1, gridcolor="rgba(0,0,0,0.12)",
-        zeroline=False, ticks="outside", automargin=True
-    )
-    fig.update_yaxes(
-        range=[ymin, y_needed], title="Price (P)",
-        showgrid=show_grid, gridwidth=1, gridcolor="rgba(0,0,0,0.12)",
-        zeroline=False, ticks="outside", automargin=True
-    )
-
-    # Global layout tweaks for better rendering & stability
-    fig.update_layout(
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        height=560,
-        margin=dict(l=40, r=24, t=24, b=40),
-        uirevision="shifts-double",  # keep zoom/pan state while sliders move
-        showlegend=False             # <— legend removed globally
-    )
+    # Cached layout: axes box, grid toggle, zoom persistence and no legend
+    fig = base_fig(xmax=xmax, ymax=y_needed, show_grid=show_grid, height=560,
+                   uirevision="shifts-double",  # keep zoom/pan state while sliders move
+                   showlegend=False)            # <— legend removed globally
 
-    # Baseline (ghost) lines — dashed, under current
+    # Lines to draw: baseline (ghost) lines first so current lines sit on top,
+    # then all of them go to the figure (and get inline labels) in one call each
+    lines = []   # (alpha, beta, name, dash, width, label, pad, side)
     if show_baseline:
         if not hide_d:
-            add_full_span_line(fig, D0.a, D0.b, name="D0",
-                               xmin=xmin, xmax=xmax, ymin=ymin, ymax=y_needed,
-                               dash="dash", width=2)
+            lines.append((D0.a, D0.b, "D0", "dash", 2, "D(original)", 0.06, "left"))
         if not hide_s:
-            add_full_span_line(fig, S0.a, S0.b, name="S0",
-                               xmin=xmin, xmax=xmax, ymin=ymin, ymax=y_needed,
-                               dash="dash", width=2)
-
-    # Current (shifted) lines — solid, on top
-    if not hide_d:
-        add_full_span_line(fig, D1.a, D1.b, name="New Demand",
-                           xmin=xmin, xmax=xmax, ymin=ymin, ymax=y_needed, width=3)
-    if not hide_s:
-        add_full_span_line(fig, S1.a, S1.b, name="New Supply",
-                           xmin=xmin, xmax=xmax, ymin=ymin, ymax=y_needed, width=3)
-
-    # Inline labels instead of legends
+            lines.append((S0.a, S0.b, "S0", "dash", 2, "S(original)", 0.06, "left"))
     if not hide_d:
-        if show_baseline:
-            add_inline_label(fig, D0.a, D0.b, text="D(original)", xmax=xmax, ymin=ymin, ymax=y_needed, pad=0.06, side="left")
-        add_inline_label(fig, D1.a, D1.b, text="Demand", xmax=xmax, ymin=ymin, ymax=y_needed, pad=0.96, side="right")
+        lines.append((D1.a, D1.b, "New Demand", None, 3, "Demand", 0.96, "right"))
     if not hide_s:
-        if show_baseline:
-            add_inline_label(fig, S0.a, S0.b, text="S(original)", xmax=xmax, ymin=ymin, ymax=y_needed, pad=0.06, side="left")
-        add_inline_label(fig, S1.a, S1.b, text="Supply", xmax=xmax, ymin=ymin, ymax=y_needed, pad=0.96, side="right")
+        lines.append((S1.a, S1.b, "New Supply", None, 3, "Supply", 0.96, "right"))
+
+    if lines:
+        alphas, betas, names, dashes, widths, labels, pads, sides = map(list, zip(*lines))
+        add_lines(fig, alphas, betas, names, xmin=xmin, xmax=xmax, ymin=ymin, ymax=y_needed,
+                  width=widths, dash=dashes, showlegend=False)
+        # Inline labels instead of legends
+        add_inline_labels(fig, alphas, betas, labels, xmax=xmax, ymin=ymin, ymax=y_needed,
+                          pad=pads, side=sides)
 
     # Equilibrium markers & crosshairs
     if not (isnan(q0) or isnan(p0)) and show_baseline:
@@ -2,65 +2,7 @@ import streamlit as st
 from math import isnan
 
 # Shared helpers from your project
-from apps.common import Line, base_fig, add_point, intersect
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Geometry helpers: draw lines that touch the plot edges
-# ──────────────────────────────────────────────────────────────────────────────
-EPS = 1e-12
-
-def clip_line_to_box(m, b, xmin, xmax, ymin, ymax):
-    """
-    Clip the infinite line y = m*x + b to the axis-aligned box [xmin,xmax]×[ymin,ymax].
-    Returns two boundary points (x0,y0), (x1,y1) so the segment spans the visible area.
-    If the line doesn't cross the box, return None.
-    """
-    pts = []
-
-    # Intersections with vertical borders x = xmin, xmax
-    for x in (xmin, xmax):
-        y = m * x + b
-        if ymin - EPS <= y <= ymax + EPS:
-            pts.append((x, y))
-
-    # Intersections with horizontal borders y = ymin, ymax
-    if abs(m) > EPS:
-        for y in (ymin, ymax):
-            x = (y - b) / m
-            if xmin - EPS <= x <= xmax + EPS:
-                pts.append((x, y))
-
-    # Deduplicate within tolerance
-    uniq = []
-    for x, y in pts:
-        key = (round(x, 9), round(y, 9))
-        if key not in [(round(px, 9), round(py, 9)) for px, py in uniq]:
-            uniq.append((x, y))
-
-    if len(uniq) < 2:
-        return None
-
-    # Stable ordering and extremes → full-width segment
-    uniq.sort()
-    return uniq[0], uniq[-1]
-
-
-def add_full_span_line(fig, alpha, beta, *, name, xmin, xmax, ymin, ymax, width=3, dash=None, legendgroup=None):
-    """
-    Plot P = alpha + beta*Q as a long segment that continues when you pan/zoom.
-    """
-    span = max(xmax - xmin, ymax - ymin, 10) * 100
-    x0 = -span
-    x1 = span
-    y0 = beta * x0 + alpha
-    y1 = beta * x1 + alpha
-    fig.add_scatter(
-        x=[x0, x1], y=[y0, y1],
-        mode="lines",
-        name=name,
-        line=dict(width=width, dash=dash) if dash else dict(width=width),
-        legendgroup=legendgroup
-    )
+from apps.common import Line, base_fig, add_point, intersect, add_full_span_line
 
 # ──────────────────────────────────────────────────────────────────────────────
 # App
@@ -110,26 +52,15 @@ def app():
     with c4:
         show_baseline = st.toggle("Show baseline (ghost)", value=True)
 
-    # Figure
-    fig = base_fig(xmax=xmax, ymax=ymax)
-
     # Axes ranges + grid → match the clipping box and keep it readable
     y_needed = max(
         ymax, ad, as_,
         (p0 if not isnan(p0) else 0.0),
         (p1 if not isnan(p1) else 0.0)
     )
-    fig.update_xaxes(
-        range=[xmin, xmax], title="Quantity (Q)",
-        showgrid=show_grid, gridwidth=1, gridcolor="rgba(0,0,0,0.12)",
-        zeroline=False, ticks="outside"
-    )
-    fig.update_yaxes(
-        range=[ymin, y_needed], title="Price (P)",
-        showgrid=show_grid, gridwidth=1, gridcolor="rgba(0,0,0,0.12)",
-        zeroline=False, ticks="outside"
-    )
-    fig.update_layout(plot_bgcolor="white", paper_bgcolor="white")
+
+    # Figure (cached layout; only the traces below change per rerun)
+    fig = base_fig(xmax=xmax, ymax=y_needed, show_grid=show_grid)
 
     # Baseline lines (ghost, dashed)
     if show_baseline:
@@ -1,7 +1,8 @@
 import numpy as np
 import streamlit as st
-import matplotlib.pyplot as plt
-from models.solow import SolowParams, simulate_path
+from models.solow import SolowParams, simulate_paths
+from apps.charts import Chart, backend_selector, show_cached
+from apps.sampling import adaptive_sample
 
 
 def app():
@@ -10,6 +11,7 @@ def app():
 
     # Controls
     with st.sidebar:
+        backend_selector()
         st.markdown("### Parameters")
         s = st.slider("Savings rate (s)", 0.00, 0.80, 0.20, 0.01)
         alpha = st.slider("Capital share (α)", 0.10, 0.60, 0.33, 0.01)
@@ -21,44 +23,53 @@ def app():
         k0 = st.slider("Initial capital per effective worker (k₀)", 0.01, 10.0, 2.0, 0.01)
         T = st.slider("Horizon (periods)", 10, 300, 120)
 
+        st.markdown("### Scenarios")
+        overlay = st.checkbox("Overlay savings-rate scenarios", value=False)
+        n_scen = st.slider("Number of scenarios", 2, 50, 12, disabled=not overlay)
+
     params = SolowParams(s=s, delta=delta, n=n, g=g, alpha=alpha)
-    k, y = simulate_path(k0=k0, T=T, params=params)
+
+    # Row 0 is the chosen economy; extra rows sweep s around it in the same pass
+    s_rows = [s]
+    if overlay:
+        s_rows += list(np.linspace(max(0.01, s - 0.15), min(0.80, s + 0.15), n_scen))
+    batch = simulate_paths(k0, T, tuple(s_rows), delta, n, g, alpha)
+    k, y = batch.k[0], batch.y[0]
 
     # Plots
     c1, c2 = st.columns(2)
     ngd = params.n + params.g + params.delta
     k_star = None
-    if ngd > 0:
-        k_star = (params.s / ngd) ** (1 / (1 - params.alpha))
-        y_star = k_star ** params.alpha
-    else:
-        y_star = None
+    y_star = None
+    if np.isfinite(batch.k_star[0]):
+        k_star = float(batch.k_star[0])
+        y_star = float(batch.y_star[0])
 
-    with c1:
-        fig1, ax1 = plt.subplots(figsize=(6, 3.6))
-        ax1.plot(k, label="k_t")
+    def path_charts():
+        chart1 = Chart(xlabel="t", ylabel="Capital per effective worker (k)")
+        for row in batch.k[1:]:
+            chart1.line(row, color="gray", lw=0.6, alpha=0.5)
+        chart1.line(k, label="k_t")
         if k_star is not None:
-            ax1.axhline(k_star, color="gray", lw=1, ls=":")
-            ax1.text(0.02, 0.95, "k* steady state", transform=ax1.transAxes, va="top")
-        ax1.set_xlabel("t")
-        ax1.set_ylabel("Capital per effective worker (k)")
-        ax1.legend()
-        st.pyplot(fig1)
-
-    with c2:
-        fig2, ax2 = plt.subplots(figsize=(6, 3.6))
-        ax2.plot(y, label="y_t = k_t^α")
+            chart1.hline(k_star)
+            chart1.text(0.02, 0.95, "k* steady state", axes=True, va="top")
+
+        chart2 = Chart(xlabel="t", ylabel="Output per effective worker (y)")
+        for row in batch.y[1:]:
+            chart2.line(row, color="gray", lw=0.6, alpha=0.5)
+        chart2.line(y, label="y_t = k_t^α")
         if y_star is not None:
-            ax2.axhline(y_star, color="gray", lw=1, ls=":")
-            ax2.text(0.02, 0.95, "y* steady state", transform=ax2.transAxes, va="top")
-        ax2.set_xlabel("t")
-        ax2.set_ylabel("Output per effective worker (y)")
-        ax2.legend()
-        st.pyplot(fig2)
+            chart2.hline(y_star)
+            chart2.text(0.02, 0.95, "y* steady state", axes=True, va="top")
+        return [chart1, chart2]
+
+    show_cached("solow/paths", (params, k0, T, tuple(s_rows)), path_charts, containers=[c1, c2])
 
     if k_star is not None:
         st.metric("k* (steady state)", f"{k_star:.3f}")
         st.metric("y* (steady state)", f"{y_star:.3f}")
+        if np.isfinite(batch.half_life[0]):
+            st.metric("Half-life of convergence (periods)", f"{batch.half_life[0]:.1f}")
     else:
         st.warning("Steady state undefined when n + g + δ ≤ 0.")
 
@@ -68,18 +79,19 @@ def app():
 
     # Savings vs. break-even investment diagram
     st.subheader("Savings vs. Break-Even Investment")
-    k_grid = np.linspace(0.01, max(5.0, k_star * 1.2 if k_star else 10.0), 300)
-    s_f = params.s * (k_grid ** params.alpha)
-    breakeven = ngd * k_grid
-    fig3, ax3 = plt.subplots(figsize=(6, 3.6))
-    ax3.plot(k_grid, s_f, label="s·f(k)")
-    ax3.plot(k_grid, breakeven, label="(n+g+δ)·k")
-    if k_star is not None:
-        ax3.scatter([k_star], [params.s * (k_star ** params.alpha)], zorder=3)
-        ax3.text(k_star, params.s * (k_star ** params.alpha), "  k*", va="bottom")
-    ax3.set_xlabel("k")
-    ax3.set_ylabel("Investment per effective worker")
-    ax3.legend()
-    st.pyplot(fig3)
+
+    def diagram_chart():
+        k_hi = max(5.0, k_star * 1.2 if k_star else 10.0)
+        y_top = max(params.s * k_hi ** params.alpha, ngd * k_hi)
+        k_grid, s_f = adaptive_sample(lambda k: params.s * k ** params.alpha, 0.01, k_hi, y_scale=y_top)
+        chart3 = Chart(xlabel="k", ylabel="Investment per effective worker")
+        chart3.line(k_grid, s_f, label="s·f(k)")
+        chart3.line([0.01, k_hi], [ngd * 0.01, ngd * k_hi], label="(n+g+δ)·k")   # a straight line
+        if k_star is not None:
+            chart3.scatter(k_star, params.s * (k_star ** params.alpha))
+            chart3.text(k_star, params.s * (k_star ** params.alpha), "  k*", va="bottom")
+        return chart3
+
+    show_cached("solow/diagram", params, diagram_chart)
 
     st.markdown("**Questions:** What happens to steady state if s↑? If δ↑? How does (n+g) change the speed of convergence?")
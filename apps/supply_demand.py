@@ -1,61 +1,5 @@
 import streamlit as st
-from apps.common import Line, base_fig, add_point, intersect
-
-# ---------- Geometry helpers ----------
-EPS = 1e-12
-
-def clip_line_to_box(m, b, xmin, xmax, ymin, ymax):
-    """
-    Given a line y = m*x + b and an axis-aligned box [xmin,xmax]x[ymin,ymax],
-    return two points (x0,y0), (x1,y1) where the infinite line intersects the box.
-    This ensures the plotted segment touches the visible edges of the chart.
-
-    If the line does not cross the box, return None.
-    """
-    pts = []
-
-    # Intersections with vertical borders x = xmin, xmax
-    for x in (xmin, xmax):
-        y = m * x + b
-        if ymin - EPS <= y <= ymax + EPS:
-            pts.append((x, y))
-
-    # Intersections with horizontal borders y = ymin, ymax
-    if abs(m) > EPS:
-        for y in (ymin, ymax):
-            x = (y - b) / m
-            if xmin - EPS <= x <= xmax + EPS:
-                pts.append((x, y))
-
-    # Deduplicate (within float tolerance)
-    uniq = []
-    for x, y in pts:
-        k = (round(x, 9), round(y, 9))
-        if k not in [(round(px, 9), round(py, 9)) for px, py in uniq]:
-            uniq.append((x, y))
-
-    if len(uniq) < 2:
-        return None
-
-    # Sort and return two extreme points for a stable, full-span segment
-    uniq.sort()
-    return uniq[0], uniq[-1]
-
-
-def add_full_span_line(fig, alpha, beta, name, xmin, xmax, ymin, ymax, width=3):
-    """
-    Plot P = alpha + beta*Q as a long segment that continues when you pan/zoom.
-    Use a very wide domain instead of clipping to the initial box.
-    """
-    m, b = beta, alpha
-    span = max(xmax - xmin, ymax - ymin, 10) * 100  # big span
-    x0 = -span
-    x1 = span
-    y0 = m * x0 + b
-    y1 = m * x1 + b
-    fig.add_scatter(x=[x0, x1], y=[y0, y1], mode="lines",
-                    name=name, line=dict(width=width))
-
+from apps.common import Line, base_fig, add_point, intersect, add_full_span_line
 
 # ---------- App ----------
 def app():
@@ -98,16 +42,8 @@ def app():
         show_grid = st.toggle("Show grid", value=True, key="show_grid")
 
     # ---- Figure ----
-    fig = base_fig(xmax=xmax, ymax=ymax)
-
-    # Ensure our box is exactly what the helper expects
-    fig.update_xaxes(range=[xmin, xmax], title="Quantity (Q)")
-    fig.update_yaxes(range=[ymin, ymax], title="Price (P)")
-
-    # Grid + background (clean & readable)
-    fig.update_xaxes(showgrid=show_grid, gridwidth=1, gridcolor="rgba(0,0,0,0.12)", zeroline=False, ticks="outside")
-    fig.update_yaxes(showgrid=show_grid, gridwidth=1, gridcolor="rgba(0,0,0,0.12)", zeroline=False, ticks="outside")
-    fig.update_layout(plot_bgcolor="white", paper_bgcolor="white")
+    # Cached layout for this box + grid setting; only the traces change per rerun
+    fig = base_fig(xmax=xmax, ymax=ymax, show_grid=show_grid)
 
     # Full-span lines (touch edges)
     if not hide_d:
@@ -0,0 +1,131 @@
+# benchmarks/import_budget.py — cold-start import budget for every registered page
+#
+#   python benchmarks/import_budget.py                 # check all pages against import_budget.json
+#   python benchmarks/import_budget.py --no-render     # import times only (fast)
+#   python benchmarks/import_budget.py --json out.json # also write the measurements
+#
+# Each page is imported in a fresh interpreter under `-X importtime`, after
+# streamlit and numpy (every worker pays for those anyway), so the number is
+# what the page itself adds to a cold worker. With rendering on, the page is
+# then run once through AppTest and the heavy libraries left in sys.modules
+# are checked against the page's group (micro pages must not pull in
+# matplotlib, macro pages must not build plotly figures). Every page must also
+# expose a callable entry point; the app itself only checks at startup that
+# the modules exist (registry.check_pages), so that pages still load lazily.
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from apps.registry import REGISTRY  # noqa: E402
+
+BUDGET_FILE = Path(__file__).with_name("import_budget.json")
+HEAVY = ("matplotlib", "pandas", "plotly.graph_objs._figure", "apps.common")
+
+_PROBE = """
+import sys, json
+import streamlit, numpy
+import {module}
+entry = callable(getattr(sys.modules[{module!r}], {attr!r}, None))
+imported = sorted(m for m in sys.modules if m.startswith({heavy!r}))
+rendered = None
+if {render}:
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_string(
+        "import sys\\nsys.path.insert(0, {root!r})\\n"
+        "from apps.registry import PAGES, render\\nrender(PAGES[{title!r}])\\n",
+        default_timeout=120,
+    ).run()
+    if at.exception:
+        print(json.dumps({{"error": at.exception[0].message}}))
+        raise SystemExit(0)
+    rendered = sorted(m for m in sys.modules if m.startswith({heavy!r}))
+print(json.dumps({{"entry": entry, "imported": imported, "rendered": rendered}}))
+"""
+
+
+def parse_importtime(stderr, module):
+    """Cumulative import time (ms) of `module` from `-X importtime` output."""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1e3
+    return 0.0   # already imported by the baseline
+
+
+def measure(title, module, attr="app", render=True):
+    code = _PROBE.format(module=module, attr=attr, heavy=HEAVY, render=render, root=str(ROOT), title=title)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1]}
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["import_ms"] = parse_importtime(proc.stderr, module)
+    return result
+
+
+def group_of(heading, budget):
+    for name, group in budget["groups"].items():
+        if heading.startswith(tuple(group["headings"])):
+            return name, group
+    raise KeyError(f"No budget group for {heading!r}")
+
+
+def _loaded(modules, prefixes):
+    return sorted({p for p in prefixes for m in modules if m == p or m.startswith(p + ".")})
+
+
+def check(module, heading, result, budget):
+    """List of budget violations for one page."""
+    if "error" in result:
+        return [f"failed: {result['error']}"]
+    _, group = group_of(heading, budget)
+    problems = [] if result["entry"] else ["no callable entry point"]
+    limit = budget["pages"].get(module, {}).get("import_ms", group["import_ms"])
+    if result["import_ms"] > limit:
+        problems.append(f"import {result['import_ms']:.0f} ms > budget {limit} ms")
+    for lib in _loaded(result["imported"], budget["forbid_at_import"]):
+        problems.append(f"imports {lib} at module load")
+    allowed = set(budget["pages"].get(module, {}).get("allow", []))
+    if result["rendered"] is not None:
+        for lib in _loaded(result["rendered"], group["forbid"]):
+            if lib not in allowed:
+                problems.append(f"loads {lib} while rendering")
+    return problems
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Cold-start import budget per page")
+    ap.add_argument("--no-render", action="store_true", help="skip the AppTest render check")
+    ap.add_argument("--pages", nargs="*", help="only these module paths (e.g. apps.is_lm)")
+    ap.add_argument("--json", type=Path, help="write measurements to this file")
+    args = ap.parse_args(argv)
+
+    budget = json.loads(BUDGET_FILE.read_text())
+    rows, failed = [], 0
+    for heading, pages in REGISTRY.items():
+        for page in pages:
+            if args.pages and page.module not in args.pages:
+                continue
+            result = measure(page.title, page.module, page.attr, render=not args.no_render)
+            problems = check(page.module, heading, result, budget)
+            failed += bool(problems)
+            rows.append({"title": page.title, "module": page.module,
+                         "group": group_of(heading, budget)[0], **result, "problems": problems})
+            status = "FAIL" if problems else "ok"
+            print(f"{status:4}  {result.get('import_ms', float('nan')):7.1f} ms  {page.module:28} {'; '.join(problems)}")
+
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2))
+    print(f"\n{len(rows) - failed}/{len(rows)} pages within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# benchmarks/load_test.py — concurrent-session load test for every page
+#
+#   python benchmarks/load_test.py                          # 8 sessions x 10 reruns per page, JSON to stdout
+#   python benchmarks/load_test.py -n 30 -r 20 --out load.json
+#   python benchmarks/load_test.py --pages "IS–LM" "Solow Model"
+#
+# For each page listed in the registry (the table streamlit_app.MODULES is
+# built from), N simulated students open the app through streamlit_app.py in
+# their own AppTest session, land on the page, then each moves R random
+# sliders / number inputs (values snapped to the widget's step). Sessions run
+# in threads of this one process, the way a single Streamlit worker serves
+# them, so shared caches behave as in production. AppTest installs a global
+# runtime for each run, so script runs are serialized behind RUN_LOCK; for the
+# CPU-bound pages this is close to what the GIL does to a real worker anyway.
+#
+# Per page the JSON report gives percentiles of the rerun response time
+# (queueing + run, what a student waits) and service time (the run alone),
+# the first (cold) render, throughput, process CPU time and peak RSS while the
+# page was under load. The exit status is 1 if any session raised.
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from apps.registry import REGISTRY  # noqa: E402
+
+APP_FILE = str(ROOT / "streamlit_app.py")
+RUN_LOCK = threading.Lock()
+
+
+def rss_mb():
+    """Current resident set size of this process in MB (Linux /proc; else peak so far)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+class RSSSampler(threading.Thread):
+    """Background thread that tracks the peak RSS between start() and stop()."""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss_mb()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            self.peak = max(self.peak, rss_mb())
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self.peak = max(self.peak, rss_mb())
+        return self.peak
+
+
+def _random_value(widget, rng):
+    lo, hi, step = widget.min, widget.max, widget.step or 1
+    value = lo + step * rng.randint(0, max(int(round((hi - lo) / step)), 0))
+    return type(widget.value)(min(value, hi))
+
+
+def _movable(at):
+    """Enabled single-value sliders and bounded number inputs on the current page."""
+    return [w for w in list(at.slider) + list(at.number_input)
+            if not w.disabled and isinstance(w.value, (int, float))
+            and w.min is not None and w.max is not None]
+
+
+def _timed_run(at):
+    """Run the script; returns (response_ms, service_ms)."""
+    t_request = time.perf_counter()
+    with RUN_LOCK:
+        t_start = time.perf_counter()
+        at.run()
+    t_end = time.perf_counter()
+    return (t_end - t_request) * 1e3, (t_end - t_start) * 1e3
+
+
+def run_session(title, reruns, seed, timeout, out):
+    """One student: open the page, then move `reruns` random widgets."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    at.session_state["nav_default"] = title
+    out["first_ms"].append(_timed_run(at)[0])
+    if at.exception:
+        out["errors"].append(at.exception[0].message)
+        return
+    for _ in range(reruns):
+        widgets = _movable(at)
+        if widgets:
+            w = rng.choice(widgets)
+            w.set_value(_random_value(w, rng))
+        response, service = _timed_run(at)
+        out["rerun_ms"].append(response)
+        out["service_ms"].append(service)
+        if at.exception:
+            out["errors"].append(at.exception[0].message)
+            return
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+    a = np.asarray(samples)
+    return {"p50": float(np.percentile(a, 50)), "p95": float(np.percentile(a, 95)),
+            "p99": float(np.percentile(a, 99)), "max": float(a.max()), "mean": float(a.mean())}
+
+
+def load_page(module, title, sessions, reruns, seed, timeout):
+    keys = ("first_ms", "rerun_ms", "service_ms", "errors")
+    per_session = [{k: [] for k in keys} for _ in range(sessions)]
+
+    def worker(i):
+        try:
+            run_session(title, reruns, seed * 1000 + i, timeout, per_session[i])
+        except Exception as e:   # harness-level failure (timeout, widget API) counts as an error
+            per_session[i]["errors"].append(f"{type(e).__name__}: {e}")
+
+    rss0 = rss_mb()
+    sampler = RSSSampler()
+    sampler.start()
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(sessions)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+    peak = sampler.stop()
+
+    out = {k: [x for s in per_session for x in s[k]] for k in keys}
+    runs = len(out["first_ms"]) + len(out["rerun_ms"])
+    return {
+        "module": module,
+        "title": title,
+        "sessions": sessions,
+        "runs": runs,
+        "errors": len(out["errors"]),
+        "first_error": out["errors"][0] if out["errors"] else None,
+        "rerun_ms": _percentiles(out["rerun_ms"]),
+        "service_ms": _percentiles(out["service_ms"]),
+        "first_render_ms": _percentiles(out["first_ms"]),
+        "wall_s": wall,
+        "throughput_rps": runs / wall if wall else None,
+        "cpu_s": cpu,
+        "cpu_util": cpu / wall if wall else None,
+        "rss_start_mb": rss0,
+        "peak_rss_mb": peak,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Concurrent-session load test over every registered page")
+    ap.add_argument("-n", "--sessions", type=int, default=8, help="concurrent sessions per page")
+    ap.add_argument("-r", "--reruns", type=int, default=10, help="random widget moves per session")
+    ap.add_argument("--pages", nargs="*", help="only these page titles")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--timeout", type=float, default=120.0, help="per-run AppTest timeout (s)")
+    ap.add_argument("--out", type=Path, help="write the JSON report here instead of stdout")
+    args = ap.parse_args(argv)
+
+    import streamlit
+    report = {
+        "meta": {
+            "started": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "sessions": args.sessions,
+            "reruns": args.reruns,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "platform": platform.platform(),
+        },
+        "pages": [],
+    }
+    for module, pages in REGISTRY.items():
+        for page in pages:
+            if args.pages and page.title not in args.pages:
+                continue
+            row = load_page(module, page.title, args.sessions, args.reruns, args.seed, args.timeout)
+            report["pages"].append(row)
+            lat = row["rerun_ms"] or {"p50": float("nan"), "p95": float("nan"), "p99": float("nan")}
+            print(f"{page.title:40} p50 {lat['p50']:7.1f}  p95 {lat['p95']:7.1f}  p99 {lat['p99']:7.1f} ms  "
+                  f"cpu {row['cpu_s']:6.1f} s  peak {row['peak_rss_mb']:6.0f} MB  errors {row['errors']}",
+                  file=sys.stderr, flush=True)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text)
+    else:
+        print(text)
+    return 1 if any(row["errors"] for row in report["pages"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+# benchmarks/micro.py — microbenchmarks for models/ and the market-page geometry
+#
+#   python benchmarks/micro.py                 # run everything against the reference revisions
+#   python benchmarks/micro.py --quick         # realistic sizes only
+#   python benchmarks/micro.py -k nk           # cases whose name contains "nk"
+#   python benchmarks/micro.py --ref HEAD~1    # compare every case with one revision instead
+#   python benchmarks/micro.py --json out.json # also write the measurements
+#
+# Every case runs with memoization switched off (models.memo.memoization), so
+# the numbers are the cost of the model code itself, not of a cache hit. The
+# exception is simulate_hank, which is timed on a warm steady state because the
+# page never rebuilds the model between reruns; the build has its own case.
+#
+# No timings are stored: absolute numbers do not carry across machines, or
+# even across an afternoon on a shared one. micro_reference.json names, per
+# case, the git revision it is compared with; that tree is exported with
+# `git archive` and timed in the same run, on the same machine. Each of
+# --rounds rounds times the working tree and every reference tree in a fresh
+# interpreter, alternating which goes first, and records the median time per
+# call over --repeats batches. A case's slowdown is the median over rounds of
+# the paired ratio (working tree / reference), so drift in machine speed
+# cancels, and one noisy round cannot fail the gate. A case over its
+# tolerance is timed again in --confirm fresh sets of rounds and only
+# regresses if every set's median is still over it. Sub-millisecond cases,
+# where timer and interpreter noise are relatively largest, get the wider
+# "tolerance_fast"; "tolerances" overrides single cases. A regression makes
+# the exit status 1.
+import argparse
+import contextlib
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+REFERENCE_FILE = Path(__file__).with_name("micro_reference.json")
+
+# Modules under test, imported by _load() from the tree being measured; a
+# module missing there stays None and the cases using it are skipped.
+common = hank = is_lm = memo = nk = phillips = solow = None
+_MODULES = {"common": "apps.common", "hank": "models.hank", "is_lm": "models.is_lm", "memo": "models.memo",
+            "nk": "models.nk_blocks", "phillips": "models.phillips", "solow": "models.solow"}
+
+
+def _load(root):
+    sys.path.insert(0, str(root))
+    for alias, name in _MODULES.items():
+        try:
+            globals()[alias] = importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+@dataclass
+class Case:
+    name: str
+    size: str
+    fn: object
+    stress: bool = False
+    memo: bool = False      # keep memoization on (only for warm-model cases)
+
+    @property
+    def key(self):
+        return f"{self.name}[{self.size}]"
+
+
+def nkpc_loop(T, y_gap=1.0, u=0.5, decay=0.6, shock_t=3):
+    """The Phillips-curve page's inner loops."""
+    p = phillips.NKPCParams()
+    shocks = np.zeros(T)
+    shocks[shock_t] = u
+    for t in range(1, T):
+        shocks[t] += decay * shocks[t - 1]
+    pi = np.zeros(T)
+    for t in range(1, T):
+        pi[t] = phillips.nkpc_next(pi[t - 1], y_gap, shocks[t], p)
+    return pi
+
+
+def intersect_many(n):
+    D, S = common.Line(a=30.0, b=-0.2), common.Line(a=5.0, b=0.1)
+    for _ in range(n):
+        common.intersect(D, S)
+
+
+_rng = np.random.default_rng(0)
+S_GRID = np.linspace(0.05, 0.6, 1000)
+G_BATCH = _rng.uniform(50, 400, 100_000)
+LINES = _rng.uniform(-1, 1, (4, 1_000_000))
+
+
+@lru_cache(maxsize=None)
+def nk_sweep():
+    return [nk.NKParams(phi_pi=1.1 + 0.01 * i) for i in range(200)]
+
+
+@lru_cache(maxsize=None)
+def hank_params():
+    return hank.HANKParams()
+
+
+CASES = [
+    Case("solow.simulate_path", "T=120", lambda: solow.simulate_path(2.0, 120, solow.SolowParams())),
+    Case("solow.simulate_path", "T=20000", lambda: solow.simulate_path(2.0, 20_000, solow.SolowParams()),
+         stress=True),
+    Case("solow.simulate_paths", "N=1000,T=300",
+         lambda: solow.simulate_paths(2.0, 300, S_GRID, 0.05, 0.01, 0.02, 0.33), stress=True),
+    Case("is_lm.solve_equilibrium", "n=400", lambda: is_lm.solve_equilibrium(is_lm.ISLMParams())),
+    Case("is_lm.solve_equilibrium", "n=200000", lambda: is_lm.solve_equilibrium(is_lm.ISLMParams(), n=200_000),
+         stress=True),
+    Case("is_lm.equilibrium", "batch=100000", lambda: is_lm.equilibrium(is_lm.ISLMParams(g=G_BATCH)), stress=True),
+    Case("nk.simulate_nk", "T=40", lambda: nk.simulate_nk(40, 1, -1.0, 0.0, 0.0, nk.NKParams())),
+    Case("nk.simulate_nk", "T=5000", lambda: nk.simulate_nk(5000, 1, -1.0, 0.5, 0.2, nk.NKParams()), stress=True),
+    Case("nk.simulate_nk", "sweep=200", lambda: [nk.simulate_nk(40, 1, -1.0, 0.0, 0.0, p) for p in nk_sweep()],
+         stress=True),
+    # Unwrapped, so only the inner get_model() hits its cache: the warm steady state
+    Case("hank.simulate_hank", "T=40,warm", lambda: hank.simulate_hank.__wrapped__(40, 1, -2.0, 1.0, hank_params()),
+         memo=True),
+    Case("hank.get_model", "n_a=200,T=200", lambda: hank.get_model(hank_params()), stress=True),
+    Case("phillips.nkpc_loop", "T=80", lambda: nkpc_loop(80)),
+    Case("phillips.nkpc_loop", "T=100000", lambda: nkpc_loop(100_000), stress=True),
+    Case("common.intersect", "1 pair", lambda: intersect_many(1)),
+    Case("common.intersect", "10000 calls", lambda: intersect_many(10_000), stress=True),
+    Case("common.intersect_lines", "1e6 pairs", lambda: common.intersect_lines(*LINES), stress=True),
+]
+
+
+def measure(fn, min_time=0.2, repeats=5):
+    """Median and best seconds per call over `repeats` batches of at least `min_time` each."""
+    t0 = time.perf_counter()
+    fn()                                   # warm-up, also sizes the batches
+    single = time.perf_counter() - t0
+    loops = max(1, int(min_time / max(single, 1e-9)))
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - t0) / loops)
+    return statistics.median(samples), min(samples), loops
+
+
+def run_case(case, min_time, repeats):
+    off = memo is not None and not case.memo
+    with memo.memoization(False) if off else contextlib.nullcontext():
+        return measure(case.fn, min_time, repeats)
+
+
+def export(rev, dest):
+    """Write the tree of git revision `rev` into `dest`."""
+    tar = Path(dest) / "src.tar"
+    subprocess.run(["git", "-C", str(ROOT), "archive", "--format=tar", "-o", str(tar), rev], check=True)
+    with tarfile.open(tar) as archive:
+        archive.extractall(dest, filter="data")
+
+
+def worker(root, keys, min_time, repeats):
+    """Median seconds per call of each case in the tree at `root`; None where its API is missing."""
+    _load(root)
+    out = {}
+    for case in CASES:
+        if case.key not in keys:
+            continue
+        try:
+            out[case.key] = run_case(case, min_time, repeats)[0]
+        except (AttributeError, TypeError):
+            if Path(root) == ROOT:
+                raise
+            out[case.key] = None
+    return out
+
+
+def _time_tree(root, keys, args):
+    cmd = [sys.executable, __file__, "--worker", str(root), "--cases", json.dumps(sorted(keys)),
+           "--min-time", str(args.min_time), "--repeats", str(args.repeats)]
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def paired_rounds(keys, refs, trees, args):
+    """
+    --rounds rounds over the working tree and the reference trees of `keys`,
+    alternating which goes first. Returns {key: (working-tree medians,
+    reference medians)}, one entry per round (None where the reference lacks
+    the case).
+    """
+    runs = {"": keys, **{rev: [k for k in keys if refs[k] == rev] for rev in set(refs[k] for k in keys)}}
+    times = {name: [] for name in runs}
+    for r in range(args.rounds):
+        for name in (list(runs) if r % 2 == 0 else list(runs)[::-1]):
+            times[name].append(_time_tree(trees[name], runs[name], args))
+        print(f"round {r + 1}/{args.rounds} done", file=sys.stderr, flush=True)
+    return {k: ([t[k] for t in times[""]], [t[k] for t in times[refs[k]]]) for k in keys}
+
+
+def _ratio(mine, theirs):
+    """Median over rounds of the paired slowdown, or None without a reference."""
+    if any(t is None for t in theirs):
+        return None
+    return statistics.median(a / b for a, b in zip(mine, theirs))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Microbenchmarks for models/, timed against reference revisions")
+    ap.add_argument("--quick", action="store_true", help="skip the stress sizes")
+    ap.add_argument("-k", dest="filter", help="only cases whose name contains this string")
+    ap.add_argument("--ref", help="compare every case with this git revision")
+    ap.add_argument("--rounds", type=int, default=5, help="paired rounds per tree (default 5)")
+    ap.add_argument("--confirm", type=int, default=2,
+                    help="fresh sets of rounds a slowdown must repeat in before it counts (default 2)")
+    ap.add_argument("--min-time", type=float, default=0.05, help="seconds per timing batch")
+    ap.add_argument("--repeats", type=int, default=5, help="timing batches per case and round")
+    ap.add_argument("--json", type=Path, help="write the measurements to this file")
+    ap.add_argument("--worker", help=argparse.SUPPRESS)
+    ap.add_argument("--cases", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, set(json.loads(args.cases)), args.min_time, args.repeats)))
+        return 0
+
+    config = json.loads(REFERENCE_FILE.read_text())
+    cases = [c for c in CASES if not (args.quick and c.stress) and not (args.filter and args.filter not in c.name)]
+    refs = {c.key: args.ref or config["reference"].get(c.key, config["default"]) for c in cases}
+    keys = [c.key for c in cases]
+
+    def tolerance(key, ref_median):
+        default = config["tolerance_fast"] if ref_median < config["fast_s"] else config["tolerance"]
+        return config.get("tolerances", {}).get(key, default)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trees = {"": ROOT}
+        for rev in sorted(set(refs.values())):
+            trees[rev] = Path(tmp) / rev.replace("/", "_")
+            trees[rev].mkdir()
+            export(rev, trees[rev])
+        rounds = paired_rounds(keys, refs, trees, args)
+        ratios = {k: _ratio(*rounds[k]) for k in keys}
+        limits = {k: tolerance(k, statistics.median(rounds[k][1])) for k in keys if ratios[k] is not None}
+        suspects = [k for k in limits if ratios[k] > 1 + limits[k]]
+        for _ in range(args.confirm):
+            if not suspects:
+                break
+            again = paired_rounds(suspects, refs, trees, args)
+            for k in suspects:
+                rounds[k] = tuple(old + new for old, new in zip(rounds[k], again[k]))
+            suspects = [k for k in suspects if _ratio(*again[k]) > 1 + limits[k]]
+
+    results, regressions = {}, []
+    for key in keys:
+        mine, theirs = rounds[key]
+        median = statistics.median(mine)
+        row = {"median_s": median, "ref": refs[key], "rounds": len(mine)}
+        note = f"no reference at {refs[key]}"
+        if ratios[key] is not None:
+            ratio, ref_median = _ratio(mine, theirs), statistics.median(theirs)
+            row.update(ref_median_s=ref_median, ratio=ratio, tolerance=limits[key])
+            note = f"ref {ref_median * 1e3:10.3f} ms @ {refs[key]:8}  x{ratio:5.2f}"
+            if key in suspects:
+                regressions.append(key)
+                note += f"  REGRESSION (> {1 + limits[key]:.2f} in {args.confirm + 1} sets of rounds)"
+            elif len(mine) > args.rounds:
+                note += "  (not confirmed)"
+        results[key] = row
+        print(f"{key:40} {median * 1e3:10.3f} ms/call  {note}", flush=True)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
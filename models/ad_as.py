@@ -1,13 +1,24 @@
 import numpy as np
 from dataclasses import dataclass
 
+from models.memo import memoize
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ADASParams(Params):
+    a: float = param(100.0, step=0.01)           # demand intercept
+    b: float = param(1.0, step=0.05)             # demand slope (Y = a - b*P)
+    y_star: float = param(100.0, step=0.01)      # potential output (LRAS)
+    sras_slope: float = param(0.5, step=0.05)    # SRAS slope
+    p_expected: float = param(100.0, step=0.01)  # expected price level
+
+
 @dataclass
-class ADASParams:
-    a: float = 100.0  # demand intercept
-    b: float = 1.0    # demand slope (Y = a - b*P)
-    y_star: float = 100.0  # potential output (LRAS)
-    sras_slope: float = 0.5  # SRAS slope
-    p_expected: float = 100.0  # expected price level
+class ADASPath:
+    P: np.ndarray    # (N, T) price level
+    Y: np.ndarray    # (N, T) output
+    Pe: np.ndarray   # (N, T) expected price level
+    P_lr: np.ndarray # (N, T) long-run price where AD meets LRAS
 
 
 def ad_curve(P: np.ndarray, p: ADASParams):
@@ -20,4 +31,68 @@ def sras_curve(P: np.ndarray, p: ADASParams):
 
 
 def lras_value(p: ADASParams):
-    return p.y_star
\ No newline at end of file
+    return p.y_star
+
+
+def equilibrium(p: ADASParams):
+    """
+    Exact AD–SRAS intersection (fields may be arrays):
+        P = (a - y* + s·Pe) / (b + s),   Y = a - b·P
+    """
+    P = (p.a - p.y_star + p.sras_slope * p.p_expected) / (p.b + p.sras_slope)
+    return P, p.a - p.b * P
+
+
+def price_grid(p: ADASParams, n: int = 400):
+    """Price levels for drawing AD/SRAS: 50–150, widened to contain P* and the long-run price."""
+    P_eq, _ = equilibrium(p)
+    P_lr = (p.a - p.y_star) / p.b
+    lo, hi = 50.0, 150.0
+    finite = [float(v) for v in (P_eq, P_lr) if np.isfinite(v)]
+    if finite:
+        lo, hi = min(lo, min(finite) - 10.0), max(hi, max(finite) + 10.0)
+    return np.linspace(lo, hi, n)
+
+
+@memoize(maxsize=256)
+def adjustment_path(p: ADASParams, T: int, da=0.0, du=0.0, *, t_shock: int = 1,
+                    rho: float = 1.0, expectations: str = "adaptive", lam: float = 0.5) -> ADASPath:
+    """
+    Multi-period adjustment back to y* after an AD shock da (to the intercept a,
+    decaying at rate rho; rho = 1 is permanent) and/or a one-time cost-push
+    shock du that raises the SRAS position Pe by du at t_shock. da and du may be
+    arrays: each entry is one scenario and all scenarios advance together.
+
+    Both rules start from the same long-run baseline, Pe = (a - y*)/b, where the
+    economy sits on LRAS before the shock; p_expected (the SRAS position in the
+    static diagram) does not enter the paths.
+    expectations="adaptive": Pe_{t+1} = Pe_t + lam·(P_t - Pe_t).
+    expectations="rational": Pe_t = E_{t-1}[P_t] = (E_{t-1} a_t - y*)/b; both shocks are
+    surprises on impact and the economy is back on LRAS from the next period.
+    """
+    da, du = np.broadcast_arrays(np.atleast_1d(np.asarray(da, dtype=float)),
+                                 np.atleast_1d(np.asarray(du, dtype=float)))
+    N = da.size
+    steps = np.arange(T) - t_shock
+    decay = np.where(steps >= 0, float(rho) ** np.maximum(steps, 0), 0.0)
+    a_t = p.a + da[:, None] * decay[None, :]
+    s, b = p.sras_slope, p.b
+    hit = (steps == 0)[None, :]
+
+    if expectations == "rational":
+        a_known = np.where((steps >= 1)[None, :], a_t, p.a)
+        Pe = (a_known - p.y_star) / b + np.where(hit, du[:, None], 0.0)
+    elif expectations == "adaptive":
+        Pe = np.empty((N, T))
+        pe = np.full(N, (p.a - p.y_star) / b)
+        for t in range(T):
+            if t == t_shock:
+                pe = pe + du
+            Pe[:, t] = pe
+            P_t = (a_t[:, t] - p.y_star + s * pe) / (b + s)
+            pe = pe + lam * (P_t - pe)
+    else:
+        raise ValueError(f"Unknown expectations rule: {expectations!r}")
+
+    P = (a_t - p.y_star + s * Pe) / (b + s)
+    return ADASPath(P=P, Y=a_t - b * P, Pe=Pe, P_lr=(a_t - p.y_star) / b)
@@ -0,0 +1,357 @@
+# models/batch.py — headless runner: a file of parameter rows in, model results out
+#
+#   python -m models.batch --list
+#   python -m models.batch solow params.csv -o paths.csv --horizon 100
+#   python -m models.batch is_lm grid.jsonl -o eq.npz --chunk 5000 --workers 4
+#   python -m models.batch hank shocks.csv -o irfs.npz --horizon 40
+#
+# Input is CSV with a header row or JSON Lines, one scenario per row (a plain
+# JSON array also works but is read whole). Columns name fields of the model's
+# Params class and its run arguments (see --list); missing columns and empty
+# cells take the defaults, unknown columns and non-integral values for integer
+# columns are errors. Every row is checked before any is solved, a row the
+# model cannot solve is reported by number, and the output only appears once
+# the whole run has succeeded (it is written beside the target and renamed
+# over it).
+# Output is CSV (per scenario: the resolved inputs, scalar results, and path
+# results as name_0 … name_{H-1}) or NPZ (inputs under "inputs/<name>", one
+# array per result, first axis = input row).
+# Rows are read and solved in chunks on a process pool with a bounded number of
+# chunks in flight and written in input order, so memory use does not depend
+# on the size of the input; NPZ arrays are assembled in disk-backed memmaps.
+import argparse
+import csv
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+import numpy as np
+
+from models import ad_as, fiscal, hank, hank_teaser, is_lm, nk_blocks, phillips, solow, trade
+
+
+@dataclass(frozen=True)
+class Spec:
+    params: type     # Params subclass; its fields are input columns
+    args: dict       # extra per-row inputs -> default
+    run: object      # (params of column arrays, args of column arrays, horizon) -> {name: array}
+    doc: str
+
+
+def _per_row(p, args):
+    """Scalar Params and argument values for each row of a chunk."""
+    names = [f.name for f in fields(p)]
+    n = len(next(iter(args.values()))) if args else len(getattr(p, names[0]))
+    for j in range(n):
+        row = type(p)(**{name: getattr(p, name)[j].item() for name in names})
+        yield row, {k: v[j].item() for k, v in args.items()}
+
+
+def _stack(results, names):
+    return {name: np.stack([r[k] for r in results]) for k, name in enumerate(names)}
+
+
+def _solow(p, args, H):
+    b = solow.simulate_paths(args["k0"], H, p.s, p.delta, p.n, p.g, p.alpha)
+    return {"k": b.k, "y": b.y, "k_star": b.k_star, "y_star": b.y_star, "half_life": b.half_life}
+
+
+def _is_lm(p, args, H):
+    eq = is_lm.equilibrium(p)
+    return {"r": eq.r, "Y": eq.Y, "fiscal_multiplier": eq.fiscal_multiplier, "money_multiplier": eq.money_multiplier}
+
+
+def _ad_as(p, args, H):
+    out = []
+    for row, a in _per_row(p, args):
+        path = ad_as.adjustment_path(row, H, a["da"], a["du"], t_shock=a["t_shock"], rho=a["rho"], lam=a["lam"])
+        out.append((path.P[0], path.Y[0], path.Pe[0]))
+    return _stack(out, ("P", "Y", "Pe"))
+
+
+def _nk(p, args, H):
+    out = [nk_blocks.simulate_nk(H, a["shock_t"], a["eps_y"], a["eps_pi"], a["eps_policy"], row)
+           for row, a in _per_row(p, args)]
+    return _stack(out, ("y", "pi", "i"))
+
+
+def _hank(p, args, H):
+    # get_model() is memoized per worker, so rows sharing a calibration solve it once
+    out = [hank.simulate_hank(H, a["t_shock"], a["dY_transitory"], a["dI_pp"], row, news=a["news"])
+           for row, a in _per_row(p, args)]
+    return _stack(out, ("dC_income", "dC_rate", "dY", "dB"))
+
+
+def _hank_teaser(p, args, H):
+    out = [hank_teaser.simulate_hank(H, a["t_shock"], a["dY_transitory"], a["dI_pp"], row)
+           for row, a in _per_row(p, args)]
+    return _stack(out, ("dC_htm", "dC_saver", "dC", "dY"))
+
+
+def _phillips(p, args, H):
+    # nkpc_next is elementwise, so all rows advance together
+    n = args["u"].size
+    shocks = np.zeros((n, H))
+    hit = (args["shock_t"] >= 0) & (args["shock_t"] < H)
+    shocks[np.flatnonzero(hit), args["shock_t"][hit]] = args["u"][hit]
+    pi = np.zeros((n, H))
+    pi[:, 0] = args["pi0"]
+    for t in range(1, H):
+        shocks[:, t] += args["decay"] * shocks[:, t - 1]
+        pi[:, t] = phillips.nkpc_next(pi[:, t - 1], args["y_gap"], shocks[:, t], p)
+    return {"pi": pi}
+
+
+def _fiscal(p, args, H):
+    return {"debt": fiscal.debt_paths(H, p)}
+
+
+def _dfs(p, args, H):
+    eq = trade.dfs_equilibrium(p)
+    return {"omega": eq.omega, "z_bar": eq.z_bar, "gains_home": eq.gains_home, "gains_foreign": eq.gains_foreign}
+
+
+MODELS = {
+    "solow": Spec(solow.SolowParams, {"k0": 1.0}, _solow, "Solow transition paths k, y and steady state"),
+    "is_lm": Spec(is_lm.ISLMParams, {}, _is_lm, "IS–LM equilibrium r*, Y* and multipliers"),
+    "ad_as": Spec(ad_as.ADASParams, {"da": 0.0, "du": 0.0, "t_shock": 1, "rho": 1.0, "lam": 0.5}, _ad_as,
+                  "AD–AS adjustment paths (adaptive expectations)"),
+    "nk": Spec(nk_blocks.NKParams, {"shock_t": 1, "eps_y": 0.0, "eps_pi": 0.0, "eps_policy": 0.0}, _nk,
+               "NK impulse responses y, π, i"),
+    "hank": Spec(hank.HANKParams, {"t_shock": 0, "dY_transitory": 0.0, "dI_pp": 0.0, "news": False}, _hank,
+                 "One-asset HANK responses to transfers and rate shocks"),
+    "hank_teaser": Spec(hank_teaser.HANKTeaserParams, {"t_shock": 1, "dY_transitory": 0.0, "dI_pp": 0.0},
+                        _hank_teaser, "Reduced-form HANK teaser responses"),
+    "phillips": Spec(phillips.NKPCParams, {"pi0": 0.0, "y_gap": 0.0, "u": 0.0, "decay": 0.6, "shock_t": 3},
+                     _phillips, "NKPC inflation path after a decaying cost-push shock"),
+    "fiscal": Spec(fiscal.FiscalParams, {}, _fiscal, "Debt/GDP paths"),
+    "dfs": Spec(trade.DFSParams, {}, _dfs, "Continuum-of-goods trade: relative wage, cutoff good, gains"),
+}
+
+
+def columns(spec):
+    """Input column -> default, Params fields first."""
+    return {**{f.name: f.default for f in fields(spec.params)}, **spec.args}
+
+
+def _parse(value, default):
+    if value is None or value == "":
+        return default
+    if isinstance(default, bool):
+        return value if isinstance(value, bool) else str(value).strip().lower() in ("1", "true", "yes")
+    try:
+        x = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{value!r} is not a number") from None
+    if isinstance(default, int):
+        if not x.is_integer():
+            raise ValueError(f"{value!r} is not an integer")
+        return int(x)
+    return x
+
+
+def run_chunk(model, rows, horizon, start=0):
+    """
+    Solve one chunk of raw rows (dicts of strings or JSON values); runs in a
+    worker. If the model fails on the chunk, its rows are solved one by one
+    to name the first failing row (numbered from 1, `start` rows before it).
+    """
+    try:
+        return _solve(model, rows, horizon)
+    except Exception as e:
+        if len(rows) == 1:
+            raise ValueError(f"row {start + 1}: {type(e).__name__}: {e}") from None
+        for i, row in enumerate(rows):
+            run_chunk(model, [row], horizon, start + i)
+        raise
+
+
+def _solve(model, rows, horizon):
+    spec = MODELS[model]
+    cols = columns(spec)
+    inputs = {name: np.array([_parse(r.get(name), d) for r in rows]) for name, d in cols.items()}
+    p = spec.params(**{f.name: inputs[f.name] for f in fields(spec.params)})
+    results = spec.run(p, {k: inputs[k] for k in spec.args}, horizon)
+    n = len(rows)
+    return inputs, {k: np.broadcast_to(np.asarray(v, dtype=float), (n,) + np.shape(v)[1:]) for k, v in results.items()}
+
+
+def read_rows(path: Path):
+    """Stream rows from CSV or JSON Lines (or load a JSON array)."""
+    if path.suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    elif path.suffix in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.suffix == ".json":
+        yield from json.loads(path.read_text(encoding="utf-8"))
+    else:
+        raise SystemExit(f"unsupported input format {path.suffix!r} (use .csv, .jsonl or .json)")
+
+
+def validate(path: Path, known):
+    """Check the columns and values of every row before any work starts; returns the row count."""
+    n = 0
+    for n, row in enumerate(read_rows(path), 1):
+        if None in row:
+            raise ValueError(f"row {n}: more cells than header columns")
+        unknown = set(row) - set(known)
+        if unknown:
+            raise ValueError(f"row {n}: unknown column(s): {', '.join(sorted(unknown))}")
+        for name, value in row.items():
+            try:
+                _parse(value, known[name])
+            except ValueError as e:
+                raise ValueError(f"row {n}: {name}: {e}") from None
+    return n
+
+
+def _partial(path: Path):
+    """An empty temporary file next to `path`, renamed over it when the run succeeds."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    os.close(fd)
+    return Path(tmp)
+
+
+def chunked(rows, size):
+    it = iter(rows)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+class CSVWriter:
+    def __init__(self, path):
+        self.path, self.part = path, _partial(path)
+        self.f = open(self.part, "w", newline="", encoding="utf-8")
+        self.w = csv.writer(self.f)
+        self.header = False
+
+    def write(self, inputs, results):
+        if not self.header:
+            head = list(inputs)
+            for k, v in results.items():
+                head += [k] if v.ndim == 1 else [f"{k}_{t}" for t in range(v.shape[1])]
+            self.w.writerow(head)
+            self.header = True
+        blocks = [v.reshape(len(v), -1) for v in (*inputs.values(), *results.values())]
+        self.w.writerows(np.hstack([b.astype(float) for b in blocks]).tolist())
+
+    def close(self):
+        self.f.close()
+        os.replace(self.part, self.path)
+
+    def discard(self):
+        self.f.close()
+        self.part.unlink(missing_ok=True)
+
+
+class NPZWriter:
+    """Fills one disk-backed .npy per array, then zips them; needs the row count up front."""
+
+    def __init__(self, path, n_rows):
+        self.path, self.n = path, n_rows
+        self.part = _partial(path)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.arrays = {}
+        self.row = 0
+
+    def _array(self, name, block):
+        if name not in self.arrays:
+            file = os.path.join(self.tmp.name, f"{len(self.arrays)}.npy")
+            self.arrays[name] = np.lib.format.open_memmap(file, mode="w+", dtype=block.dtype,
+                                                          shape=(self.n,) + block.shape[1:])
+        return self.arrays[name]
+
+    def write(self, inputs, results):
+        n = len(next(iter(inputs.values())))
+        blocks = {**{f"inputs/{k}": v for k, v in inputs.items()}, **results}
+        for name, block in blocks.items():
+            self._array(name, block)[self.row:self.row + n] = block
+        self.row += n
+
+    def close(self):
+        with zipfile.ZipFile(self.part, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for name, arr in self.arrays.items():
+                arr.flush()
+                with open(arr.filename, "rb") as src, zf.open(f"{name}.npy", "w", force_zip64=True) as dst:
+                    shutil.copyfileobj(src, dst, 2**20)
+        self.arrays.clear()
+        self.tmp.cleanup()
+        os.replace(self.part, self.path)
+
+    def discard(self):
+        self.arrays.clear()
+        self.tmp.cleanup()
+        self.part.unlink(missing_ok=True)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m models.batch",
+                                 description="Run a model over a file of parameter rows")
+    ap.add_argument("model", nargs="?", choices=sorted(MODELS))
+    ap.add_argument("input", nargs="?", type=Path, help=".csv, .jsonl or .json with one scenario per row")
+    ap.add_argument("-o", "--output", type=Path, help=".csv or .npz")
+    ap.add_argument("--horizon", type=int, default=40, help="periods for path outputs (default 40)")
+    ap.add_argument("--chunk", type=int, default=1000, help="rows per task (default 1000)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count(), help="processes; 1 runs inline")
+    ap.add_argument("--list", action="store_true", help="list models and their input columns")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for name, spec in MODELS.items():
+            cols = ", ".join(f"{k}={v}" for k, v in columns(spec).items())
+            print(f"{name:12} {spec.doc}\n{'':12} columns: {cols}")
+        return 0
+    if not (args.model and args.input and args.output):
+        ap.error("model, input and --output are required")
+    if args.output.suffix not in (".csv", ".npz"):
+        ap.error("output must be .csv or .npz")
+
+    try:
+        n_rows = validate(args.input, columns(MODELS[args.model]))
+    except ValueError as e:
+        ap.error(f"{args.input}: {e} (model {args.model})")
+    if n_rows == 0:
+        ap.error(f"{args.input} has no rows")
+
+    if args.output.suffix == ".npz":
+        writer = NPZWriter(args.output, n_rows)
+    else:
+        writer = CSVWriter(args.output)
+    chunks = chunked(read_rows(args.input), args.chunk)
+    try:
+        if args.workers <= 1:
+            for i, chunk in enumerate(chunks):
+                writer.write(*run_chunk(args.model, chunk, args.horizon, i * args.chunk))
+        else:
+            with ProcessPoolExecutor(args.workers) as pool:
+                pending = deque()
+                for i, chunk in enumerate(chunks):
+                    pending.append(pool.submit(run_chunk, args.model, chunk, args.horizon, i * args.chunk))
+                    if len(pending) >= 2 * args.workers:
+                        writer.write(*pending.popleft().result())
+                while pending:
+                    writer.write(*pending.popleft().result())
+    except ValueError as e:      # a row the model could not solve (see run_chunk)
+        writer.discard()
+        ap.error(f"{args.input}: {e} (model {args.model})")
+    except BaseException:
+        writer.discard()
+        raise
+    writer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
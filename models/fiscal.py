@@ -0,0 +1,35 @@
+# models/fiscal.py — stylized multiplier and debt-to-GDP arithmetic
+import numpy as np
+from dataclasses import dataclass
+
+from models.memo import memoize
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FiscalParams(Params):
+    d0: float = param(90.0, step=1.0)       # starting debt/GDP (%)
+    i: float = param(3.0, step=0.1)         # nominal interest rate (%)
+    g: float = param(4.0, step=0.1)         # nominal GDP growth (%)
+    primary: float = param(-3.0, step=0.5)  # primary balance (% of GDP; +surplus / -deficit)
+
+
+def output_after_shock(mult, shock_g, Y0=100.0):
+    """Output index after a spending shock of shock_g % of Y with multiplier mult."""
+    return Y0 * (1 + (mult * shock_g) / 100)
+
+
+@memoize(maxsize=256)
+def debt_paths(T: int, p: FiscalParams) -> np.ndarray:
+    """
+    Debt/GDP paths d_t = (1+i)/(1+g)·d_{t-1} - primary, shape (N, T). Fields may
+    be arrays: they broadcast to N scenarios that advance together.
+    """
+    d0, i, g, primary = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(getattr(p, f), dtype=float)) for f in ("d0", "i", "g", "primary")
+    ))
+    ratio = (1 + i / 100) / (1 + g / 100)
+    D = np.empty((d0.size, T))
+    D[:, 0] = d0
+    for t in range(1, T):
+        D[:, t] = ratio * D[:, t - 1] - primary
+    return D
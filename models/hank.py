@@ -0,0 +1,279 @@
+# models/hank.py — One-asset HANK: EGM household block + sequence-space Jacobians
+import numpy as np
+from dataclasses import dataclass
+
+from models.memo import memoize
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class HANKParams(Params):
+    beta: float = param(0.96, step=0.005)       # discount factor (quarterly)
+    eis: float = param(0.5, step=0.05)          # elasticity of intertemporal substitution
+    r: float = param(0.005)                     # steady-state real rate (quarterly)
+    rho_e: float = param(0.94)                  # persistence of log idiosyncratic income
+    sd_e: float = param(0.5, step=0.05)         # cross-sectional sd of log income
+    a_min: float = param(0.0)                   # borrowing limit
+    phi_b: float = param(0.05, step=0.01)       # tax response to debt (fiscal rule)
+    shock_decay: float = param(0.7, step=0.05)  # AR(1) decay for aggregate shocks
+    n_e: int = param(7)
+    n_a: int = param(200)
+    a_max: float = param(150.0)
+    T: int = param(200)                         # truncation horizon of the Jacobians
+
+
+@dataclass
+class HANKSteadyState:
+    a_grid: np.ndarray
+    e_grid: np.ndarray
+    Pi: np.ndarray        # income transition (n_e, n_e)
+    Va: np.ndarray        # marginal value of assets (n_e, n_a)
+    a_pol: np.ndarray     # a'(e, a)
+    c_pol: np.ndarray     # c(e, a)
+    D: np.ndarray         # stationary histogram (n_e, n_a)
+    A: float              # aggregate assets (= government debt)
+    C: float              # aggregate consumption (= output)
+    mpc: np.ndarray       # quarterly MPC out of a small windfall, per gridpoint
+
+
+@dataclass
+class HANKModel:
+    ss: HANKSteadyState
+    J: dict               # J[output][input]: (T, T) Jacobians, outputs 'C','A', inputs 'Z','r'
+    M_f: np.ndarray       # dY response to the fiscal income impulse f
+    M_r: np.ndarray       # dY response to the real-rate path
+
+
+# ── Income process and grids ────────────────────────────────────────────────
+def rouwenhorst(n: int, rho: float, sd: float):
+    """Rouwenhorst discretization of a log AR(1); returns (e grid with mean 1, Pi, stationary pi)."""
+    p = (1 + rho) / 2
+    Pi = np.array([[p, 1 - p], [1 - p, p]])
+    for m in range(3, n + 1):
+        big = np.zeros((m, m))
+        big[:-1, :-1] += p * Pi
+        big[:-1, 1:] += (1 - p) * Pi
+        big[1:, :-1] += (1 - p) * Pi
+        big[1:, 1:] += p * Pi
+        big[1:-1] /= 2
+        Pi = big
+    pi = np.full(n, 1.0 / n)
+    for _ in range(10_000):
+        pi_new = pi @ Pi
+        if np.max(np.abs(pi_new - pi)) < 1e-14:
+            break
+        pi = pi_new
+    y = np.linspace(-1, 1, n) * sd * np.sqrt(n - 1)
+    e = np.exp(y)
+    return e / (pi @ e), Pi, pi
+
+
+def asset_grid(a_min: float, a_max: float, n: int):
+    """Grid that is dense near the borrowing limit, where policies bend."""
+    return a_min + (a_max - a_min) * np.linspace(0, 1, n) ** 3
+
+
+# ── Household block ─────────────────────────────────────────────────────────
+def _interp_rows(x, xp, fp):
+    """Row-wise linear interpolation (each row of xp is increasing), with linear extrapolation above."""
+    out = np.empty_like(x)
+    for j in range(x.shape[0]):
+        out[j] = np.interp(x[j], xp[j], fp[j])
+        hi = x[j] > xp[j, -1]
+        if hi.any():
+            slope = (fp[j, -1] - fp[j, -2]) / (xp[j, -1] - xp[j, -2])
+            out[j, hi] = fp[j, -1] + slope * (x[j, hi] - xp[j, -1])
+    return out
+
+
+def egm_step(Va_next, Z, r, beta, eis, a_grid, e_grid, Pi, a_min):
+    """
+    One endogenous-grid-method step. Va_next is next period's ∂V/∂a on the grid;
+    returns today's (Va, a', c). Cash on hand is (1+r)a + Z·e.
+    """
+    c_next_grid = (beta * Pi @ Va_next) ** (-eis)        # c today at each a' on the grid
+    coh_endo = c_next_grid + a_grid[None, :]             # cash on hand that chooses a'
+    coh = (1 + r) * a_grid[None, :] + Z * e_grid[:, None]
+    a_pol = np.maximum(_interp_rows(coh, coh_endo, np.broadcast_to(a_grid, coh.shape)), a_min)
+    c_pol = coh - a_pol
+    return (1 + r) * c_pol ** (-1 / eis), a_pol, c_pol
+
+
+def _lottery(a_pol, a_grid):
+    """Young (2010) lottery: left index and left weight for each policy point."""
+    idx = np.clip(np.searchsorted(a_grid, a_pol, side="right") - 1, 0, a_grid.size - 2)
+    w = (a_grid[idx + 1] - a_pol) / (a_grid[idx + 1] - a_grid[idx])
+    return idx, np.clip(w, 0.0, 1.0)
+
+
+def forward_step(D, idx, w, Pi):
+    """Push the histogram through the asset lottery, then through the income chain."""
+    n_e, n_a = D.shape
+    flat = idx + (np.arange(n_e) * n_a)[:, None]
+    D_a = (np.bincount(flat.ravel(), (w * D).ravel(), n_e * n_a)
+           + np.bincount((flat + 1).ravel(), ((1 - w) * D).ravel(), n_e * n_a)).reshape(n_e, n_a)
+    return Pi.T @ D_a
+
+
+def expectation_step(X, idx, w, Pi):
+    """Adjoint of forward_step: expected value next period of X given today's gridpoint."""
+    X_e = Pi @ X
+    rows = np.arange(X.shape[0])[:, None]
+    return w * X_e[rows, idx] + (1 - w) * X_e[rows, idx + 1]
+
+
+def solve_steady_state(p: HANKParams, tol: float = 1e-10, max_iter: int = 20_000) -> HANKSteadyState:
+    e_grid, Pi, pi = rouwenhorst(p.n_e, p.rho_e, p.sd_e)
+    a_grid = asset_grid(p.a_min, p.a_max, p.n_a)
+    coh = (1 + p.r) * a_grid[None, :] + e_grid[:, None]
+    Va = (1 + p.r) * (0.1 * coh) ** (-1 / p.eis)
+    a_pol = np.zeros_like(coh)
+    for _ in range(max_iter):
+        Va, a_new, c_pol = egm_step(Va, 1.0, p.r, p.beta, p.eis, a_grid, e_grid, Pi, p.a_min)
+        if np.max(np.abs(a_new - a_pol)) < tol:
+            a_pol = a_new
+            break
+        a_pol = a_new
+    else:
+        raise ValueError("Household policy did not converge; check β(1+r) < 1")
+
+    idx, w = _lottery(a_pol, a_grid)
+    D = np.outer(pi, np.full(p.n_a, 1.0 / p.n_a))
+    for _ in range(max_iter):
+        D_new = forward_step(D, idx, w, Pi)
+        if np.max(np.abs(D_new - D)) < tol:
+            D = D_new
+            break
+        D = D_new
+
+    # MPC from the consumption policy: slope in cash on hand, one-sided at the top
+    coh = (1 + p.r) * a_grid[None, :] + e_grid[:, None]
+    mpc = np.empty_like(c_pol)
+    mpc[:, :-1] = (c_pol[:, 1:] - c_pol[:, :-1]) / (coh[:, 1:] - coh[:, :-1])
+    mpc[:, -1] = mpc[:, -2]
+
+    return HANKSteadyState(
+        a_grid=a_grid, e_grid=e_grid, Pi=Pi, Va=Va, a_pol=a_pol, c_pol=c_pol, D=D,
+        A=float(np.vdot(D, a_pol)), C=float(np.vdot(D, c_pol)), mpc=np.clip(mpc, 0.0, 1.0),
+    )
+
+
+def mpc_by_wealth(ss: HANKSteadyState, n_bins: int = 5):
+    """Average MPC within wealth quantiles (bins of equal population mass)."""
+    mass = ss.D.sum(axis=0)
+    mpc_a = (ss.D * ss.mpc).sum(axis=0) / np.maximum(mass, 1e-300)
+    bins = np.minimum((np.cumsum(mass) - 0.5 * mass) * n_bins, n_bins - 1e-9).astype(int)
+    w = np.bincount(bins, mass, n_bins)
+    return np.bincount(bins, mass * mpc_a, n_bins) / np.maximum(w, 1e-300)
+
+
+def household_jacobians(ss: HANKSteadyState, p: HANKParams, h: float = 1e-4):
+    """
+    Sequence-space Jacobians of aggregate C and A w.r.t. income Z and the real
+    rate r, via the fake-news algorithm (Auclert, Bardóczy, Rognlie, Straub 2021):
+    one backward pass per input, one expectation pass, then a cumulative sum.
+    """
+    T = p.T
+    idx_ss, w_ss = _lottery(ss.a_pol, ss.a_grid)
+    args = (p.beta, p.eis, ss.a_grid, ss.e_grid, ss.Pi, p.a_min)
+
+    # Expectation vectors E_k[y] = Λ^k y for the outputs of interest
+    outputs = {"C": ss.c_pol, "A": ss.a_pol}
+    curlyE = {}
+    for o, y in outputs.items():
+        E = np.empty((T - 1,) + y.shape)
+        E[0] = y
+        for k in range(1, T - 1):
+            E[k] = expectation_step(E[k - 1], idx_ss, w_ss, ss.Pi)
+        curlyE[o] = E
+
+    J = {o: {} for o in outputs}
+    for inp in ("Z", "r"):
+        dY = {o: np.empty(T) for o in outputs}
+        dD = np.empty((T,) + ss.D.shape)
+        Va = ss.Va
+        for s in range(T):
+            Z, r = 1.0, p.r
+            if s == 0:
+                Z, r = (Z + h, r) if inp == "Z" else (Z, r + h)
+            Va, a_pol, c_pol = egm_step(Va if s else ss.Va, Z, r, *args)
+            pols = {"C": c_pol, "A": a_pol}
+            for o in outputs:
+                dY[o][s] = np.vdot(ss.D, pols[o] - outputs[o]) / h
+            idx, w = _lottery(a_pol, ss.a_grid)
+            dD[s] = (forward_step(ss.D, idx, w, ss.Pi) - forward_step(ss.D, idx_ss, w_ss, ss.Pi)) / h
+
+        for o in outputs:
+            F = np.empty((T, T))
+            F[0] = dY[o]
+            F[1:] = curlyE[o].reshape(T - 1, -1) @ dD.reshape(T, -1).T
+            Jm = F.copy()
+            for t in range(1, T):
+                Jm[t, 1:] += Jm[t - 1, :-1]
+            J[o][inp] = Jm
+    return J
+
+
+# ── General equilibrium and IRFs ────────────────────────────────────────────
+def _fiscal_impulse(dTr, dr, B, p: HANKParams):
+    """
+    Debt-financed transfers dTr and interest costs B·dr are repaid by taxes
+    φ_B·dB_{t-1}. Returns household income impulse f = dTr - dTax and debt dB.
+    """
+    T = dTr.size
+    dB = np.zeros(T)
+    dTax = np.zeros(T)
+    for t in range(T):
+        dTax[t] = p.phi_b * (dB[t - 1] if t else 0.0)
+        dB[t] = (1 + p.r) * (dB[t - 1] if t else 0.0) + B * dr[t] + dTr[t] - dTax[t]
+    return dTr - dTax, dB
+
+
+@memoize(maxsize=16)
+def get_model(p: HANKParams) -> HANKModel:
+    """Steady state and Jacobians, solved once per parameter set and shared process-wide."""
+    ss = solve_steady_state(p)
+    J = household_jacobians(ss, p)
+    # Goods market Y = C with Z = Y + f:  (I - J_CZ) dY = J_CZ f + J_Cr dr
+    H = np.eye(p.T) - J["C"]["Z"]
+    M_f = np.linalg.solve(H, J["C"]["Z"])
+    M_r = np.linalg.solve(H, J["C"]["r"])
+    return HANKModel(ss=ss, J=J, M_f=M_f, M_r=M_r)
+
+
+@memoize(maxsize=256)
+def simulate_hank(T: int, t_shock: int, dY_transitory: float, dI_pp: float, p: HANKParams, news: bool = False):
+    """
+    Impulse responses (in % of steady-state output) to a debt-financed transfer of
+    dY_transitory % of output and a real-rate shock of dI_pp annualized pp, both
+    decaying at `shock_decay`. With news=True the shock is announced at t = 0.
+    Returns (dC_income, dC_rate, dY, dB): partial-equilibrium consumption responses
+    to each channel, general-equilibrium output, and government debt.
+    """
+    if T > p.T:
+        raise ValueError(f"Horizon {T} exceeds the Jacobian truncation T={p.T}")
+    m = get_model(p)
+    Y_ss = m.ss.C
+    path = np.zeros(p.T)
+    start = t_shock if news else 0
+    if 0 <= start < p.T:
+        path[start:] = p.shock_decay ** np.arange(p.T - start)
+    dTr = dY_transitory / 100 * Y_ss * path
+    dr = dI_pp / 400 * path
+    f, dB = _fiscal_impulse(dTr, dr, m.ss.A, p)
+
+    J = m.J["C"]
+    dC_income = J["Z"] @ f
+    dC_rate = J["r"] @ dr
+    dY = m.M_f @ f + m.M_r @ dr
+    out = [100 * x / Y_ss for x in (dC_income, dC_rate, dY, dB)]
+
+    if not news:
+        # Unanticipated shock at t_shock: nothing moves before it
+        shifted = []
+        for x in out:
+            z = np.zeros(p.T)
+            if 0 <= t_shock < p.T:
+                z[t_shock:] = x[: p.T - t_shock]
+            shifted.append(z)
+        out = shifted
+    return tuple(x[:T] for x in out)
@@ -1,16 +1,20 @@
 import numpy as np
 from dataclasses import dataclass
 
-@dataclass
-class HANKTeaserParams:
-    lam_htm: float = 0.4       # share of hand-to-mouth households
-    mpc_htm: float = 0.9       # MPC of HtM
-    mpc_saver: float = 0.3     # MPC of Ricardian savers (out of transitory income)
-    ir_elast_saver: float = -0.5  # dC/C per 1pp rise in i (savers)
-    multiplier: float = 1.2    # demand multiplier to map ΔC -> ΔY
-    shock_decay: float = 0.7   # AR(1) decay for shocks
+from models.memo import memoize
+from models.params import Params, param
 
+@dataclass(frozen=True, slots=True, eq=False)
+class HANKTeaserParams(Params):
+    lam_htm: float = param(0.4)          # share of hand-to-mouth households
+    mpc_htm: float = param(0.9)          # MPC of HtM
+    mpc_saver: float = param(0.3)        # MPC of Ricardian savers (out of transitory income)
+    ir_elast_saver: float = param(-0.5)  # dC/C per 1pp rise in i (savers)
+    multiplier: float = param(1.2)       # demand multiplier to map ΔC -> ΔY
+    shock_decay: float = param(0.7)      # AR(1) decay for shocks
 
+
+@memoize(maxsize=256)
 def simulate_hank(T: int, t_shock: int, dY_transitory: float, dI_pp: float, p: HANKTeaserParams):
     """
     Teaching-only reduced-form dynamics:
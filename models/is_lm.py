@@ -1,19 +1,21 @@
-# models/is_lm.py — Minimal IS–LM with numerical intersection
+# models/is_lm.py — Minimal IS–LM with closed-form intersection
 import numpy as np
-import matplotlib.pyplot as plt
 from dataclasses import dataclass
 
-@dataclass
-class ISLMParams:
-    c0: float = 50.0     # autonomous consumption
-    c1: float = 0.6      # MPC
-    i0: float = 40.0     # autonomous investment
-    i1: float = 20.0     # interest sensitivity of investment
-    g: float = 100.0     # government spending
-    t: float = 0.2       # tax rate
-    m: float = 300.0     # real money supply (M/P)
-    k: float = 0.5       # money demand sensitivity to income
-    h: float = 40.0      # money demand sensitivity to interest
+from models.memo import memoize
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ISLMParams(Params):
+    c0: float = param(50.0, step=0.01)  # autonomous consumption
+    c1: float = param(0.6, step=0.01)   # MPC
+    i0: float = param(40.0, step=0.01)  # autonomous investment
+    i1: float = param(20.0, step=0.01)  # interest sensitivity of investment
+    g: float = param(100.0, step=0.01)  # government spending
+    t: float = param(0.2, step=0.01)    # tax rate
+    m: float = param(300.0, step=0.01)  # real money supply (M/P)
+    k: float = param(0.5, step=0.01)    # money demand sensitivity to income
+    h: float = param(40.0, step=0.01)   # money demand sensitivity to interest
 
 def is_curve(params: ISLMParams, r_grid: np.ndarray):
     """
@@ -35,9 +37,67 @@ def lm_curve(params: ISLMParams, r_grid: np.ndarray):
     Y = (params.m + params.h * r_grid) / params.k
     return Y
 
-def solve_equilibrium(params: ISLMParams):
-    r = np.linspace(0, 20, 400)
-    Y_is = is_curve(params, r)
-    Y_lm = lm_curve(params, r)
-    idx = np.argmin(np.abs(Y_is - Y_lm))
-    return r[idx], Y_is[idx], (r, Y_is, Y_lm)
\ No newline at end of file
+@dataclass
+class ISLMEquilibrium:
+    r: np.ndarray                  # equilibrium interest rate r*
+    Y: np.ndarray                  # equilibrium output Y*
+    fiscal_multiplier: np.ndarray  # dY*/dg
+    money_multiplier: np.ndarray   # dY*/d(M/P)
+    dr: dict                       # ∂r*/∂(field) for every ISLMParams field
+    dY: dict                       # ∂Y*/∂(field)
+
+@memoize(maxsize=256)
+def equilibrium(params: ISLMParams) -> ISLMEquilibrium:
+    """
+    Exact intersection; every ISLMParams field may be a scalar or an array
+    (arrays broadcast, so one call solves a whole table of policy combinations).
+    With d = 1 - c1(1-t), A = c0 + i0 + g and D = k·i1 + d·h:
+        r* = (k·A - d·M/P) / D,   Y* = (h·A + i1·M/P) / D
+    Comparative statics follow from the quotient rule on each numerator and D.
+    D = 0 (both curves parallel) gives nan.
+    """
+    c0, c1, i0, i1, g, t, m, k, h = np.broadcast_arrays(*(
+        np.asarray(getattr(params, f), dtype=float)
+        for f in ("c0", "c1", "i0", "i1", "g", "t", "m", "k", "h")
+    ))
+    A = c0 + i0 + g
+    d = 1 - c1 * (1 - t)
+    D = k * i1 + d * h
+    with np.errstate(divide="ignore", invalid="ignore"):
+        D = np.where(D == 0, np.nan, D)
+        r = (k * A - d * m) / D
+        Y = (h * A + i1 * m) / D
+
+        # (∂N_r, ∂N_Y, ∂D) for each parameter
+        zero = np.zeros_like(D)
+        partials = {
+            "c0": (k, h, zero), "i0": (k, h, zero), "g": (k, h, zero),
+            "c1": ((1 - t) * m, zero, -(1 - t) * h),
+            "t": (-c1 * m, zero, c1 * h),
+            "i1": (zero, m, k),
+            "m": (-d, i1, zero),
+            "k": (A, zero, i1),
+            "h": (zero, A, d),
+        }
+        dr = {f: (nr - r * dd) / D for f, (nr, _, dd) in partials.items()}
+        dY = {f: (ny - Y * dd) / D for f, (_, ny, dd) in partials.items()}
+    return ISLMEquilibrium(r=r, Y=Y, fiscal_multiplier=dY["g"], money_multiplier=dY["m"], dr=dr, dY=dY)
+
+@memoize(maxsize=256)
+def solve_equilibrium(params: ISLMParams, n: int = 400):
+    """
+    Exact (r*, Y*) plus IS/LM curves on an r-grid that always contains r*.
+    Scalar parameters only; the intersection is the closed form of
+    equilibrium() without its comparative statics.
+    """
+    p = params
+    A = p.c0 + p.i0 + p.g
+    d = 1 - p.c1 * (1 - p.t)
+    D = p.k * p.i1 + d * p.h
+    r_star = (p.k * A - d * p.m) / D if D else float("nan")
+    Y_star = (p.h * A + p.i1 * p.m) / D if D else float("nan")
+    lo, hi = 0.0, 20.0
+    if np.isfinite(r_star):
+        lo, hi = min(lo, r_star - 2.0), max(hi, r_star + 2.0)
+    r = np.linspace(lo, hi, n)
+    return r_star, Y_star, (r, is_curve(params, r), lm_curve(params, r))
\ No newline at end of file
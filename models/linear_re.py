@@ -0,0 +1,71 @@
+# models/linear_re.py — Blanchard–Kahn solver for linear rational-expectations models
+import numpy as np
+from dataclasses import dataclass
+
+@dataclass
+class LinearRESolution:
+    H: np.ndarray   # state transition: s_{t+1} = H s_t   (s = [z; k])
+    G: np.ndarray   # policy for jump variables: d_t = G s_t
+    n_z: int        # number of exogenous states (first block of s)
+    eigvals: np.ndarray
+
+def solve_linear_re(A, B, C, P, n_k: int = 0, tol: float = 1e-9) -> LinearRESolution:
+    """
+    Solve  A E_t[x_{t+1}] = B x_t + C z_t,  z_{t+1} = P z_t + ε_{t+1}
+    where x = [k; d] stacks n_k predetermined variables before the jumps d.
+
+    The exogenous block is appended to the state, the system is written as
+    E_t[w_{t+1}] = M w_t with w = [z; k; d], and the unstable eigenvectors of M
+    pin the jumps to the saddle path (Blanchard–Kahn 1980). A must be invertible.
+    Raises ValueError when the number of unstable roots differs from the number
+    of jumps (no stable solution, or indeterminacy).
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    B = np.atleast_2d(np.asarray(B, dtype=float))
+    C = np.atleast_2d(np.asarray(C, dtype=float))
+    P = np.atleast_2d(np.asarray(P, dtype=float))
+    n = A.shape[0]
+    n_z = P.shape[0]
+    n_d = n - n_k
+    n_s = n_z + n_k
+
+    A_big = np.eye(n_z + n)
+    A_big[n_z:, n_z:] = A
+    B_big = np.zeros((n_z + n, n_z + n))
+    B_big[:n_z, :n_z] = P
+    B_big[n_z:, :n_z] = C
+    B_big[n_z:, n_z:] = B
+    M = np.linalg.solve(A_big, B_big)
+
+    lam, V = np.linalg.eig(M)
+    unstable = np.abs(lam) > 1 + tol
+    n_unstable = int(unstable.sum())
+    if n_unstable > n_d:
+        raise ValueError(f"No stable solution: {n_unstable} unstable roots for {n_d} jump variables")
+    if n_unstable < n_d:
+        raise ValueError(f"Indeterminate: {n_unstable} unstable roots for {n_d} jump variables")
+
+    # Rows of V^{-1} for unstable roots must annihilate w_t on the saddle path
+    W = np.linalg.inv(V)[unstable]
+    G = -np.linalg.solve(W[:, n_s:], W[:, :n_s])
+    H = M[:n_s, :n_s] + M[:n_s, n_s:] @ G
+    return LinearRESolution(H=np.real(H), G=np.real(G), n_z=n_z, eigvals=lam)
+
+def impulse_responses(sol: LinearRESolution, T: int, shocks=None):
+    """
+    IRFs of [s; d] to unit innovations in each exogenous state (or to the
+    columns of `shocks`, shape (n_z, m)). Returns an array (T, n_s + n_d, m).
+    """
+    n_s = sol.H.shape[0]
+    if shocks is None:
+        shocks = np.eye(sol.n_z)
+    shocks = np.asarray(shocks, dtype=float).reshape(sol.n_z, -1)
+    # Stack [I; G] once so each period is a single matrix product for all shocks
+    obs = np.vstack([np.eye(n_s), sol.G])
+    s = np.zeros((n_s, shocks.shape[1]))
+    s[:sol.n_z] = shocks
+    out = np.empty((T, obs.shape[0], shocks.shape[1]))
+    for t in range(T):
+        out[t] = obs @ s
+        s = sol.H @ s
+    return out
@@ -0,0 +1,96 @@
+# models/memo.py — process-wide memoization for model entry points
+import functools
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+
+import numpy as np
+
+from models.params import canonical
+
+DEFAULT_TTL = 3600.0   # seconds
+
+_enabled = True
+
+
+@contextmanager
+def memoization(enabled: bool):
+    """Temporarily switch every memoized function on or off (benchmarks, debugging)."""
+    global _enabled
+    previous, _enabled = _enabled, enabled
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+
+def _readonly(value):
+    """Mark arrays in a cached result read-only so no caller can corrupt the shared copy."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _readonly(v)
+    elif is_dataclass(value) and not isinstance(value, type):
+        for f in fields(value):
+            _readonly(getattr(value, f.name))
+    return value
+
+
+def memoize(maxsize: int = 128, ttl: float = DEFAULT_TTL):
+    """
+    LRU + TTL cache keyed on the canonical form of the arguments (see
+    models.params.canonical). One cache per function, shared by every thread
+    and Streamlit session in the process. Calls with unhashable arguments, such
+    as numpy arrays for batched runs, go straight through. Cached arrays are
+    returned read-only. The wrapper exposes cache_info() and cache_clear().
+    """
+    def decorator(fn):
+        cache = OrderedDict()   # key -> (value, stored_at)
+        lock = threading.Lock()
+        counts = {"hits": 0, "misses": 0, "expired": 0}
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            try:
+                key = (tuple(canonical(a) for a in args),
+                       tuple(sorted((k, canonical(v)) for k, v in kwargs.items())))
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+            now = time.monotonic()
+            with lock:
+                item = cache.get(key)
+                if item is not None:
+                    if now - item[1] < ttl:
+                        cache.move_to_end(key)
+                        counts["hits"] += 1
+                        return item[0]
+                    del cache[key]
+                    counts["expired"] += 1
+                counts["misses"] += 1
+            value = _readonly(fn(*args, **kwargs))
+            with lock:
+                cache[key] = (value, now)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_info():
+            with lock:
+                return {**counts, "size": len(cache), "maxsize": maxsize, "ttl": ttl}
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
-@dataclass
-class MFParams:
-    k: float = 0.5   # capital mobility (0 low → 1 high)
-    e_fixed: bool = False  # fixed exchange rate regime
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MFParams(Params):
+    k: float = param(0.5, step=0.05)  # capital mobility (0 low → 1 high)
+    e_fixed: bool = param(False)      # fixed exchange rate regime
@@ -1,33 +1,63 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple
 
-@dataclass
-class NKParams:
-    sigma: float = 1.0   # intertemporal elasticity
-    beta: float = 0.99   # discount
-    kappa: float = 0.2   # NKPC slope
-    phi_pi: float = 1.5  # Taylor response to inflation
-    phi_y: float = 0.5   # Taylor response to output gap
-    r_star: float = 0.0  # natural real rate
+from models.linear_re import LinearRESolution, solve_linear_re, impulse_responses
+from models.memo import memoize
+from models.params import Params, param
 
+@dataclass(frozen=True, slots=True, eq=False)
+class NKParams(Params):
+    sigma: float = param(1.0, step=0.1)   # intertemporal elasticity
+    beta: float = param(0.99, step=0.01)  # discount
+    kappa: float = param(0.2, step=0.01)  # NKPC slope
+    phi_pi: float = param(1.5, step=0.1)  # Taylor response to inflation
+    phi_y: float = param(0.5, step=0.1)   # Taylor response to output gap
+    r_star: float = param(0.0, step=0.1)  # natural real rate
+    rho: float = param(0.5, step=0.05)    # AR(1) persistence of the shocks
 
+
+@memoize(maxsize=256)
+def _solve_nk(sigma, beta, kappa, phi_pi, phi_y, rho) -> LinearRESolution:
+    # Jumps x = (y, π); shocks z = (u^y, u^π, u^i); Taylor rule substituted into IS.
+    # IS:   E y' + (1/σ) E π' = (1 + φ_y/σ) y + (φ_π/σ) π + (1/σ) u^i - u^y
+    # NKPC: β E π' = π - κ y - u^π
+    A = [[1.0, 1.0 / sigma],
+         [0.0, beta]]
+    B = [[1.0 + phi_y / sigma, phi_pi / sigma],
+         [-kappa, 1.0]]
+    C = [[-1.0, 0.0, 1.0 / sigma],
+         [0.0, -1.0, 0.0]]
+    return solve_linear_re(A, B, C, rho * np.eye(3))
+
+
+def solve_nk(p: NKParams) -> LinearRESolution:
+    """Forward-looking solution of the three-equation model, cached on the parameters (r* does not enter)."""
+    sigma, beta, kappa, phi_pi, phi_y, _r_star, rho = astuple(p)
+    return _solve_nk(sigma, beta, kappa, phi_pi, phi_y, rho)
+
+
+@memoize(maxsize=256)
+def nk_irfs(T: int, p: NKParams):
+    """
+    Responses of (y, π, i - r*) to unit (u^y, u^π, u^i) shocks at t = 0.
+    Returns an array (T, 3 variables, 3 shocks).
+    """
+    sol = solve_nk(p)
+    paths = impulse_responses(sol, T)    # rows: u^y, u^π, u^i, y, π
+    y, pi, u_i = paths[:, 3], paths[:, 4], paths[:, 2]
+    i_gap = p.phi_pi * pi + p.phi_y * y + u_i
+    return np.stack([y, pi, i_gap], axis=1)
+
+
+@memoize(maxsize=256)
 def simulate_nk(T: int, shock_t: int, eps_y: float, eps_pi: float, eps_policy: float, p: NKParams):
-    # Teaching-friendly lagged-expectations approximation
+    # Rational-expectations solution; the shock is unanticipated, so nothing moves before shock_t
     y = np.zeros(T)
     pi = np.zeros(T)
-    i_nom = np.zeros(T)
-    for t in range(T):
-        # shocks (one-time)
-        uy = eps_y if t == shock_t else 0.0
-        up = eps_pi if t == shock_t else 0.0
-        ur = eps_policy if t == shock_t else 0.0
-        # IS (gap): y_t = y_{t-1} - (1/σ)*(i_{t-1} - π_{t-1} - r*) + u^y_t
-        if t == 0:
-            y[t] = - (1/p.sigma) * (0 - 0 - p.r_star) + uy
-        else:
-            y[t] = y[t-1] - (1/p.sigma) * (i_nom[t-1] - pi[t-1] - p.r_star) + uy
-        # NKPC (backward-looking teaching version): π_t = β π_{t-1} + κ y_t + u^π_t
-        pi[t] = (p.beta * (0 if t==0 else pi[t-1])) + p.kappa * y[t] + up
-        # Taylor rule: i_t = r* + φ_π π_t + φ_y y_t + u^i_t
-        i_nom[t] = p.r_star + p.phi_pi * pi[t] + p.phi_y * y[t] + ur
-    return y, pi, i_nom
\ No newline at end of file
+    i_nom = np.full(T, p.r_star)
+    if 0 <= shock_t < T:
+        irf = nk_irfs(T - shock_t, p) @ np.array([eps_y, eps_pi, eps_policy])
+        y[shock_t:] = irf[:, 0]
+        pi[shock_t:] = irf[:, 1]
+        i_nom[shock_t:] += irf[:, 2]
+    return y, pi, i_nom
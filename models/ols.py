@@ -0,0 +1,107 @@
+# models/ols.py — straight-line fits P = a + bQ from mergeable sufficient statistics
+import numpy as np
+from dataclasses import dataclass
+
+HUBER_C = 1.345    # 95% efficiency at the normal
+
+
+@dataclass(frozen=True)
+class LineFit:
+    a: float         # intercept
+    b: float         # slope
+    r2: float        # (weighted) R²
+    n: int           # observations used
+
+
+@dataclass
+class RegressionStats:
+    """
+    Weighted means and centered co-moments of (x, y). Two sets combine exactly
+    (Chan et al. pairwise update), so data can arrive in chunks and single
+    observations can be added or taken out again in O(1); removal is a merge
+    with negative weight. Centered moments avoid the cancellation that raw sums
+    of x² suffer on large samples.
+    """
+    n: int = 0
+    w: float = 0.0      # total weight
+    mx: float = 0.0
+    my: float = 0.0
+    sxx: float = 0.0    # Σ w (x - mx)²
+    sxy: float = 0.0
+    syy: float = 0.0
+
+    @classmethod
+    def from_arrays(cls, x, y, w=None):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        w = np.ones_like(x) if w is None else np.broadcast_to(np.asarray(w, dtype=float), x.shape)
+        keep = np.isfinite(x) & np.isfinite(y) & np.isfinite(w) & (w > 0)
+        x, y, w = x[keep], y[keep], w[keep]
+        W = w.sum()
+        if W <= 0:
+            return cls()
+        mx, my = w @ x / W, w @ y / W
+        dx, dy = x - mx, y - my
+        return cls(int(x.size), float(W), float(mx), float(my),
+                   float(w @ (dx * dx)), float(w @ (dx * dy)), float(w @ (dy * dy)))
+
+    def merge(self, other, sign=1):
+        """Add (sign=1) or remove (sign=-1) another set of statistics, in place."""
+        w2 = sign * other.w
+        W = self.w + w2
+        n = self.n + sign * other.n
+        if n <= 0 or W <= 1e-12 * max(self.w, other.w, 1.0):
+            self.__init__()
+            return self
+        dx, dy = other.mx - self.mx, other.my - self.my
+        f = self.w * w2 / W
+        self.sxx += sign * other.sxx + f * dx * dx
+        self.sxy += sign * other.sxy + f * dx * dy
+        self.syy += sign * other.syy + f * dy * dy
+        self.mx += dx * w2 / W
+        self.my += dy * w2 / W
+        self.w, self.n = W, n
+        return self
+
+    def add(self, x, y, w=1.0):
+        return self.merge(RegressionStats.from_arrays([x], [y], [w]))
+
+    def remove(self, x, y, w=1.0):
+        return self.merge(RegressionStats.from_arrays([x], [y], [w]), sign=-1)
+
+    def fit(self):
+        """Weighted least-squares line, or None with fewer than two distinct x."""
+        if self.n < 2 or self.sxx <= 1e-12 * max(self.w, 1.0):
+            return None
+        b = self.sxy / self.sxx
+        r2 = self.sxy * self.sxy / (self.sxx * self.syy) if self.syy > 0 else 1.0
+        return LineFit(a=self.my - b * self.mx, b=b, r2=r2, n=self.n)
+
+
+def huber_fit(x, y, w=None, c=HUBER_C, max_iter=50, tol=1e-8):
+    """
+    Huber M-estimate by iteratively reweighted least squares: residuals beyond
+    c·σ get weight c·σ/|r|, σ from the median absolute residual. Each pass is
+    one vectorized weighted fit over all observations.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    w = np.ones_like(x) if w is None else np.asarray(w, dtype=float)
+    fit = RegressionStats.from_arrays(x, y, w).fit()
+    if fit is None:
+        return None
+    for _ in range(max_iter):
+        r = np.abs(y - fit.a - fit.b * x)
+        sigma = np.nanmedian(r) / 0.6745
+        if not sigma > 0:
+            break
+        with np.errstate(divide="ignore"):
+            robust = np.minimum(1.0, c * sigma / r)
+        new = RegressionStats.from_arrays(x, y, w * robust).fit()
+        if new is None:
+            break
+        done = abs(new.a - fit.a) <= tol * (1 + abs(fit.a)) and abs(new.b - fit.b) <= tol * (1 + abs(fit.b))
+        fit = new
+        if done:
+            break
+    return fit
@@ -0,0 +1,56 @@
+# models/params.py — frozen, hashable parameter objects with canonical equality
+import numpy as np
+from dataclasses import field, fields
+
+_STEP_TOL = 1e-6     # how close to a step multiple counts as "on the grid"
+_SIG_DIGITS = 12     # off-grid floats compare at this many significant digits
+
+
+def param(default, step=None):
+    """Dataclass field with the resolution (usually the slider step) used for hashing."""
+    return field(default=default, metadata={"step": step})
+
+
+def canonical(value, step=None):
+    """
+    Hashable stand-in for one parameter value. Floats within float noise of a
+    multiple of `step` collapse onto it, so 0.1 + 0.2 and 0.3 share a key; other
+    floats are rounded to 12 significant digits, never to the step, so values
+    off the slider grid stay distinct. Arrays (batched parameters) raise TypeError.
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, (float, np.floating)):
+        v = float(value)
+        if step:
+            n = round(v / step)
+            if abs(v / step - n) < _STEP_TOL:
+                return round(n * step, _SIG_DIGITS)
+        return float(f"{v:.{_SIG_DIGITS}g}")
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, Params):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(canonical(v, step) for v in value)
+    raise TypeError(f"unhashable parameter value of type {type(value).__name__}")
+
+
+class Params:
+    """
+    Base for parameter dataclasses declared with
+    @dataclass(frozen=True, slots=True, eq=False): equality and hashing go
+    through `key()`, so instances can key caches shared across sessions.
+    """
+    __slots__ = ()
+
+    def key(self):
+        return tuple(canonical(getattr(self, f.name), f.metadata.get("step")) for f in fields(self))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash((type(self).__qualname__, self.key()))
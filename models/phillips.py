@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
-@dataclass
-class NKPCParams:
-    beta: float = 0.9
-    kappa: float = 0.2
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class NKPCParams(Params):
+    beta: float = param(0.9, step=0.01)
+    kappa: float = param(0.2, step=0.01)
 
 
 def nkpc_next(pi_prev: float, y_gap: float, u_t: float, p: NKPCParams) -> float:
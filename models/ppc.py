@@ -0,0 +1,142 @@
+# models/ppc.py — production possibilities frontiers: the assumed superellipse
+# (x/a)^k + (y/b)^k = 1, and one derived from factor allocation (production box)
+import numpy as np
+from dataclasses import dataclass
+
+from models.memo import memoize
+from models.params import Params, param
+
+# Points per frontier. The curves are sampled at equal steps of the angle t in
+# x = a·cos(t)^(2/k), y = b·sin(t)^(2/k), which crowds points where the
+# frontier bends; 33 keep the chord error under 5e-4 of the axes for k ≤ 6.
+POINTS = 33
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PPCParams(Params):
+    a: float = param(100.0, step=5.0)    # max output of X (x intercept)
+    b: float = param(100.0, step=5.0)    # max output of Y (y intercept)
+    k: float = param(2.5, step=0.1)      # curvature: 1 linear, > 1 bowed out
+    shift: float = param(0.0, step=5.0)  # % change in both intercepts (technology / labor force)
+
+
+@dataclass
+class Frontier:
+    x: np.ndarray
+    y: np.ndarray
+    oc: np.ndarray     # opportunity cost of X, −dy/dx (Y given up per extra X)
+
+
+@dataclass
+class PPCCurves:
+    baseline: Frontier
+    shifted: Frontier
+    scale: float       # shifted intercepts / baseline intercepts
+
+
+def frontier_y(x, a, b, k):
+    """Y on the frontier at X = x (clipped to [0, a])."""
+    r = np.clip(np.asarray(x, dtype=float) / a, 0.0, 1.0)
+    with np.errstate(divide="ignore"):
+        return b * (-np.expm1(k * np.log(r))) ** (1.0 / k)
+
+
+def opportunity_cost(x, a, b, k):
+    """
+    Exact −dy/dx = (b/a)·r^(k−1)·(1 − r^k)^(1/k − 1), r = x/a: zero at x = 0
+    and unbounded at x = a for k > 1, the constant b/a for k = 1. 1 − r^k is
+    taken as −expm1(k log r) so it stays accurate next to the X axis.
+    """
+    r = np.clip(np.asarray(x, dtype=float) / a, 0.0, 1.0)
+    with np.errstate(divide="ignore"):
+        rest = -np.expm1(k * np.log(r))
+        return (b / a) * r ** (k - 1) * rest ** (1.0 / k - 1)
+
+
+def frontier(a, b, k, n=POINTS):
+    """
+    n points from the Y intercept to the X intercept with their opportunity
+    costs. a and b may be arrays (one frontier per row). In the angle form
+    the slope is −(b/a)·tan(t)^(2/k − 2), exact at both intercepts.
+    """
+    t = np.linspace(0.0, np.pi / 2, n)[::-1]
+    c, s = np.cos(t), np.sin(t)
+    c[0] = 0.0                                # exact Y intercept, not cos(π/2) ≈ 6e-17
+    a = np.asarray(a, dtype=float)[..., None]
+    b = np.asarray(b, dtype=float)[..., None]
+    with np.errstate(divide="ignore"):
+        oc = (b / a) * (s / c) ** (2.0 / k - 2.0)
+    return Frontier(x=a * c ** (2.0 / k), y=b * s ** (2.0 / k), oc=oc)
+
+
+@memoize(maxsize=256)
+def ppc_curves(p: PPCParams, n: int = POINTS) -> PPCCurves:
+    """Baseline and shifted frontiers in one broadcast evaluation."""
+    scale = 1 + p.shift / 100.0
+    both = frontier(p.a * np.array([1.0, scale]), p.b * np.array([1.0, scale]), p.k, n)
+    base, shifted = (Frontier(x=both.x[i], y=both.y[i], oc=both.oc[i]) for i in (0, 1))
+    return PPCCurves(baseline=base, shifted=shifted, scale=scale)
+
+
+# ---------- Production box: the PPF from two production functions ----------
+#
+# X = Ax·Lx^ax·Kx^bx and Y = Ay·Ly^ay·Ky^by share fixed L and K. Efficient
+# allocations (the contract curve) equate the marginal rates of technical
+# substitution MPL/MPK = (a/b)·K/L of both industries; mapping them to
+# (X, Y) traces the frontier.
+
+GRID = 401
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BoxParams(Params):
+    L: float = param(100.0, step=5.0)     # labor endowment
+    K: float = param(100.0, step=5.0)     # capital endowment
+    ax: float = param(0.7, step=0.05)     # labor exponent, good X
+    bx: float = param(0.3, step=0.05)     # capital exponent, good X
+    ay: float = param(0.3, step=0.05)     # labor exponent, good Y
+    by: float = param(0.7, step=0.05)     # capital exponent, good Y
+    Ax: float = param(1.0, step=0.1)      # productivity, good X
+    Ay: float = param(1.0, step=0.1)      # productivity, good Y
+
+
+@dataclass
+class ContractCurve:
+    Lx: np.ndarray     # labor in X along the curve (Y gets the rest)
+    Kx: np.ndarray     # capital in X
+    X: np.ndarray
+    Y: np.ndarray
+    oc: np.ndarray     # opportunity cost of X, −dY/dX = MPL_Y / MPL_X
+
+
+def outputs(p: BoxParams, Lx, Kx):
+    """(X, Y) for allocations (Lx, Kx) to X, the rest of L and K to Y; arrays broadcast."""
+    Lx, Kx = np.asarray(Lx, dtype=float), np.asarray(Kx, dtype=float)
+    X = p.Ax * Lx ** p.ax * Kx ** p.bx
+    Y = p.Ay * (p.L - Lx) ** p.ay * (p.K - Kx) ** p.by
+    return X, Y
+
+
+@memoize(maxsize=128)
+def contract_curve(p: BoxParams, n: int = GRID) -> ContractCurve:
+    """
+    Efficient allocations on an n × n grid of (Lx, Kx). For each labor row the
+    MRTS gap (MRTS_X − MRTS_Y) is evaluated across the whole capital row at
+    once; it rises with Kx, so counting the negative cells brackets the
+    efficient Kx and linear interpolation within the bracket finishes the
+    solve (exact here, since both MRTS are linear in Kx). The end rows are the
+    box corners: all factors in Y, all in X.
+    """
+    Lx = np.linspace(0.0, p.L, n)
+    Kg = np.linspace(0.0, p.K, n)
+    inner = Lx[1:-1, None]
+    gap = (p.ax / p.bx) * Kg / inner - (p.ay / p.by) * (p.K - Kg) / (p.L - inner)
+    j = np.clip(np.count_nonzero(gap < 0, axis=1), 1, n - 1)
+    rows = np.arange(n - 2)
+    g0, g1 = gap[rows, j - 1], gap[rows, j]
+    Kx = np.concatenate(([0.0], Kg[j - 1] + (Kg[j] - Kg[j - 1]) * g0 / (g0 - g1), [p.K]))
+    X, Y = outputs(p, Lx, Kx)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        oc = (p.ay * Y / (p.L - Lx)) / (p.ax * X / Lx)
+    oc[0], oc[-1] = 0.0, np.inf
+    return ContractCurve(Lx=Lx, Kx=Kx, X=X, Y=Y, oc=oc)
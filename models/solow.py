@@ -2,13 +2,24 @@
 import numpy as np
 from dataclasses import dataclass
 
+from models.memo import memoize
+from models.params import Params, param
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SolowParams(Params):
+    s: float = param(0.2, step=0.01)        # savings rate
+    delta: float = param(0.05, step=0.005)  # depreciation
+    n: float = param(0.01, step=0.001)      # population growth
+    g: float = param(0.02, step=0.001)      # technology growth
+    alpha: float = param(0.33, step=0.01)   # capital share
+
 @dataclass
-class SolowParams:
-    s: float = 0.2      # savings rate
-    delta: float = 0.05 # depreciation
-    n: float = 0.01     # population growth
-    g: float = 0.02     # technology growth
-    alpha: float = 0.33 # capital share
+class SolowBatch:
+    k: np.ndarray          # (N, T) capital per effective worker
+    y: np.ndarray          # (N, T) output per effective worker
+    k_star: np.ndarray     # (N,) steady-state capital (nan if n+g+δ ≤ 0)
+    y_star: np.ndarray     # (N,) steady-state output
+    half_life: np.ndarray  # (N,) periods to close half the gap to k* (linearized)
 
 def solow_next_k(k: float, params: SolowParams) -> float:
     """
@@ -19,10 +30,60 @@ def solow_next_k(k: float, params: SolowParams) -> float:
     k_next = (params.s * y + (1 - params.delta) * k) / (1 + params.n + params.g)
     return k_next
 
+def steady_state(s, delta, n, g, alpha):
+    """
+    Closed-form k*, y* and convergence half-life; every argument may be an array.
+    s·k*^(α-1) = n + g + δ, and the slope of k_{t+1}(k_t) at k* is
+    λ = (1 - δ + α(n+g+δ)) / (1 + n + g), so the gap halves after ln(½)/ln(λ) periods.
+    """
+    s, delta, n, g, alpha = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (s, delta, n, g, alpha)))
+    ngd = n + g + delta
+    ok = ngd > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_star = np.where(ok, (s / np.where(ok, ngd, 1.0)) ** (1 / (1 - alpha)), np.nan)
+        y_star = k_star ** alpha
+        # With s = 0, k* = 0 and capital just depreciates and dilutes: λ = (1 - δ) / (1 + n + g)
+        lam = (1 - delta + np.where(s > 0, alpha * ngd, 0.0)) / (1 + n + g)
+        stable = ok & (np.abs(lam) < 1) & (lam > 0)
+        half_life = np.where(stable, np.log(0.5) / np.log(np.where(stable, lam, 0.5)), np.nan)
+    return k_star, y_star, half_life
+
+@memoize(maxsize=256)
+def simulate_paths(k0, T: int, s, delta, n, g, alpha) -> SolowBatch:
+    """
+    Batched transition paths: arguments broadcast to N scenarios and each period
+    is one vectorized update over all rows, so the only Python loop is over t.
+    A single scenario takes a scalar loop instead.
+    """
+    k0, s, delta, n, g, alpha = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (k0, s, delta, n, g, alpha))
+    )
+    growth = 1 + n + g
+    if k0.size == 1:
+        # One scenario (the page default): stepping Python floats is several
+        # times faster than size-1 array updates
+        kt, s1, d1, a1, g1 = (float(v[0]) for v in (k0, s, delta, alpha, growth))
+        path = [kt]
+        for _ in range(T - 1):
+            kt = (s1 * kt ** a1 + (1 - d1) * kt) / g1
+            path.append(kt)
+        k = np.array(path[:T]).reshape(1, -1)
+    else:
+        k = np.empty((k0.size, T))
+        k[:, 0] = k0
+        for t in range(T - 1):
+            kt = k[:, t]
+            k[:, t + 1] = (s * kt ** alpha + (1 - delta) * kt) / growth
+    y = k ** alpha[:, None]
+    k_star, y_star, half_life = steady_state(s, delta, n, g, alpha)
+    return SolowBatch(k=k, y=y, k_star=k_star, y_star=y_star, half_life=half_life)
+
+@memoize(maxsize=256)
+def simulate_batch(k0, T: int, params: list[SolowParams]) -> SolowBatch:
+    """Convenience wrapper: one row per SolowParams, sharing (or broadcasting) k0."""
+    cols = np.array([[p.s, p.delta, p.n, p.g, p.alpha] for p in params], dtype=float).reshape(-1, 5)
+    return simulate_paths(k0, T, *cols.T)
+
 def simulate_path(k0: float, T: int, params: SolowParams):
-    k = np.zeros(T)
-    k[0] = k0
-    for t in range(T-1):
-        k[t+1] = solow_next_k(k[t], params)
-    y = k ** params.alpha
-    return k, y
+    batch = simulate_batch(k0, T, [params])
+    return batch.k[0], batch.y[0]
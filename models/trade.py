@@ -0,0 +1,301 @@
+# models/trade.py — Ricardian trade: N producers × M goods with linear PPCs
+import numpy as np
+from dataclasses import dataclass
+
+from models.memo import memoize
+from models.params import Params, param
+
+# `cap` throughout is the (N, M) matrix of maximum outputs: cap[i, j] is what
+# producer i makes of good j when all its resources go to j (the PPC intercepts).
+# Preferences are Cobb–Douglas with expenditure shares `shares` (default equal),
+# the same for every producer, so world demand aggregates.
+
+
+@dataclass
+class TradeEquilibrium:
+    prices: np.ndarray       # (M,) world prices, good 0 = numeraire
+    labor: np.ndarray        # (N, M) share of each producer's resources in each good
+    production: np.ndarray   # (N, M)
+    consumption: np.ndarray  # (N, M)
+    autarky: np.ndarray      # (N, M) autarky production (= consumption)
+    gains: np.ndarray        # (N,) gains from trade, U_trade / U_autarky - 1
+    iterations: int = 0      # 0 for the exact two-good solver
+
+
+def _capacity(cap):
+    cap = np.asarray(cap, dtype=float)
+    if cap.ndim != 2 or cap.shape[1] < 2:
+        raise ValueError("capacity must be an (N producers, M ≥ 2 goods) matrix")
+    if not np.all(np.isfinite(cap)) or np.any(cap <= 0):
+        raise ValueError("capacities must be positive and finite")
+    return cap
+
+
+def _shares(shares, M):
+    if shares is None:
+        return np.full(M, 1.0 / M)
+    shares = np.asarray(shares, dtype=float)
+    if shares.shape != (M,) or np.any(shares <= 0):
+        raise ValueError(f"need {M} positive expenditure shares")
+    return shares / shares.sum()
+
+
+def opportunity_costs(cap, base=0):
+    """(N, M): units of good `base` each producer gives up per extra unit of each good."""
+    cap = _capacity(cap)
+    return cap[:, [base]] / cap
+
+
+def comparative_advantage(cap):
+    """Two goods: index order of producers from lowest to highest opportunity cost of good 0."""
+    cap = _capacity(cap)
+    return np.argsort(cap[:, 1] / cap[:, 0], kind="stable")
+
+
+def world_ppf(cap):
+    """
+    Kinks of the two-good world PPF from all-good-1 to all-good-0: producers
+    switch to good 0 in order of opportunity cost, so the frontier is the
+    cumulative sum over that ranking — O(N log N). Returns (x0, x1, order).
+    """
+    cap = _capacity(cap)
+    order = comparative_advantage(cap)
+    x0 = np.concatenate(([0.0], np.cumsum(cap[order, 0])))
+    x1 = cap[:, 1].sum() - np.concatenate(([0.0], np.cumsum(cap[order, 1])))
+    return x0, x1, order
+
+
+def autarky(cap, shares=None):
+    """Autarky production: with Cobb–Douglas tastes each producer splits its resources by the shares."""
+    cap = _capacity(cap)
+    return cap * _shares(shares, cap.shape[1])
+
+
+def specialize(cap, prices):
+    """
+    Each producer's income-maximizing good at world prices. The producer's
+    problem max p·x s.t. Σ_j x_j / cap_j ≤ 1 is a linear program whose optimum
+    is a vertex: everything into argmax_j p_j·cap_j. One vectorized argmax
+    solves all N programs. Returns (N,) good indices.
+    """
+    return np.argmax(_capacity(cap) * np.asarray(prices, dtype=float), axis=1)
+
+
+def _finish(cap, shares, labor, prices, iterations=0):
+    production = labor * cap
+    income = production @ prices
+    consumption = shares * income[:, None] / prices
+    aut = cap * shares
+    log_gain = (np.log(consumption) - np.log(aut)) @ shares
+    return TradeEquilibrium(prices=prices / prices[0], labor=labor, production=production,
+                            consumption=consumption, autarky=aut, gains=np.expm1(log_gain),
+                            iterations=iterations)
+
+
+def _equilibrium_2(cap, shares):
+    """
+    Exact two-good equilibrium in O(N log N). With producers ranked by the
+    opportunity cost c of good 0, either the price p = P0/P1 lies strictly
+    between two neighbouring costs (a kink of the world PPF) or it equals the
+    cost of one marginal producer who makes both goods. Market clearing
+    β1·p·X0 = β0·X1 pins down both cases, evaluated for all ranks at once.
+    """
+    N = cap.shape[0]
+    b0, b1 = shares
+    order = comparative_advantage(cap)
+    cx, cy = cap[order, 0], cap[order, 1]
+    c = cy / cx
+    X_before = np.concatenate(([0.0], np.cumsum(cx)))[:-1]          # good 0 made by producers ranked above m
+    Y_after = cy.sum() - np.cumsum(cy)                              # good 1 made by those ranked below m
+    # Marginal producer m splits: share s of it in good 0
+    s = (b0 * (Y_after + cy) - b1 * c * X_before) / cy
+    labor_sorted = np.zeros((N, 2))
+    split = np.flatnonzero((s >= 0) & (s <= 1))
+    if split.size:
+        m = split[0]
+        labor_sorted[:m, 0] = 1.0
+        labor_sorted[m] = (s[m], 1 - s[m])
+        labor_sorted[m + 1:, 1] = 1.0
+        p = c[m]
+    else:
+        # Kink k: the first k producers make good 0, the rest good 1
+        k = np.arange(1, N)
+        X0, X1 = np.cumsum(cx)[:-1], cy.sum() - np.cumsum(cy)[:-1]
+        p_k = b0 * X1 / (b1 * X0)
+        k = k[(p_k >= c[:-1]) & (p_k <= c[1:])][0]
+        labor_sorted[:k, 0] = 1.0
+        labor_sorted[k:, 1] = 1.0
+        p = p_k[k - 1]
+    labor = np.empty_like(labor_sorted)
+    labor[order] = labor_sorted
+    return _finish(cap, shares, labor, np.array([p, 1.0]))
+
+
+def _soft_labor(cap, prices, tau):
+    """Softmax of incomes p_j·cap_ij at temperature tau; argmax (`specialize`) as tau → 0."""
+    z = cap * prices / tau
+    z -= z.max(axis=1, keepdims=True)
+    labor = np.exp(z)
+    return labor / labor.sum(axis=1, keepdims=True)
+
+
+def _dual(cap, prices, shares, tau):
+    """Smoothed dual objective τ Σ_i logsumexp(p·cap_i / τ) − β·log p."""
+    z = cap * prices / tau
+    top = z.max(axis=1)
+    return tau * np.sum(top + np.log(np.exp(z - top[:, None]).sum(axis=1))) - shares @ np.log(prices)
+
+
+def equilibrium(cap, shares=None, *, tol=1e-6, max_iter=50):
+    """
+    Free-trade equilibrium with identical Cobb–Douglas tastes. Two goods use
+    the exact ranking solver. For M > 2 goods, equilibrium prices minimize the
+    dual of max Σ β_j log X_j over the world PPF,
+        Σ_i max_j p_j·cap_ij − Σ_j β_j log p_j,
+    whose inner max is each producer's LP (`specialize`). Replacing that max by
+    a softmax at temperature τ makes the dual smooth in the M prices, so damped
+    Newton steps (an M×M system per step, O(N·M²) to build) converge in a few
+    iterations; τ is annealed from the average income down to tol × it, and
+    the final softmax weights are the labor allocation. `iterations` counts
+    Newton steps in total.
+    """
+    cap = _capacity(cap)
+    N, M = cap.shape
+    shares = _shares(shares, M)
+    if M == 2:
+        return _equilibrium_2(cap, shares)
+    prices = shares / (cap * shares).sum(axis=0)        # autarky world prices, Σ p·X = 1
+    tau, steps = 1.0 / N, 0
+    while True:
+        for _ in range(max_iter):
+            labor = _soft_labor(cap, prices, tau)
+            W = labor * cap
+            grad = W.sum(axis=0) - shares / prices
+            hess = (np.diag((W * cap).sum(axis=0)) - W.T @ W) / tau + np.diag(shares / prices**2)
+            d = np.linalg.solve(hess, -grad)
+            if -grad @ d < 1e-14:                        # Newton decrement
+                break
+            f0, a = _dual(cap, prices, shares, tau), 1.0
+            while a > 1e-12 and (np.any(prices + a * d <= 0)
+                                 or _dual(cap, prices + a * d, shares, tau) > f0 + 0.25 * a * (grad @ d)):
+                a *= 0.5
+            prices = prices + a * d
+            steps += 1
+        if tau <= tol / N:
+            break
+        tau *= 0.1
+    labor = _soft_labor(cap, prices, tau)
+    return _finish(cap, shares, labor, shares / (labor * cap).sum(axis=0), steps)
+
+
+# ---------- Dornbusch–Fischer–Samuelson: a continuum of goods ----------
+#
+# Two countries, home and foreign, and goods z on [0, 1] discretized into
+# n_goods bins. A(z) = a*(z)/a(z) is home's relative productivity in good z,
+# decreasing in z. Home makes the goods where its relative wage ω = w/w* is
+# below A(z), i.e. z < z̄ with A(z̄) = ω. Balanced trade with Cobb–Douglas
+# shares b(z), θ(z) = ∫₀ᶻ b, requires ω = θ(z̄)/(1 − θ(z̄)) · L*/L.
+
+GOODS = 5000
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DFSParams(Params):
+    size: float = param(1.0, step=0.05)     # L*/L, foreign labor force relative to home
+    tech: float = param(1.0, step=0.05)     # uniform home productivity factor on A(z)
+    spread: float = param(2.0, step=0.1)    # log A(0) − log A(1) of the default schedule
+
+
+@dataclass
+class DFSEquilibrium:
+    omega: np.ndarray          # (S,) relative wage w/w*
+    z_bar: np.ndarray          # (S,) cutoff good = share of goods made at home
+    gains_home: np.ndarray     # (S,) log real-income gain over autarky
+    gains_foreign: np.ndarray  # (S,)
+
+
+def relative_productivity(spread, n_goods=GOODS):
+    """Default schedule A(z) = exp(spread·(½ − z)) at the bin midpoints; (n,) or (S, n) for array spread."""
+    z = (np.arange(n_goods) + 0.5) / n_goods
+    return np.exp(np.multiply.outer(np.asarray(spread, dtype=float), 0.5 - z))
+
+
+def demand_schedule(size, shares=None, n_goods=GOODS):
+    """B(z) = θ(z)/(1 − θ(z)) · L*/L at the bin midpoints (uniform shares by default)."""
+    theta = _theta(_good_shares(shares, n_goods))
+    return np.multiply.outer(np.asarray(size, dtype=float), theta / (1 - theta))
+
+
+def _good_shares(shares, n):
+    """Each good's expenditure share, normalized to sum to one (uniform by default)."""
+    if shares is None:
+        return np.full(n, 1.0 / n)
+    b = np.asarray(shares, dtype=float)
+    if b.shape != (n,) or np.any(b <= 0):
+        raise ValueError(f"need {n} positive expenditure shares")
+    return b / b.sum()
+
+
+def _theta(b):
+    """Cumulative expenditure share at the bin midpoints."""
+    return np.cumsum(b) - 0.5 * b
+
+
+@memoize(maxsize=256)
+def dfs_equilibrium(p: DFSParams, A=None, shares=None, n_goods=GOODS) -> DFSEquilibrium:
+    """
+    Relative wage, cutoff good and gains from trade for one scenario or a
+    batch: fields of p may be arrays and broadcast to S scenarios. A is the
+    relative productivity schedule over the goods: (n,) shared by all
+    scenarios, (S, n) per scenario, or None for relative_productivity(p.spread).
+    It must be decreasing; p.tech scales it.
+
+    The equilibrium solves h(z) = log A(z) − logit θ(z) = log(size/tech), with
+    h decreasing. For a shared schedule h is tabulated once and each scenario's
+    root is a binary search plus linear interpolation between the bracketing
+    goods, O((n + S) log n). Per-scenario schedules bracket the root by
+    counting sign changes row by row, O(S·n). No Python loop over scenarios or
+    goods either way.
+    """
+    size, tech, spread = (np.atleast_1d(np.asarray(getattr(p, f), dtype=float)) for f in ("size", "tech", "spread"))
+    logA = np.log(relative_productivity(spread, n_goods) if A is None else np.asarray(A, dtype=float))
+    n = logA.shape[-1]
+    if np.any(np.diff(logA, axis=-1) > 0):
+        raise ValueError("relative productivity A(z) must be decreasing in z")
+    b = _good_shares(shares, n)
+    theta = _theta(b)
+    c, tech = np.broadcast_arrays(np.log(size) - np.log(tech), tech)
+    if logA.ndim == 2 and logA.shape[0] == 1:
+        logA = logA[0]
+    S = max(c.size, logA.shape[0] if logA.ndim == 2 else 1)
+    c, tech = np.broadcast_to(c, (S,)), np.broadcast_to(tech, (S,))
+    h = logA - np.log(theta / (1 - theta))
+
+    # k = number of goods with h > c: the root lies between goods k−1 and k
+    if h.ndim == 1:
+        k = np.searchsorted(-h, -c, side="left")
+    else:
+        k = np.count_nonzero(np.broadcast_to(h, (S, n)) > c[:, None], axis=1)
+    lo, hi = np.clip(k - 1, 0, n - 1), np.clip(k, 0, n - 1)
+    H = np.broadcast_to(h, (S, n))
+    rows = np.arange(S)
+    h_lo, h_hi = H[rows, lo], H[rows, hi]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(h_lo > h_hi, (h_lo - c) / (h_lo - h_hi), 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    th = theta[lo] + t * (theta[hi] - theta[lo])
+    z_bar = (lo + t * (hi - lo) + 0.5) / n
+    log_omega = np.log(np.broadcast_to(size, (S,))) + np.log(th / (1 - th))
+
+    # Home's real wage in each imported good (z ≥ z̄) rises from 1/a to ω/a*,
+    # a log gain of log(ω/A); foreign gains log(A/ω) on the goods it buys from
+    # home. Weighted by the shares these are head and tail sums at good k.
+    cum_b = np.concatenate(([0.0], np.cumsum(b)))
+    cum_bA = np.concatenate((np.zeros(logA.shape[:-1] + (1,)), np.cumsum(b * logA, axis=-1)), axis=-1)
+    head_b = cum_b[k]
+    head_bA = cum_bA[k] if cum_bA.ndim == 1 else cum_bA[rows, k]
+    tail_b, tail_bA = cum_b[-1] - head_b, cum_bA[..., -1] - head_bA
+    x = log_omega - np.log(tech)                          # log(ω / tech)
+    gains_home = tail_b * x - tail_bA
+    gains_foreign = head_bA - head_b * x
+    return DFSEquilibrium(omega=np.exp(log_omega), z_bar=z_bar, gains_home=gains_home, gains_foreign=gains_foreign)
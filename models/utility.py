@@ -0,0 +1,166 @@
+# models/utility.py — consumer choice on the budget line M = px·x + py·y
+import numpy as np
+from dataclasses import dataclass
+
+from models.memo import memoize
+from models.params import Params, param
+
+KINDS = ("cobb_douglas", "ces", "substitutes", "leontief")
+GRID = 81     # contour grid points per axis
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Preferences(Params):
+    """
+    U = x^α·y^(1−α)                       cobb_douglas
+        (α·x^ρ + (1−α)·y^ρ)^(1/ρ)          ces, ρ < 1 and ρ ≠ 0 (σ = 1/(1−ρ))
+        α·x + (1−α)·y                      substitutes
+        min(x/α, y/(1−α))                  leontief (bundles in the ratio α : 1−α)
+    Every form is homogeneous of degree one: scaling a bundle scales utility.
+    """
+    kind: str = param("cobb_douglas")
+    alpha: float = param(0.5, step=0.05)   # weight on X
+    rho: float = param(0.5, step=0.05)     # CES substitution parameter
+
+
+@dataclass
+class Decomposition:
+    start: np.ndarray        # (x, y) chosen on the old budget line
+    hicks: np.ndarray        # new prices, income that keeps the old utility
+    slutsky: np.ndarray      # new prices, income that still buys the old bundle
+    end: np.ndarray          # chosen on the new budget line
+    M_hicks: float           # compensated incomes
+    M_slutsky: float
+
+    @property
+    def substitution(self):
+        """Hicksian substitution effect (end − start = substitution + income)."""
+        return self.hicks - self.start
+
+    @property
+    def income(self):
+        return self.end - self.hicks
+
+
+def _check(pref: Preferences):
+    if pref.kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}, not {pref.kind!r}")
+    if not 0 < pref.alpha < 1:
+        raise ValueError("alpha must lie strictly between 0 and 1")
+    if pref.kind == "ces" and (pref.rho >= 1 or pref.rho == 0):
+        raise ValueError("CES needs rho < 1 and rho != 0 (rho → 0 is Cobb–Douglas)")
+
+
+def utility(pref: Preferences, x, y):
+    """U(x, y), elementwise over arrays."""
+    _check(pref)
+    a = pref.alpha
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if pref.kind == "cobb_douglas":
+            return x ** a * y ** (1 - a)
+        if pref.kind == "ces":
+            r = pref.rho
+            return (a * x ** r + (1 - a) * y ** r) ** (1 / r)
+        if pref.kind == "substitutes":
+            return a * x + (1 - a) * y
+        return np.minimum(x / a, y / (1 - a))
+
+
+def demand(pref: Preferences, M, px, py):
+    """
+    Marshallian demand (x, y); M, px and py broadcast. Perfect substitutes buy
+    only the good with the higher marginal utility per dollar, and split the
+    budget evenly when the two are equal.
+    """
+    _check(pref)
+    a = pref.alpha
+    M, px, py = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (M, px, py)))
+    if pref.kind == "cobb_douglas":
+        return a * M / px, (1 - a) * M / py
+    if pref.kind == "ces":
+        s = 1 / (1 - pref.rho)
+        wx, wy = a ** s * px ** (1 - s), (1 - a) ** s * py ** (1 - s)
+        return M * wx / (px * (wx + wy)), M * wy / (py * (wx + wy))
+    if pref.kind == "substitutes":
+        bx, by = a / px, (1 - a) / py
+        share = np.where(bx > by, 1.0, np.where(bx < by, 0.0, 0.5))
+        return share * M / px, (1 - share) * M / py
+    t = M / (a * px + (1 - a) * py)
+    return a * t, (1 - a) * t
+
+
+def indirect_utility(pref: Preferences, M, px, py):
+    return utility(pref, *demand(pref, M, px, py))
+
+
+def expenditure(pref: Preferences, u, px, py):
+    """Cheapest income that reaches utility u; by homogeneity e(u, p) = u / v(1, p)."""
+    return np.asarray(u, dtype=float) / indirect_utility(pref, 1.0, px, py)
+
+
+def hicksian(pref: Preferences, u, px, py):
+    """Compensated demand: with homothetic tastes, Marshallian demand at e(u, p)."""
+    return demand(pref, expenditure(pref, u, px, py), px, py)
+
+
+def decompose(pref: Preferences, old, new):
+    """
+    Income and substitution effects of moving from the `old` to the `new`
+    budget, each a mapping with M, px and py (what budget_line.apply_shift
+    returns). Both compensations are reported: Hicks holds utility fixed,
+    Slutsky holds the old bundle affordable.
+    """
+    start = np.array(demand(pref, old["M"], old["px"], old["py"]), dtype=float)
+    end = np.array(demand(pref, new["M"], new["px"], new["py"]), dtype=float)
+    u = utility(pref, *start)
+    M_hicks = float(expenditure(pref, u, new["px"], new["py"]))
+    M_slutsky = float(new["px"] * start[0] + new["py"] * start[1])
+    return Decomposition(
+        start=start,
+        hicks=np.array(hicksian(pref, u, new["px"], new["py"]), dtype=float),
+        slutsky=np.array(demand(pref, M_slutsky, new["px"], new["py"]), dtype=float),
+        end=end, M_hicks=M_hicks, M_slutsky=M_slutsky,
+    )
+
+
+def indifference_curve(pref: Preferences, u, x_max, n=200):
+    """
+    Points (x, y) of the indifference curve U = u for 0 < x ≤ x_max; y is NaN
+    where the curve has left the quadrant. Leontief curves are the two arms
+    of the L through the kink.
+    """
+    _check(pref)
+    a = pref.alpha
+    if pref.kind == "leontief":
+        kink = np.array([a * u, (1 - a) * u])
+        far = max(x_max, kink[0]) * 4
+        return np.array([kink[0], kink[0], far]), np.array([far, kink[1], kink[1]])
+    x = x_max * np.linspace(0, 1, n + 1)[1:] ** 2      # denser near the Y axis, where curves are steep
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if pref.kind == "cobb_douglas":
+            y = (u / x ** a) ** (1 / (1 - a))
+        elif pref.kind == "ces":
+            r = pref.rho
+            y = ((u ** r - a * x ** r) / (1 - a)) ** (1 / r)
+        else:
+            y = (u - a * x) / (1 - a)
+    return x, np.where(np.isfinite(y) & (y >= 0), y, np.nan)
+
+
+@dataclass
+class IndifferenceMap:
+    grid: np.ndarray    # (n,) points on [0, 1], both axes
+    U: np.ndarray       # (n, n) utility, U[i, j] = U(grid[j], grid[i])
+
+
+@memoize(maxsize=64)
+def indifference_map(pref: Preferences, n: int = GRID) -> IndifferenceMap:
+    """
+    Utility on the unit square, one per preference spec. Because U is
+    homogeneous of degree one, U(s·x, s·y) = s·U(x, y): the same grid serves
+    any view [0, s]² with the axes scaled by s and contour levels divided by
+    s, so neither the budget line nor the axis range recomputes it.
+    """
+    g = np.linspace(0.0, 1.0, n)
+    return IndifferenceMap(grid=g, U=utility(pref, g[None, :], g[:, None]))